@@ -0,0 +1,67 @@
+"""
+Labelled Benchmark Queries
+
+A small hand-labelled set for measuring routing components offline.
+Run it to see how the out-of-scope pre-filter performs (no API calls):
+    uv run python benchmark.py
+
+Add real queries from your logs here - that's the set that matters.
+"""
+
+from intent_classifier import Intent
+from prefilter import OutOfScopeFilter
+
+LABELLED_QUERIES = [
+    # CONCEPTUAL
+    ("What is a JWT?", Intent.CONCEPTUAL),
+    ("Explain OAuth", Intent.CONCEPTUAL),
+    ("Why do we use microservices?", Intent.CONCEPTUAL),
+    ("How does token refresh work in OAuth?", Intent.CONCEPTUAL),
+    ("What are the benefits of stateless authentication?", Intent.CONCEPTUAL),
+    # PROCEDURAL
+    ("How do I reset my API key?", Intent.PROCEDURAL),
+    ("How do I deploy to production?", Intent.PROCEDURAL),
+    ("Show me how to configure logging", Intent.PROCEDURAL),
+    ("Steps to roll back a deployment", Intent.PROCEDURAL),
+    ("How do I call the weather API from the CLI?", Intent.PROCEDURAL),
+    # FACTUAL
+    ("What was our Q3 revenue?", Intent.FACTUAL),
+    ("How many users signed up last month?", Intent.FACTUAL),
+    ("What's the current API rate limit?", Intent.FACTUAL),
+    ("What is the total user count?", Intent.FACTUAL),
+    # COMPARATIVE
+    ("Should I use Postgres or MongoDB?", Intent.COMPARATIVE),
+    ("What's the difference between REST and GraphQL?", Intent.COMPARATIVE),
+    ("REST vs GraphQL for a mobile app?", Intent.COMPARATIVE),
+    ("Is MongoDB better than Postgres for prototyping?", Intent.COMPARATIVE),
+    # OUT_OF_SCOPE
+    ("What's the weather like today?", Intent.OUT_OF_SCOPE),
+    ("Will it rain tomorrow?", Intent.OUT_OF_SCOPE),
+    ("Tell me a joke", Intent.OUT_OF_SCOPE),
+    ("Who should I vote for in the election?", Intent.OUT_OF_SCOPE),
+    ("Give me a recipe for lasagna", Intent.OUT_OF_SCOPE),
+    ("Who won the NBA finals?", Intent.OUT_OF_SCOPE),
+    ("What's my horoscope for this week?", Intent.OUT_OF_SCOPE),
+    ("Recommend a good movie", Intent.OUT_OF_SCOPE),
+    ("Write me a poem about the sea", Intent.OUT_OF_SCOPE),
+    ("Find me a cheap flight to Paris", Intent.OUT_OF_SCOPE),
+    ("What's the meaning of life?", Intent.OUT_OF_SCOPE),
+    ("Can you help with my dating profile?", Intent.OUT_OF_SCOPE),
+]
+
+
+def main():
+    prefilter = OutOfScopeFilter()
+    report = prefilter.evaluate(LABELLED_QUERIES)
+
+    print("Out-of-scope pre-filter")
+    print(f"  Precision: {report['precision']:.2f}")
+    print(f"  Recall:    {report['recall']:.2f}")
+    print(f"  TP={report['true_positives']} FP={report['false_positives']} "
+          f"FN={report['false_negatives']} TN={report['true_negatives']}")
+    for query in report["false_positive_queries"]:
+        print(f"  False positive: {query}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Result Fusion - Combining results from different retrieval strategies
+
+Sometimes one strategy isn't enough. "How does OAuth token refresh work?"
+is part concept, part procedure. Running semantic AND hybrid search and
+fusing the lists beats picking one.
+
+The catch: scores from different strategies aren't comparable. A cosine
+similarity of 0.8 and a BM25 score of 12.3 mean nothing side by side.
+Two standard fixes:
+
+1. Reciprocal Rank Fusion (RRF) - ignore scores, use only rank positions
+2. Weighted score fusion - normalize each list to [0, 1], then weight
+
+Both run in linear time over the input lists, with a heap for the top-k.
+
+An optional rerank() stage re-scores the fused list with a stronger (slower)
+model - a cross-encoder, an LLM judge - under a hard latency budget.
+"""
+
+import heapq
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+from retrieval import RetrievalResult
+
+# Scores a batch of chunks against the query, higher = more relevant
+Scorer = Callable[[str, list[str]], list[float]]
+
+
+def _fused_result(
+    fused: dict[str, float],
+    texts: dict[str, str],
+    top_n: int | None,
+    strategy: str,
+    results: list[RetrievalResult],
+) -> RetrievalResult:
+    """Pick the top_n ids by fused score and build a RetrievalResult."""
+    if top_n is None:
+        top_n = len(fused)
+
+    # heapq.nlargest is O(n log k) - no need to sort everything for a top-5
+    top = heapq.nlargest(top_n, fused.items(), key=lambda kv: kv[1])
+
+    return RetrievalResult(
+        chunks=[texts[chunk_id] for chunk_id, _ in top],
+        strategy_used=strategy,
+        metadata={
+            "fused_from": [r.strategy_used for r in results],
+            "candidates": len(fused),
+        },
+        chunk_ids=[chunk_id for chunk_id, _ in top],
+        scores=[score for _, score in top],
+    )
+
+
+def reciprocal_rank_fusion(
+    results: list[RetrievalResult],
+    k: int = 60,
+    top_n: int | None = None,
+) -> RetrievalResult:
+    """
+    Merge ranked lists with Reciprocal Rank Fusion.
+
+    Each chunk scores sum(1 / (k + rank)) over every list it appears in.
+    Chunks that rank well in several strategies rise to the top, and the
+    raw scores never need to be comparable.
+
+    Args:
+        results: Results from any mix of strategies
+        k: Damping constant - 60 is the value from the original RRF paper
+        top_n: How many chunks to keep (None = all)
+    """
+    fused: dict[str, float] = {}
+    texts: dict[str, str] = {}
+
+    for result in results:
+        for rank, (chunk_id, chunk, _) in enumerate(result.items(), start=1):
+            fused[chunk_id] = fused.get(chunk_id, 0.0) + 1.0 / (k + rank)
+            texts.setdefault(chunk_id, chunk)
+
+    return _fused_result(fused, texts, top_n, "reciprocal_rank_fusion", results)
+
+
+def weighted_score_fusion(
+    results: list[RetrievalResult],
+    weights: list[float] | None = None,
+    top_n: int | None = None,
+) -> RetrievalResult:
+    """
+    Merge lists by min-max normalizing each one's scores, then weighting.
+
+    Use this over RRF when the scores carry real signal (a clear winner
+    should stay a clear winner) and you want to trust some strategies more.
+
+    Args:
+        results: Results from any mix of strategies
+        weights: One weight per result (default: equal)
+        top_n: How many chunks to keep (None = all)
+    """
+    if weights is None:
+        weights = [1.0] * len(results)
+    if len(weights) != len(results):
+        raise ValueError("weights must have one entry per result")
+
+    fused: dict[str, float] = {}
+    texts: dict[str, str] = {}
+
+    for result, weight in zip(results, weights):
+        items = result.items()
+        if not items:
+            continue
+
+        low = min(score for _, _, score in items)
+        high = max(score for _, _, score in items)
+        spread = high - low
+
+        for chunk_id, chunk, score in items:
+            # A list where everything ties (e.g. exact lookups) counts as all-relevant
+            normalized = (score - low) / spread if spread > 0 else 1.0
+            fused[chunk_id] = fused.get(chunk_id, 0.0) + weight * normalized
+            texts.setdefault(chunk_id, chunk)
+
+    return _fused_result(fused, texts, top_n, "weighted_score_fusion", results)
+
+
+def rerank(
+    query: str,
+    result: RetrievalResult,
+    scorer: Scorer,
+    budget_ms: float = 200.0,
+    top_n: int | None = None,
+) -> RetrievalResult:
+    """
+    Re-score a (fused) result with a pluggable scorer, under a hard time budget.
+
+    Rerankers are the slowest part of a retrieval pipeline. If the scorer
+    doesn't finish within budget_ms (or raises, or returns the wrong number
+    of scores), we stop waiting and return the input order unchanged - a
+    slightly worse ranking beats a late answer.
+
+    Args:
+        query: The user's question
+        result: Result to rerank (usually from one of the fusion functions)
+        scorer: Batch scorer - (query, chunks) -> one score per chunk
+        budget_ms: Hard latency budget for the scorer
+        top_n: How many chunks to keep (None = all)
+    """
+    items = result.items()
+    pool = ThreadPoolExecutor(max_workers=1)
+    future = pool.submit(scorer, query, [chunk for _, chunk, _ in items])
+
+    status = "ok"
+    try:
+        scores = list(future.result(timeout=budget_ms / 1000))
+    except TimeoutError:
+        scores, status = None, "timeout"
+    except Exception:
+        # A broken reranker degrades ranking quality, not availability
+        scores, status = None, "error"
+    finally:
+        # Don't block on a scorer that blew its budget - let it finish in the background
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    if scores is not None and len(scores) != len(items):
+        # zip would silently drop chunks (or scores): treat it as a broken scorer
+        scores, status = None, "error"
+
+    if scores is None:
+        reranked = items
+    else:
+        rescored = [(chunk_id, chunk, score) for (chunk_id, chunk, _), score in zip(items, scores)]
+        reranked = sorted(rescored, key=lambda item: item[2], reverse=True)
+
+    reranked = reranked[:top_n] if top_n is not None else reranked
+
+    return RetrievalResult(
+        chunks=[chunk for _, chunk, _ in reranked],
+        strategy_used=result.strategy_used,
+        metadata={**result.metadata, "rerank": status, "rerank_budget_ms": budget_ms},
+        chunk_ids=[chunk_id for chunk_id, _, _ in reranked],
+        scores=[score for _, _, score in reranked],
+    )
@@ -5,6 +5,7 @@ This module demonstrates how to classify user queries by intent
 before routing them to the appropriate retrieval strategy.
 """
 
+import json
 from enum import Enum
 from pydantic import BaseModel
 from openai import OpenAI
@@ -28,6 +29,13 @@ class ClassificationResult(BaseModel):
     reasoning: str
 
 
+class IntentSpan(BaseModel):
+    """One part of a mixed-intent query, with its own intent."""
+
+    intent: Intent
+    text: str  # The sub-question, phrased so it stands on its own
+
+
 # The classification prompt - this is the core of intent identification
 CLASSIFICATION_PROMPT = """You are a query classifier for a software documentation system.
 
@@ -56,6 +64,37 @@ Respond with a JSON object containing:
 User query: {query}"""
 
 
+# Multi-intent variant - splits mixed questions into standalone sub-questions
+MULTI_INTENT_PROMPT = """You are a query classifier for a software documentation system.
+
+Some user queries mix several questions, e.g. "What is OAuth and how do I reset my API key?".
+Split the query into its separate questions and classify each one into exactly ONE category:
+
+CONCEPTUAL - what something is, why it exists, how it works at a high level
+PROCEDURAL - how to do something specific, step-by-step instructions
+FACTUAL - specific data, numbers, or lookups from structured data
+COMPARATIVE - comparing two or more options or asking for recommendations
+OUT_OF_SCOPE - unrelated to our software/documentation, or inappropriate
+
+Rewrite each part so it stands on its own (resolve "it", "that", etc.).
+If the query only asks one thing, return a single part.
+
+Respond with a JSON object:
+{{"intents": [{{"intent": "conceptual", "text": "What is OAuth?"}}, ...]}}
+
+User query: {query}"""
+
+
+def _parse_json_response(content: str) -> dict:
+    """Parse a JSON object from an LLM response, tolerating markdown code fences."""
+    if "```json" in content:
+        content = content.split("```json")[1].split("```")[0]
+    elif "```" in content:
+        content = content.split("```")[1].split("```")[0]
+
+    return json.loads(content.strip())
+
+
 def classify_intent(query: str, client: OpenAI | None = None) -> ClassificationResult:
     """
     Classify a user query into one of the predefined intents.
@@ -78,17 +117,8 @@ def classify_intent(query: str, client: OpenAI | None = None) -> ClassificationR
         input=CLASSIFICATION_PROMPT.format(query=query),
     )
 
-    # Parse the response
-    import json
-    content = response.output_text
-
-    # Handle potential JSON in markdown code blocks
-    if "```json" in content:
-        content = content.split("```json")[1].split("```")[0]
-    elif "```" in content:
-        content = content.split("```")[1].split("```")[0]
-
-    data = json.loads(content.strip())
+    # Parse the response (handles JSON wrapped in markdown code blocks)
+    data = _parse_json_response(response.output_text)
 
     return ClassificationResult(
         intent=Intent(data["intent"]),
@@ -127,3 +157,34 @@ Query: {query}"""
 
     intent_str = response.output_text.strip().lower()
     return Intent(intent_str)
+
+
+def classify_intents(query: str, client: OpenAI | None = None) -> list[IntentSpan]:
+    """
+    Split a query into sub-questions and classify each one.
+
+    "What is OAuth and how do I reset my API key?" becomes:
+        [IntentSpan(CONCEPTUAL, "What is OAuth?"),
+         IntentSpan(PROCEDURAL, "How do I reset my API key?")]
+
+    Still one LLM call. Single-intent queries come back as a one-item list.
+    """
+    if client is None:
+        client = OpenAI()
+
+    response = client.responses.create(
+        model="gpt-4o-mini",
+        input=MULTI_INTENT_PROMPT.format(query=query),
+    )
+
+    data = _parse_json_response(response.output_text)
+    spans = [
+        IntentSpan(intent=Intent(part["intent"].lower()), text=part["text"])
+        for part in data.get("intents", [])
+    ]
+
+    # Never return nothing - treat an empty split as the whole query
+    if not spans:
+        spans = [IntentSpan(intent=classify_intent_simple(query, client), text=query)]
+
+    return spans
@@ -0,0 +1,202 @@
+"""
+Out-of-Scope Pre-Filter
+
+early_exit is the cheapest strategy, but we only reach it AFTER paying for
+an LLM classification. If a big share of traffic is "What's the weather?",
+that's a lot of LLM calls just to say no.
+
+This pre-filter runs before classification, locally, with no network call:
+
+1. Keyword denylist - off-topic words ("weather", "joke", "vote"...) stored
+   in a Bloom filter, so membership checks are constant time and the
+   filter stays a few KB no matter how long the list grows
+2. Centroid check - embed the query and compare it to the centroid of our
+   in-scope documentation. "How do I configure the weather API?" hits the
+   denylist but is close to our docs, so it still goes to the LLM
+
+A query is only short-circuited when BOTH say it's off-topic. Anything
+ambiguous goes through normal classification - a false positive here means
+refusing a real user question, which is much worse than one extra LLM call.
+"""
+
+import hashlib
+import math
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from intent_classifier import Intent
+from retrieval import COMPARATIVE_DOCS, CONCEPTUAL_DOCS, FACTUAL_DATA, PROCEDURAL_DOCS
+
+# Topics our documentation system never covers
+DEFAULT_DENYLIST = [
+    "weather", "forecast", "temperature", "rain",
+    "joke", "jokes", "funny", "riddle", "poem",
+    "vote", "election", "president", "politics", "politician",
+    "recipe", "cook", "cooking", "restaurant", "dinner",
+    "movie", "movies", "song", "lyrics", "celebrity",
+    "football", "soccer", "basketball", "nba", "nfl",
+    "horoscope", "zodiac", "lottery", "dating", "girlfriend", "boyfriend",
+    "vacation", "flight", "hotel", "bitcoin",
+]
+
+# Words too common to say anything about topic
+STOPWORDS = {
+    "a", "an", "the", "is", "are", "was", "were", "be", "to", "of", "and", "or",
+    "in", "on", "for", "with", "at", "by", "from", "it", "this", "that", "i",
+    "me", "my", "you", "your", "we", "our", "do", "does", "did", "what", "whats",
+    "how", "why", "who", "which", "should", "can", "could", "would", "tell",
+    "like", "today", "s",
+}
+
+EMBEDDING_DIM = 512
+
+
+def _tokens(text: str) -> list[str]:
+    """Lowercase word tokens without stopwords."""
+    return [t for t in re.findall(r"[a-z0-9]+", text.lower()) if t not in STOPWORDS]
+
+
+def embed(text: str, dim: int = EMBEDDING_DIM) -> list[float]:
+    """
+    Cheap local embedding: hashed bag-of-words, L2-normalized.
+
+    In production, swap in a small local embedding model (e.g. a
+    sentence-transformers MiniLM) - anything that doesn't need a network call.
+    """
+    vector = [0.0] * dim
+    for token in _tokens(text):
+        digest = hashlib.blake2b(token.encode(), digest_size=8).digest()
+        vector[int.from_bytes(digest, "little") % dim] += 1.0
+
+    norm = math.sqrt(sum(v * v for v in vector))
+    return [v / norm for v in vector] if norm else vector
+
+
+class BloomFilter:
+    """
+    Fixed-size set membership with no false negatives.
+
+    False positives are possible (tuned by size_bits and num_hashes), which
+    is fine here - the centroid check catches the rare wrong hit.
+    """
+
+    def __init__(self, size_bits: int = 8192, num_hashes: int = 4):
+        self.size_bits = size_bits
+        self.num_hashes = num_hashes
+        self.bits = bytearray((size_bits + 7) // 8)
+
+    def _positions(self, item: str) -> list[int]:
+        # Double hashing: k positions from one 128-bit digest
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size_bits for i in range(self.num_hashes)]
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self.bits[pos // 8] |= 1 << (pos % 8)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[pos // 8] & (1 << (pos % 8)) for pos in self._positions(item))
+
+
+def _in_scope_documents() -> list[str]:
+    """Every piece of in-scope content from our (mock) data sources."""
+    docs = list(CONCEPTUAL_DOCS.values()) + list(PROCEDURAL_DOCS.values())
+    docs += [f"{key.replace('_', ' ')} {value}" for key, value in FACTUAL_DATA.items()]
+    docs += [f"{key.replace('_', ' ')} {value}" for key, value in COMPARATIVE_DOCS.items()]
+    return docs
+
+
+@dataclass
+class PrefilterDecision:
+    """Why the pre-filter did or didn't short-circuit a query."""
+
+    out_of_scope: bool
+    denylist_hits: list[str]
+    similarity: float  # Cosine similarity to the in-scope centroid
+
+
+class OutOfScopeFilter:
+    """
+    Pre-classification gate for clearly off-topic queries.
+
+    Usage:
+        prefilter = OutOfScopeFilter()
+        route_query("What's the weather?", prefilter=prefilter)  # No LLM call
+    """
+
+    def __init__(
+        self,
+        denylist: Iterable[str] = DEFAULT_DENYLIST,
+        documents: Iterable[str] | None = None,
+        max_similarity: float = 0.1,
+    ):
+        """
+        Args:
+            denylist: Off-topic keywords
+            documents: In-scope documentation to build the centroid from
+                (defaults to the mock retrieval data)
+            max_similarity: Denylisted queries at least this close to the
+                docs centroid are NOT filtered
+        """
+        self.max_similarity = max_similarity
+
+        self.denylist = BloomFilter()
+        for word in denylist:
+            self.denylist.add(word.lower())
+
+        vectors = [embed(doc) for doc in (documents or _in_scope_documents())]
+        centroid = [sum(column) / len(vectors) for column in zip(*vectors)]
+        norm = math.sqrt(sum(v * v for v in centroid))
+        self.centroid = [v / norm for v in centroid] if norm else centroid
+
+    def check(self, query: str) -> PrefilterDecision:
+        """Score a query without deciding anything irreversible."""
+        hits = [token for token in _tokens(query) if token in self.denylist]
+        similarity = sum(q * c for q, c in zip(embed(query), self.centroid))
+
+        return PrefilterDecision(
+            out_of_scope=bool(hits) and similarity < self.max_similarity,
+            denylist_hits=hits,
+            similarity=round(similarity, 4),
+        )
+
+    def is_out_of_scope(self, query: str) -> bool:
+        """True only for queries that are clearly off-topic."""
+        return self.check(query).out_of_scope
+
+    def evaluate(self, labelled: Iterable[tuple[str, Intent]]) -> dict:
+        """
+        Precision/recall of the filter against labelled queries.
+
+        Precision matters most: every false positive is a real question
+        we refused to answer. Recall is the share of off-topic traffic that
+        skips the LLM call.
+        """
+        tp = fp = fn = tn = 0
+        false_positives = []
+
+        for query, intent in labelled:
+            predicted = self.is_out_of_scope(query)
+            actual = intent == Intent.OUT_OF_SCOPE
+            if predicted and actual:
+                tp += 1
+            elif predicted:
+                fp += 1
+                false_positives.append(query)
+            elif actual:
+                fn += 1
+            else:
+                tn += 1
+
+        return {
+            "precision": tp / (tp + fp) if tp + fp else 1.0,
+            "recall": tp / (tp + fn) if tp + fn else 0.0,
+            "true_positives": tp,
+            "false_positives": fp,
+            "false_negatives": fn,
+            "true_negatives": tn,
+            "false_positive_queries": false_positives,
+        }
@@ -10,16 +10,36 @@ In a real system, these would connect to:
 - Hybrid search systems (Elasticsearch, OpenSearch)
 """
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 
 
 @dataclass
 class RetrievalResult:
-    """The result of a retrieval operation."""
+    """
+    The result of a retrieval operation.
+
+    chunks, chunk_ids and scores are parallel lists, best chunk first.
+    Ids let results from different strategies be deduplicated and fused
+    (see fusion.py). Scores are only comparable within one strategy.
+    """
 
     chunks: list[str]
     strategy_used: str
     metadata: dict
+    chunk_ids: list[str] = field(default_factory=list)
+    scores: list[float] = field(default_factory=list)
+
+    def items(self) -> list[tuple[str, str, float]]:
+        """(id, chunk, score) triples, filling in ids/scores if a result has none."""
+        return [
+            (
+                self.chunk_ids[i] if i < len(self.chunk_ids) else f"{self.strategy_used}:{i}",
+                chunk,
+                self.scores[i] if i < len(self.scores) else 0.0,
+            )
+            for i, chunk in enumerate(self.chunks)
+        ]
 
 
 # =============================================================================
@@ -149,6 +169,19 @@ COMPARATIVE_DOCS = {
 # Retrieval Functions - Different strategies for different intents
 # =============================================================================
 
+def _term_overlap(query: str, text: str) -> float:
+    """
+    Mock relevance score: fraction of query terms that appear in the text.
+
+    Stands in for cosine similarity (semantic) or BM25 (keyword) scores.
+    """
+    query_terms = set(re.findall(r"\w+", query.lower()))
+    if not query_terms:
+        return 0.0
+    text_terms = set(re.findall(r"\w+", text.lower()))
+    return len(query_terms & text_terms) / len(query_terms)
+
+
 def semantic_search(query: str, top_k: int = 3) -> RetrievalResult:
     """
     Semantic/Vector search - best for CONCEPTUAL queries.
@@ -161,21 +194,29 @@ def semantic_search(query: str, top_k: int = 3) -> RetrievalResult:
     Good for: "What is X?", "Explain Y", "Why do we use Z?"
     """
     # Mock: Find conceptual docs that might match
-    chunks = []
+    matches = []
     query_lower = query.lower()
 
     for topic, content in CONCEPTUAL_DOCS.items():
         if topic in query_lower or any(word in query_lower for word in topic.split("_")):
-            chunks.append(content.strip())
+            content = content.strip()
+            matches.append((f"conceptual:{topic}", content, _term_overlap(query, content)))
 
     # Fallback if no direct match
-    if not chunks:
-        chunks = [list(CONCEPTUAL_DOCS.values())[0]]
+    if not matches:
+        topic, content = next(iter(CONCEPTUAL_DOCS.items()))
+        matches = [(f"conceptual:{topic}", content.strip(), 0.0)]
+
+    # Rank by similarity, like a vector DB would
+    matches.sort(key=lambda m: m[2], reverse=True)
+    matches = matches[:top_k]
 
     return RetrievalResult(
-        chunks=chunks[:top_k],
+        chunks=[content for _, content, _ in matches],
         strategy_used="semantic_search",
-        metadata={"embedding_model": "text-embedding-3-small", "top_k": top_k}
+        metadata={"embedding_model": "text-embedding-3-small", "top_k": top_k},
+        chunk_ids=[chunk_id for chunk_id, _, _ in matches],
+        scores=[score for _, _, score in matches],
     )
 
 
@@ -191,24 +232,34 @@ def hybrid_search(query: str, alpha: float = 0.5) -> RetrievalResult:
     Good for: "How do I X?", technical terms, CLI commands
     Alpha controls balance: 0 = all keywords, 1 = all semantic
     """
-    chunks = []
+    matches = []
     query_lower = query.lower()
 
     # Keyword matching for procedural docs
     for topic, content in PROCEDURAL_DOCS.items():
         # Check for keyword matches (important for technical queries)
         topic_words = topic.replace("_", " ").split()
-        if any(word in query_lower for word in topic_words):
-            chunks.append(content.strip())
+        keyword_hits = sum(word in query_lower for word in topic_words)
+        if keyword_hits:
+            content = content.strip()
+            keyword_score = keyword_hits / len(topic_words)
+            semantic_score = _term_overlap(query, content)
+            score = alpha * semantic_score + (1 - alpha) * keyword_score
+            matches.append((f"procedural:{topic}", content, score))
 
     # Fallback
-    if not chunks:
-        chunks = [list(PROCEDURAL_DOCS.values())[0]]
+    if not matches:
+        topic, content = next(iter(PROCEDURAL_DOCS.items()))
+        matches = [(f"procedural:{topic}", content.strip(), 0.0)]
+
+    matches.sort(key=lambda m: m[2], reverse=True)
 
     return RetrievalResult(
-        chunks=chunks,
+        chunks=[content for _, content, _ in matches],
         strategy_used="hybrid_search",
-        metadata={"alpha": alpha, "keyword_weight": 1 - alpha, "semantic_weight": alpha}
+        metadata={"alpha": alpha, "keyword_weight": 1 - alpha, "semantic_weight": alpha},
+        chunk_ids=[chunk_id for chunk_id, _, _ in matches],
+        scores=[score for _, _, score in matches],
     )
 
 
@@ -227,26 +278,31 @@ def structured_query(query: str) -> RetrievalResult:
     query_lower = query.lower()
 
     # Simple keyword matching to find relevant data
-    result_data = None
+    data_key = None
 
     if "revenue" in query_lower or "q3" in query_lower or "q4" in query_lower:
-        result_data = FACTUAL_DATA["q3_revenue"]
+        data_key = "q3_revenue"
     elif "signup" in query_lower or "user" in query_lower and "month" in query_lower:
-        result_data = FACTUAL_DATA["monthly_signups"]
+        data_key = "monthly_signups"
     elif "rate limit" in query_lower or "limit" in query_lower:
-        result_data = FACTUAL_DATA["api_rate_limit"]
+        data_key = "api_rate_limit"
     elif "user" in query_lower and "count" in query_lower:
-        result_data = FACTUAL_DATA["user_count"]
+        data_key = "user_count"
 
-    if result_data:
-        chunks = [f"Data retrieved: {result_data}"]
+    # A database hit is exact - it either matches (1.0) or it doesn't (0.0)
+    if data_key:
+        chunks = [f"Data retrieved: {FACTUAL_DATA[data_key]}"]
+        chunk_ids, scores = [f"factual:{data_key}"], [1.0]
     else:
         chunks = ["No matching data found in structured sources."]
+        chunk_ids, scores = ["factual:none"], [0.0]
 
     return RetrievalResult(
         chunks=chunks,
         strategy_used="structured_query",
-        metadata={"source": "database", "query_type": "direct_lookup"}
+        metadata={"source": "database", "query_type": "direct_lookup"},
+        chunk_ids=chunk_ids,
+        scores=scores,
     )
 
 
@@ -263,6 +319,7 @@ def multi_source_retrieval(query: str) -> RetrievalResult:
     """
     query_lower = query.lower()
     chunks = []
+    chunk_ids = []
 
     # Find comparison data
     for comparison_key, data in COMPARATIVE_DOCS.items():
@@ -272,17 +329,25 @@ def multi_source_retrieval(query: str) -> RetrievalResult:
             for item in items:
                 if item in data:
                     chunks.append(f"{item.upper()}: {data[item]}")
+                    chunk_ids.append(f"comparative:{comparison_key}:{item}")
             if "recommendation" in data:
                 chunks.append(f"RECOMMENDATION: {data['recommendation']}")
+                chunk_ids.append(f"comparative:{comparison_key}:recommendation")
             break
 
+    # Every side of the comparison is equally needed for synthesis
+    scores = [1.0] * len(chunks)
+
     if not chunks:
         chunks = ["No comparison data found for the specified items."]
+        chunk_ids, scores = ["comparative:none"], [0.0]
 
     return RetrievalResult(
         chunks=chunks,
         strategy_used="multi_source_retrieval",
-        metadata={"sources_queried": 2, "synthesis_required": True}
+        metadata={"sources_queried": 2, "synthesis_required": True},
+        chunk_ids=chunk_ids,
+        scores=scores,
     )
 
 
@@ -297,5 +362,69 @@ def early_exit(query: str) -> RetrievalResult:
         chunks=["I can only answer questions about our software and documentation. "
                 "For other topics, please consult appropriate resources."],
         strategy_used="early_exit",
-        metadata={"reason": "out_of_scope", "search_performed": False}
+        metadata={"reason": "out_of_scope", "search_performed": False},
+        chunk_ids=["early_exit"],
+        scores=[0.0],
+    )
+
+
+def apply_chunk_budget(result: RetrievalResult, chunk_budget: int | None) -> RetrievalResult:
+    """
+    Trim a result so the combined chunks fit within a character budget.
+
+    Chunks are kept whole and in rank order. The first chunk is always kept,
+    even if it alone is over budget - an empty context is never the answer.
+    A budget of None keeps everything.
+    """
+    if chunk_budget is None:
+        return result
+
+    kept = []
+    used = 0
+    for item in result.items():
+        chunk = item[1]
+        if kept and used + len(chunk) > chunk_budget:
+            break
+        kept.append(item)
+        used += len(chunk)
+
+    return RetrievalResult(
+        chunks=[chunk for _, chunk, _ in kept],
+        strategy_used=result.strategy_used,
+        metadata={
+            **result.metadata,
+            "chunk_budget": chunk_budget,
+            "chunks_dropped": len(result.chunks) - len(kept),
+        },
+        chunk_ids=[chunk_id for chunk_id, _, _ in kept],
+        scores=[score for _, _, score in kept],
+    )
+
+
+def merge_results(
+    results: list[RetrievalResult], chunk_budget: int | None
+) -> RetrievalResult:
+    """
+    Merge results from several sub-queries into one, under a single budget.
+
+    Chunks are interleaved round-robin (each sub-query's best chunk first),
+    so one verbose strategy can't crowd the others out of the context.
+    Duplicate chunks (same id) are dropped.
+    """
+    merged = []
+    seen = set()
+    all_items = [r.items() for r in results]
+    for rank in range(max((len(items) for items in all_items), default=0)):
+        for items in all_items:
+            if rank < len(items) and items[rank][0] not in seen:
+                seen.add(items[rank][0])
+                merged.append(items[rank])
+
+    combined = RetrievalResult(
+        chunks=[chunk for _, chunk, _ in merged],
+        strategy_used="+".join(r.strategy_used for r in results),
+        metadata={"sub_results": [r.metadata for r in results]},
+        chunk_ids=[chunk_id for chunk_id, _, _ in merged],
+        scores=[score for _, _, score in merged],
     )
+    return apply_chunk_budget(combined, chunk_budget)
@@ -9,10 +9,18 @@ This is the orchestration layer that:
 This is the core pattern that separates demo RAG from production RAG.
 """
 
-from dataclasses import dataclass
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from openai import OpenAI
 
-from intent_classifier import Intent, classify_intent, classify_intent_simple
+from intent_classifier import (
+    Intent,
+    IntentSpan,
+    classify_intent,
+    classify_intent_simple,
+    classify_intents,
+)
 from retrieval import (
     RetrievalResult,
     semantic_search,
@@ -20,7 +28,12 @@ from retrieval import (
     structured_query,
     multi_source_retrieval,
     early_exit,
+    apply_chunk_budget,
+    merge_results,
 )
+from prefilter import OutOfScopeFilter
+from session import Session
+from tuning import DEFAULT_PARAMS, ParamTuner, RetrievalParams
 
 
 @dataclass
@@ -31,12 +44,20 @@ class RoutedResponse:
     intent: Intent
     retrieval_result: RetrievalResult
     answer: str | None = None  # Optional: LLM-generated answer
+    params: RetrievalParams | None = None  # Retrieval params that were used
+    latency_ms: float = 0.0  # Retrieval latency, for tuner feedback
+    sub_intents: list[IntentSpan] = field(default_factory=list)  # Multi-intent parts
+    sub_params: list[RetrievalParams] = field(default_factory=list)  # Params per part
 
 
 def route_query(
     query: str,
     client: OpenAI | None = None,
-    generate_answer: bool = False
+    generate_answer: bool = False,
+    tuner: ParamTuner | None = None,
+    multi_intent: bool = False,
+    prefilter: OutOfScopeFilter | None = None,
+    session: Session | None = None,
 ) -> RoutedResponse:
     """
     The main routing function.
@@ -49,15 +70,56 @@ def route_query(
         query: The user's question
         client: OpenAI client for classification (and answer generation)
         generate_answer: Whether to generate an LLM answer from retrieved context
+        tuner: Optional ParamTuner that picks retrieval params per intent.
+            Report relevance back with tuner.record_feedback(...) to let it learn.
+        multi_intent: Split mixed questions into sub-queries, retrieve for each
+            in parallel, and merge the results (see route_multi_intent)
+        prefilter: Optional OutOfScopeFilter. Clearly off-topic queries go
+            straight to early_exit without any LLM call.
+        session: Optional conversation Session. Follow-ups ("and how do I
+            roll that back?") reuse the previous intent and extend the
+            chunks already retrieved instead of starting from scratch.
     """
+    # Step 0: Skip classification entirely for clearly off-topic queries
+    if prefilter is not None:
+        decision = prefilter.check(query)
+        if decision.out_of_scope:
+            result = early_exit(query)
+            result.metadata.update(prefiltered=True, denylist_hits=decision.denylist_hits)
+            if session is not None:
+                session.record(query, Intent.OUT_OF_SCOPE, result)
+            return RoutedResponse(query=query, intent=Intent.OUT_OF_SCOPE, retrieval_result=result)
+
     if client is None:
         client = OpenAI()
 
-    # Step 1: Classify intent
-    intent = classify_intent_simple(query, client)
+    # Follow-ups are classified and retrieved with the previous turn as context
+    follow_up = session is not None and session.is_follow_up(query)
+    contextual_query = session.contextualize(query) if follow_up else query
+
+    # Step 1: Classify intent (obvious follow-ups reuse the previous one)
+    intent = session.reusable_intent(query) if follow_up else None
+    if intent is None and multi_intent:
+        spans = classify_intents(contextual_query, client)
+        if len(spans) > 1:
+            response = route_multi_intent(query, spans, client, generate_answer, tuner)
+            if session is not None:
+                session.record(query, response.intent, response.retrieval_result)
+            return response
+        intent = spans[0].intent  # Only one part - carry on as a normal query
+    if intent is None:
+        intent = classify_intent_simple(contextual_query, client)
 
     # Step 2: Route to appropriate retrieval strategy
-    retrieval_result = route_to_retrieval(intent, query)
+    params = tuner.select(intent) if tuner else DEFAULT_PARAMS[intent]
+    start = time.perf_counter()
+    retrieval_result = route_to_retrieval(intent, contextual_query, params)
+    if follow_up and intent != Intent.OUT_OF_SCOPE:
+        retrieval_result = session.extend(retrieval_result, params.chunk_budget)
+    latency_ms = (time.perf_counter() - start) * 1000
+
+    if session is not None:
+        session.record(query, intent, retrieval_result)
 
     # Step 3: Optionally generate answer
     answer = None
@@ -68,38 +130,123 @@ def route_query(
         query=query,
         intent=intent,
         retrieval_result=retrieval_result,
-        answer=answer
+        answer=answer,
+        params=params,
+        latency_ms=latency_ms,
+    )
+
+
+def route_multi_intent(
+    query: str,
+    spans: list[IntentSpan],
+    client: OpenAI,
+    generate_answer: bool = False,
+    tuner: ParamTuner | None = None,
+    chunk_budget: int | None = None,
+) -> RoutedResponse:
+    """
+    Route a mixed-intent query: one retrieval per sub-query, run concurrently.
+
+    "What is OAuth and how do I reset my API key?" runs semantic search for
+    the first half and hybrid search for the second at the same time, then
+    merges both into a single RetrievalResult under ONE context budget.
+
+    The response's intent is the first in-scope sub-query's intent; all parts are
+    in sub_intents, with the params each one used in sub_params (report
+    feedback per part with tuner.record_feedback).
+
+    OUT_OF_SCOPE parts are not retrieved at all, so the canned refusal never
+    ends up in the answer's context or eats into the shared budget.
+    """
+    params_list = [
+        tuner.select(span.intent) if tuner else DEFAULT_PARAMS[span.intent]
+        for span in spans
+    ]
+    in_scope = [
+        (span, params)
+        for span, params in zip(spans, params_list)
+        if span.intent != Intent.OUT_OF_SCOPE
+    ]
+    if not in_scope:
+        return RoutedResponse(
+            query=query,
+            intent=Intent.OUT_OF_SCOPE,
+            retrieval_result=early_exit(query),
+            sub_intents=spans,
+            sub_params=params_list,
+        )
+    if chunk_budget is None:
+        budgets = [params.chunk_budget for _, params in in_scope]
+        chunk_budget = None if None in budgets else max(budgets)
+
+    start = time.perf_counter()
+    # Retrieval is I/O-bound in production (vector DB, SQL), so threads are enough
+    with ThreadPoolExecutor(max_workers=len(in_scope)) as pool:
+        results = list(pool.map(
+            route_to_retrieval,
+            [span.intent for span, _ in in_scope],
+            [span.text for span, _ in in_scope],
+            [params for _, params in in_scope],
+        ))
+    latency_ms = (time.perf_counter() - start) * 1000
+
+    retrieval_result = merge_results(results, chunk_budget)
+
+    answer = None
+    if generate_answer:
+        answer = generate_rag_answer(query, retrieval_result.chunks, client)
+
+    return RoutedResponse(
+        query=query,
+        intent=in_scope[0][0].intent,
+        retrieval_result=retrieval_result,
+        answer=answer,
+        latency_ms=latency_ms,
+        sub_intents=spans,
+        sub_params=params_list,
     )
 
 
-def route_to_retrieval(intent: Intent, query: str) -> RetrievalResult:
+def route_to_retrieval(
+    intent: Intent,
+    query: str,
+    params: RetrievalParams | None = None,
+) -> RetrievalResult:
     """
     Route to the appropriate retrieval strategy based on intent.
 
     This is where the magic happens - each intent gets a different
     search strategy optimized for that type of query.
+
+    Params default to the safe per-intent defaults (top_k=3, alpha=0.5).
     """
+    if params is None:
+        params = DEFAULT_PARAMS[intent]
+
     match intent:
         case Intent.CONCEPTUAL:
             # Broad understanding needed - use semantic search with larger chunks
-            return semantic_search(query, top_k=3)
+            result = semantic_search(query, top_k=params.top_k)
 
         case Intent.PROCEDURAL:
             # Specific steps needed - use hybrid search (keywords matter)
-            return hybrid_search(query, alpha=0.5)
+            result = hybrid_search(query, alpha=params.alpha)
 
         case Intent.FACTUAL:
             # Data lookup - skip vectors, query structured data directly
-            return structured_query(query)
+            result = structured_query(query)
 
         case Intent.COMPARATIVE:
             # Multiple sources needed - gather info on each item
-            return multi_source_retrieval(query)
+            result = multi_source_retrieval(query)
 
         case Intent.OUT_OF_SCOPE:
             # Don't search - return canned response immediately
             return early_exit(query)
 
+    # Cap how much context flows downstream into the answer prompt
+    return apply_chunk_budget(result, params.chunk_budget)
+
 
 def generate_rag_answer(
     query: str,
@@ -0,0 +1,180 @@
+"""
+Conversation Sessions
+
+route_query treats every query on its own. That breaks on follow-ups:
+
+    User: How do I deploy to production?
+    User: And how do I roll that back?
+
+The second query has no topic ("that"?) and often no clear intent on its own.
+A session remembers just enough of the conversation to fix this:
+
+1. Recent turns - to rewrite a follow-up into a standalone retrieval query
+2. The previous intent - obvious follow-ups reuse it and skip the LLM call
+3. Retrieved chunk ids - so a follow-up extends what we already found
+   instead of starting over
+
+Everything is bounded: a few turns and a few chunks per session, and a
+SessionStore keeps only the most recently used sessions (LRU).
+"""
+
+import re
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+
+from intent_classifier import Intent
+from retrieval import RetrievalResult, apply_chunk_budget
+
+# Openers that almost always continue the previous question
+FOLLOW_UP_PREFIXES = ("and ", "also ", "what about", "how about", "then ", "so ", "ok ", "okay ")
+
+# Words that point back at something said earlier
+ANAPHORA = {"that", "it", "this", "those", "them", "these", "its", "there"}
+
+# Cheap cues for when a follow-up clearly switches intent
+INTENT_CUES = {
+    Intent.PROCEDURAL: ("how do i", "how to", "steps", "configure", "roll back", "rollback"),
+    Intent.COMPARATIVE: (" vs ", "versus", "compare", "difference", "better than"),
+    Intent.FACTUAL: ("how many", "how much", "what was", "rate limit", "revenue"),
+    Intent.CONCEPTUAL: ("what is", "what are", "explain", "why "),
+}
+
+
+@dataclass
+class Turn:
+    """One question in a conversation."""
+
+    query: str
+    intent: Intent
+
+
+class Session:
+    """Bounded per-conversation state for the router."""
+
+    def __init__(self, session_id: str, max_turns: int = 4, max_chunks: int = 10):
+        self.session_id = session_id
+        self.turns: deque[Turn] = deque(maxlen=max_turns)
+        self.max_chunks = max_chunks
+        # chunk_id -> (chunk, score), most recent last
+        self.chunks: OrderedDict[str, tuple[str, float]] = OrderedDict()
+
+    @property
+    def last_intent(self) -> Intent | None:
+        return self.turns[-1].intent if self.turns else None
+
+    def is_follow_up(self, query: str) -> bool:
+        """Does this query only make sense in light of the previous turn?"""
+        if not self.turns:
+            return False
+
+        query_lower = query.lower().strip()
+        if query_lower.startswith(FOLLOW_UP_PREFIXES):
+            return True
+
+        words = re.findall(r"[a-z']+", query_lower)
+        return len(words) <= 8 and any(word in ANAPHORA for word in words)
+
+    def reusable_intent(self, query: str) -> Intent | None:
+        """
+        The previous intent, if an obvious follow-up doesn't signal a new one.
+
+        "And how do I roll that back?" after a PROCEDURAL question reuses
+        PROCEDURAL. After a CONCEPTUAL question it returns None, because
+        "how do I" says the intent changed - the caller should classify.
+        """
+        if not self.is_follow_up(query):
+            return None
+
+        query_lower = f" {query.lower()} "
+        cued = {
+            intent for intent, cues in INTENT_CUES.items()
+            if any(cue in query_lower for cue in cues)
+        }
+        if cued and self.last_intent not in cued:
+            return None
+
+        return self.last_intent
+
+    def contextualize(self, query: str) -> str:
+        """
+        Rewrite a follow-up into a standalone query for retrieval.
+
+        Mock version: prepend the previous question, so keyword and
+        semantic search see the topic. In production, a cheap LLM rewrite
+        ("How do I roll back a production deployment?") does better.
+        """
+        if not self.is_follow_up(query):
+            return query
+        return f"{self.turns[-1].query} {query}"
+
+    def extend(self, result: RetrievalResult, chunk_budget: int | None) -> RetrievalResult:
+        """
+        Combine fresh results with chunks already retrieved in this session.
+
+        New chunks come first. Cached chunks that weren't re-retrieved fill
+        the rest of the budget, so the answer keeps the earlier context.
+        """
+        fresh = result.items()
+        fresh_ids = {chunk_id for chunk_id, _, _ in fresh}
+        cached = [
+            (chunk_id, chunk, score)
+            for chunk_id, (chunk, score) in reversed(self.chunks.items())
+            if chunk_id not in fresh_ids
+        ]
+        reused = len(fresh_ids & self.chunks.keys())
+
+        combined = RetrievalResult(
+            chunks=[chunk for _, chunk, _ in fresh + cached],
+            strategy_used=result.strategy_used,
+            metadata={
+                **result.metadata,
+                "session_cache_hits": reused,      # Fresh chunks we'd already retrieved
+                "session_chunks_carried": len(cached),  # Earlier chunks carried forward
+            },
+            chunk_ids=[chunk_id for chunk_id, _, _ in fresh + cached],
+            scores=[score for _, _, score in fresh + cached],
+        )
+        return apply_chunk_budget(combined, chunk_budget)
+
+    def record(self, query: str, intent: Intent, result: RetrievalResult) -> None:
+        """Remember this turn and its chunks, evicting the oldest past the limits."""
+        self.turns.append(Turn(query=query, intent=intent))
+        if intent == Intent.OUT_OF_SCOPE:
+            return  # A canned refusal isn't context worth carrying forward
+
+        for chunk_id, chunk, score in result.items():
+            self.chunks[chunk_id] = (chunk, score)
+            self.chunks.move_to_end(chunk_id)
+
+        while len(self.chunks) > self.max_chunks:
+            self.chunks.popitem(last=False)
+
+
+class SessionStore:
+    """
+    LRU of sessions, so memory stays bounded however many users show up.
+
+    Each session is capped (turns + chunks), and at most max_sessions are
+    kept - the least recently active conversation is dropped first.
+    """
+
+    def __init__(self, max_sessions: int = 10_000, max_turns: int = 4, max_chunks: int = 10):
+        self.max_sessions = max_sessions
+        self.max_turns = max_turns
+        self.max_chunks = max_chunks
+        self._sessions: OrderedDict[str, Session] = OrderedDict()
+
+    def get(self, session_id: str) -> Session:
+        """Fetch a session (creating it if needed) and mark it recently used."""
+        session = self._sessions.get(session_id)
+        if session is None:
+            session = Session(session_id, self.max_turns, self.max_chunks)
+            self._sessions[session_id] = session
+            if len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        else:
+            self._sessions.move_to_end(session_id)
+        return session
+
+    def __len__(self) -> int:
+        return len(self._sessions)
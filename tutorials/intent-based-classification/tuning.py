@@ -0,0 +1,241 @@
+"""
+Adaptive Retrieval Parameters
+
+Each intent routes to a fixed strategy, but the knobs on that strategy
+(how many chunks, how much keyword vs semantic weight, how much context
+to pass to the LLM) don't have one right answer. The right values depend
+on your corpus, and they drift as the corpus grows.
+
+This module treats each knob setting as an "arm" of a multi-armed bandit:
+1. Pick an arm for the query's intent (mostly the best one, sometimes explore)
+2. Run retrieval with those parameters and measure latency
+3. Record relevance feedback for that arm
+4. Persist the running stats so the next process starts where we left off
+
+If anything goes wrong (no data yet, unknown arm, corrupt state file),
+we fall back to the same safe defaults the router always used.
+"""
+
+import json
+import os
+import random
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from intent_classifier import Intent
+
+
+@dataclass(frozen=True)
+class RetrievalParams:
+    """The tunable knobs for a single retrieval call."""
+
+    top_k: int = 3              # Max chunks from semantic search
+    alpha: float = 0.5          # Hybrid weighting: 0 = all keywords, 1 = all semantic
+    chunk_budget: int | None = None  # Max characters of context (None = no limit)
+
+    @property
+    def arm_id(self) -> str:
+        """Stable key used to store stats for this arm."""
+        return f"top_k={self.top_k},alpha={self.alpha},budget={self.chunk_budget}"
+
+
+# =============================================================================
+# Defaults and Arms
+# =============================================================================
+
+# The safe defaults - exactly what route_to_retrieval used before tuning
+DEFAULT_PARAMS = {
+    Intent.CONCEPTUAL: RetrievalParams(top_k=3),
+    Intent.PROCEDURAL: RetrievalParams(alpha=0.5),
+    Intent.FACTUAL: RetrievalParams(),
+    Intent.COMPARATIVE: RetrievalParams(),
+    Intent.OUT_OF_SCOPE: RetrievalParams(),
+}
+
+# Candidate settings per intent. Only knobs that matter for the intent's
+# strategy are varied - FACTUAL and OUT_OF_SCOPE have nothing to tune.
+DEFAULT_ARMS = {
+    Intent.CONCEPTUAL: [
+        RetrievalParams(top_k=top_k, chunk_budget=budget)
+        for top_k in (2, 3, 5)
+        for budget in (2000, 4000, None)
+    ],
+    Intent.PROCEDURAL: [
+        RetrievalParams(alpha=alpha, chunk_budget=budget)
+        for alpha in (0.3, 0.5, 0.7)
+        for budget in (2000, 4000, None)
+    ],
+    Intent.FACTUAL: [DEFAULT_PARAMS[Intent.FACTUAL]],
+    Intent.COMPARATIVE: [
+        RetrievalParams(chunk_budget=budget) for budget in (2000, 4000, None)
+    ],
+    Intent.OUT_OF_SCOPE: [DEFAULT_PARAMS[Intent.OUT_OF_SCOPE]],
+}
+
+# Next to this module, not wherever the tutorial happens to be run from
+DEFAULT_TUNING_PATH = Path(__file__).resolve().parent / ".retrieval_tuning.json"
+
+
+@dataclass
+class ArmStats:
+    """Running averages for one arm of one intent."""
+
+    pulls: int = 0
+    mean_reward: float = 0.0
+    mean_latency_ms: float = 0.0
+    mean_relevance: float = 0.0
+
+    def update(self, reward: float, latency_ms: float, relevance: float) -> None:
+        """Fold one observation into the running means (no history kept)."""
+        self.pulls += 1
+        n = self.pulls
+        self.mean_reward += (reward - self.mean_reward) / n
+        self.mean_latency_ms += (latency_ms - self.mean_latency_ms) / n
+        self.mean_relevance += (relevance - self.mean_relevance) / n
+
+
+# =============================================================================
+# The Tuner
+# =============================================================================
+
+class ParamTuner:
+    """
+    Epsilon-greedy bandit over retrieval parameters, one per intent.
+
+    Reward = relevance - latency_weight * latency_seconds
+
+    So a setting that returns slightly less relevant context but is much
+    faster can win, and latency_weight is the dial for that trade-off.
+
+    Usage:
+        tuner = ParamTuner()
+        response = route_query(query, tuner=tuner)
+        ...
+        tuner.record_feedback(response.intent, response.params,
+                              response.latency_ms, relevance=0.8)
+    """
+
+    def __init__(
+        self,
+        path: Path | None = DEFAULT_TUNING_PATH,
+        epsilon: float = 0.1,
+        latency_weight: float = 0.5,
+        min_pulls: int = 5,
+        arms: dict[Intent, list[RetrievalParams]] | None = None,
+        rng: random.Random | None = None,
+    ):
+        """
+        Args:
+            path: JSON file for persisted stats (None = in-memory only)
+            epsilon: Fraction of queries that explore a random arm
+            latency_weight: Reward penalty per second of retrieval latency
+            min_pulls: Observations an arm needs before it can beat the default
+            arms: Candidate params per intent (defaults to DEFAULT_ARMS)
+            rng: Random source, injectable for reproducible tests
+        """
+        self.path = Path(path) if path is not None else None
+        self.epsilon = epsilon
+        self.latency_weight = latency_weight
+        self.min_pulls = min_pulls
+        self.arms = arms or DEFAULT_ARMS
+        self.rng = rng or random.Random()
+        self.stats: dict[Intent, dict[str, ArmStats]] = {intent: {} for intent in Intent}
+        self._load()
+
+    def select(self, intent: Intent) -> RetrievalParams:
+        """Choose the parameters to use for the next query with this intent."""
+        arms = self.arms.get(intent) or [DEFAULT_PARAMS[intent]]
+
+        if len(arms) > 1 and self.rng.random() < self.epsilon:
+            return self.rng.choice(arms)
+
+        return self.best(intent)
+
+    def best(self, intent: Intent) -> RetrievalParams:
+        """
+        The best-known parameters for an intent.
+
+        Arms with too few observations are ignored, so until we have
+        real evidence this is just DEFAULT_PARAMS[intent].
+        """
+        intent_stats = self.stats[intent]
+
+        best_params, best_reward = DEFAULT_PARAMS[intent], None
+        for params in self.arms.get(intent, []):
+            stats = intent_stats.get(params.arm_id)
+            if stats is None or stats.pulls < self.min_pulls:
+                continue
+            if best_reward is None or stats.mean_reward > best_reward:
+                best_params, best_reward = params, stats.mean_reward
+
+        return best_params
+
+    def record_feedback(
+        self,
+        intent: Intent,
+        params: RetrievalParams,
+        latency_ms: float,
+        relevance: float,
+    ) -> float:
+        """
+        Record how a retrieval went and persist the updated stats.
+
+        Args:
+            intent: The intent the query was routed as
+            params: The parameters that were used
+            latency_ms: Retrieval latency in milliseconds
+            relevance: Relevance score in [0, 1] (user rating, LLM judge, click...)
+
+        Returns:
+            The reward credited to the arm
+        """
+        relevance = min(max(relevance, 0.0), 1.0)
+        reward = relevance - self.latency_weight * (latency_ms / 1000)
+
+        stats = self.stats[intent].setdefault(params.arm_id, ArmStats())
+        stats.update(reward, latency_ms, relevance)
+
+        self._save()
+        return reward
+
+    def summary(self) -> dict:
+        """Current best params and per-arm stats, for logging/debugging."""
+        return {
+            intent.value: {
+                "best": asdict(self.best(intent)),
+                "arms": {arm_id: asdict(s) for arm_id, s in self.stats[intent].items()},
+            }
+            for intent in Intent
+        }
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def _load(self) -> None:
+        """Load persisted stats. Any problem means we start from defaults."""
+        if self.path is None or not self.path.exists():
+            return
+
+        try:
+            data = json.loads(self.path.read_text())
+            for intent_value, arms in data.items():
+                intent = Intent(intent_value)
+                self.stats[intent] = {arm_id: ArmStats(**s) for arm_id, s in arms.items()}
+        except (OSError, ValueError, TypeError, AttributeError):
+            # AttributeError: valid JSON of the wrong shape (a list, a number)
+            self.stats = {intent: {} for intent in Intent}
+
+    def _save(self) -> None:
+        """Write stats atomically so a crash never leaves a half-written file."""
+        if self.path is None:
+            return
+
+        data = {
+            intent.value: {arm_id: asdict(s) for arm_id, s in arms.items()}
+            for intent, arms in self.stats.items()
+            if arms
+        }
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(data, indent=2))
+        os.replace(tmp_path, self.path)
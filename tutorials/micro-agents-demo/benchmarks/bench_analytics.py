@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# /// script
+# dependencies = [
+#   "google-api-python-client>=2.150.0",
+#   "google-auth-oauthlib>=1.0.0",
+#   "youtube-transcript-api>=0.6.0",
+#   "pyyaml>=6.0",
+#   "numpy>=1.26",
+# ]
+# ///
+"""
+Benchmark: per-channel z-scores in Python vs. robust_outlier_scores.
+
+Builds a synthetic dataset (default 1M videos across 10k channels) where
+views grow with video age, and 1% of videos are planted outliers with 10x
+their expected views. Times both scorings and checks how well each finds
+the planted outliers.
+
+Usage:
+    uv run benchmarks/bench_analytics.py --videos 1000000 --channels 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from youtube import robust_outlier_scores  # noqa: E402
+
+OUTLIER_BOOST = 10.0  # Planted outliers get this many times their expected views
+OUTLIER_SHARE = 0.01
+
+
+def synthetic_videos(videos: int, channels: int, seed: int) -> dict[str, np.ndarray]:
+    """Views = channel size x age curve x noise, with planted outliers."""
+    rng = np.random.default_rng(seed)
+    groups = rng.integers(0, channels, videos)
+    ages = rng.uniform(1, 365, videos)
+
+    channel_size = rng.normal(8.0, 1.5, channels)  # Log views of a typical video
+    log_views = (
+        channel_size[groups] + 0.5 * np.log1p(ages) + rng.normal(0, 0.6, videos)
+    )
+    planted = rng.random(videos) < OUTLIER_SHARE
+    log_views[planted] += np.log(OUTLIER_BOOST)
+
+    return {
+        "views": np.expm1(log_views).round().astype(np.int64),
+        "groups": groups,
+        "ages": ages,
+        "planted": planted,
+    }
+
+
+def python_zscores(views: list[int], groups: list[int]) -> list[float]:
+    """The pre-NumPy path: mean/stdev of raw views per channel, in Python."""
+    by_channel: dict[int, list[int]] = {}
+    for group, view_count in zip(groups, views):
+        by_channel.setdefault(group, []).append(view_count)
+
+    moments = {}
+    for group, counts in by_channel.items():
+        mean = statistics.mean(counts)
+        moments[group] = (mean, statistics.stdev(counts) if len(counts) > 1 else 0.0)
+
+    scores = []
+    for group, view_count in zip(groups, views):
+        mean, stdev = moments[group]
+        scores.append((view_count - mean) / stdev if stdev > 0 else 0.0)
+    return scores
+
+
+def detection(flagged: np.ndarray, planted: np.ndarray) -> str:
+    true_positives = int((flagged & planted).sum())
+    precision = true_positives / flagged.sum() if flagged.sum() else 0.0
+    recall = true_positives / planted.sum() if planted.sum() else 0.0
+    return f"precision {precision:.2f}, recall {recall:.2f}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Outlier analytics benchmark")
+    parser.add_argument("--videos", type=int, default=1_000_000, help="Synthetic videos")
+    parser.add_argument("--channels", type=int, default=10_000, help="Synthetic channels")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    data = synthetic_videos(args.videos, args.channels, args.seed)
+    print(f"{args.videos:,} videos, {args.channels:,} channels, "
+          f"{int(data['planted'].sum()):,} planted outliers\n")
+
+    views, groups = data["views"].tolist(), data["groups"].tolist()
+    started = time.perf_counter()
+    zscores = np.array(python_zscores(views, groups))
+    python_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    scores = robust_outlier_scores(data["views"], data["groups"], data["ages"])
+    numpy_seconds = time.perf_counter() - started
+
+    print(f"{'scoring':<34} {'time':>9}  outliers (score > 2)")
+    print(f"{'Python z-score of views':<34} {python_seconds:>8.2f}s  "
+          f"{detection(zscores > 2, data['planted'])}")
+    print(f"{'NumPy robust (MAD of log views)':<34} {'':>9}  "
+          f"{detection(scores.log_z > 2, data['planted'])}")
+    print(f"{'NumPy robust, age-adjusted':<34} {numpy_seconds:>8.2f}s  "
+          f"{detection(scores.z > 2, data['planted'])}")
+    print(f"\nSpeedup: {python_seconds / numpy_seconds:.1f}x "
+          "(NumPy time covers all of robust_outlier_scores)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# /// script
+# dependencies = [
+#   "google-api-python-client>=2.150.0",
+#   "google-auth-oauthlib>=1.0.0",
+#   "youtube-transcript-api>=0.6.0",
+#   "pyyaml>=6.0",
+#   "numpy>=1.26",
+# ]
+# ///
+"""
+Benchmark: per-command latency and API usage, offline.
+
+Runs each command end to end - googleapiclient, the quota scheduler, field
+masks, the cache and the stores - against the fake API in fake_api.py
+instead of the network, so it needs no API key and spends no quota. For
+each command: wall time (median of --repeat runs, each on a fresh fake and
+fresh stores), API calls, quota units, errors injected and response bytes.
+
+Usage:
+    uv run benchmarks/bench_commands.py
+    uv run benchmarks/bench_commands.py --latency 0.1 --error-rate 0.05
+    uv run benchmarks/bench_commands.py --only sync upload
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from fake_api import FakeStats, FakeYouTubeAPI  # noqa: E402
+from youtube import (  # noqa: E402
+    ChannelIndex,
+    ChannelStore,
+    QuotaScheduler,
+    ResponseCache,
+    UploadSessions,
+    YouTubeService,
+    YouTubeUploader,
+)
+
+
+class Run:
+    """One run of one command: a fresh fake API and fresh stores in a temp dir."""
+
+    def __init__(self, args: argparse.Namespace, tmp: Path):
+        self.args = args
+        self.tmp = tmp
+        self.api = FakeYouTubeAPI(
+            channels=args.channels,
+            videos_per_channel=args.videos,
+            latency=args.latency,
+            error_rate=args.error_rate,
+            upload_bandwidth=args.bandwidth * 1e6,
+            seed=args.seed,
+        )
+
+    def scheduler(self) -> QuotaScheduler:
+        return QuotaScheduler(
+            units_per_day=1_000_000, requests_per_second=self.args.rps, path=None
+        )
+
+    def service(self, **stores) -> YouTubeService:
+        return YouTubeService(
+            "fake-key", scheduler=self.scheduler(), transport=self.api.http, **stores
+        )
+
+    def handles(self, n: int) -> list[str]:
+        return [f"@fakechannel{k}" for k in range(min(n, self.args.channels))]
+
+
+# Each command prepares its run (anything that shouldn't be timed) and
+# returns the call to time.
+
+
+def resolve_cold(run: Run):
+    service = run.service()
+    return lambda: service.resolve_channels(run.handles(run.args.compare))
+
+
+def resolve_indexed(run: Run):
+    index = ChannelIndex(run.tmp / "channels.json")
+    run.service(index=index).resolve_channels(run.handles(run.args.compare))
+    service = run.service(index=ChannelIndex(run.tmp / "channels.json"))
+    return lambda: service.resolve_channels(run.handles(run.args.compare))
+
+
+def channel_videos(run: Run):
+    service = run.service()
+    return lambda: service.get_channel_videos(
+        "UCfake000000000000000001", days_back=90, max_results=200
+    )
+
+
+def channel_videos_revalidated(run: Run):
+    # Zero TTLs: every response is in the cache but stale, so each call is a 304
+    cache = ResponseCache(run.tmp / "cache.sqlite3", ttls={
+        "channels.list": 0, "playlistItems.list": 0, "videos.list": 0,
+    })
+    service = run.service(cache=cache)
+    service.get_channel_videos("UCfake000000000000000001", days_back=90, max_results=200)
+    return lambda: service.get_channel_videos(
+        "UCfake000000000000000001", days_back=90, max_results=200
+    )
+
+
+def sync_first(run: Run):
+    service = run.service(channels=ChannelStore(run.tmp / "channels.sqlite3"))
+    return lambda: service.sync_channel("@fakechannel1", days_back=90)
+
+
+def sync_next_day(run: Run):
+    service = run.service(channels=ChannelStore(run.tmp / "channels.sqlite3"))
+    service.sync_channel("@fakechannel1", days_back=90)
+    run.api.advance(24 * 3600)
+    return lambda: service.sync_channel("@fakechannel1", days_back=90)
+
+
+def compare(run: Run):
+    service = run.service()
+    return lambda: service.get_many_channels(run.handles(run.args.compare), days_back=30)
+
+
+def search(run: Run):
+    service = run.service()
+    return lambda: service.search_videos("python agents", max_results=200, days_back=30)
+
+
+def upload(run: Run):
+    video = run.tmp / "video.mp4"
+    with open(video, "wb") as f:
+        f.truncate(run.args.upload_mb * 1024 * 1024)  # Sparse: nothing to write
+    thumbnail = run.tmp / "thumbnail.png"
+    thumbnail.write_bytes(b"\x89PNG\r\n\x1a\n" + bytes(100_000))
+    uploader = YouTubeUploader(
+        None,
+        scheduler=run.scheduler(),
+        sessions=UploadSessions(run.tmp / "uploads"),
+        transport=run.api.http,
+    )
+    return lambda: uploader.upload(video, "Benchmark upload", thumbnail_path=thumbnail)
+
+
+COMMANDS = [
+    ("resolve", "resolve_channels (N handles)", resolve_cold),
+    ("resolve", "resolve_channels (indexed)", resolve_indexed),
+    ("videos", "get_channel_videos (90 days)", channel_videos),
+    ("videos", "get_channel_videos (cached, 304s)", channel_videos_revalidated),
+    ("sync", "sync_channel (first)", sync_first),
+    ("sync", "sync_channel (next day)", sync_next_day),
+    ("compare", "compare_channels (N channels)", compare),
+    ("search", "search_videos (200 results)", search),
+    ("upload", "upload (with thumbnail)", upload),
+]
+
+
+def measure(args: argparse.Namespace, prepare) -> tuple[list[float], FakeStats, str | None]:
+    """Wall times of each run, the last run's API usage, and any error it returned."""
+    timings = []
+    for _ in range(args.repeat):
+        with tempfile.TemporaryDirectory() as tmp:
+            run = Run(args, Path(tmp))
+            command = prepare(run)
+            run.api.reset_stats()
+            started = time.perf_counter()
+            result = command()
+            timings.append(time.perf_counter() - started)
+            stats = run.api.stats()
+    error = result.get("error") if isinstance(result, dict) else None
+    return timings, stats, error
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-command benchmark on the fake API")
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds per request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Transient error chance")
+    parser.add_argument("--rps", type=float, default=10.0, help="Scheduler requests/second")
+    parser.add_argument("--channels", type=int, default=100, help="Synthetic channels")
+    parser.add_argument("--videos", type=int, default=500, help="Uploads per channel")
+    parser.add_argument("--compare", type=int, default=20, help="N: channels to resolve/compare")
+    parser.add_argument("--upload-mb", type=int, default=64, help="Size of the upload")
+    parser.add_argument("--bandwidth", type=float, default=20.0, help="Upload MB/s")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per command")
+    parser.add_argument("--only", nargs="+", metavar="COMMAND",
+                        choices=sorted({name for name, _, _ in COMMANDS}),
+                        help="Run only these commands")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"Fake API: {args.latency * 1000:.0f}ms latency, {args.error_rate:.0%} errors, "
+          f"scheduler at {args.rps:g} req/s, N = {args.compare}\n")
+    print(f"{'command':<36} {'p50':>8} {'max':>8} {'calls':>6} {'quota':>6} "
+          f"{'errors':>6} {'received':>9}")
+    for name, label, prepare in COMMANDS:
+        if args.only and name not in args.only:
+            continue
+        timings, stats, error = measure(args, prepare)
+        print(
+            f"{label:<36} {statistics.median(timings):>7.2f}s {max(timings):>7.2f}s "
+            f"{stats.total_calls:>6} {stats.quota_used:>6} {sum(stats.errors.values()):>6} "
+            f"{stats.bytes_sent / 1000:>7.0f}KB"
+            + (f"  error: {error}" if error else "")
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# /// script
+# dependencies = [
+#   "google-api-python-client>=2.150.0",
+#   "google-auth-oauthlib>=1.0.0",
+#   "youtube-transcript-api>=0.6.0",
+#   "pyyaml>=6.0",
+# ]
+# ///
+"""
+Benchmark: full API responses vs. the field masks in FIELD_MASKS.
+
+Applies each endpoint's mask to a full response fixture (the same
+filtering the API does server-side) and compares transfer size and
+parse time.
+
+Usage:
+    uv run benchmarks/bench_field_masks.py
+    uv run benchmarks/bench_field_masks.py --record @mkbhd   # Re-record fixtures (needs YOUTUBE_API_KEY)
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from youtube import FIELD_MASKS, YouTubeService  # noqa: E402
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+
+def parse_field_mask(mask: str) -> dict:
+    """Parse a fields= mask into a tree: {name: subtree, or None for 'everything'}.
+
+    Supports the partial-response syntax: a,b  a/b  a(b,c)
+    """
+
+    def parse_selector(i: int) -> tuple[str, dict | None, int]:
+        start = i
+        while i < len(mask) and mask[i] not in ",/()":
+            i += 1
+        name, subtree = mask[start:i].strip(), None
+        if i < len(mask) and mask[i] == "/":
+            child, child_tree, i = parse_selector(i + 1)
+            subtree = {child: child_tree}
+        elif i < len(mask) and mask[i] == "(":
+            subtree, i = parse_selectors(i + 1)
+            i += 1  # Closing paren
+        return name, subtree, i
+
+    def parse_selectors(i: int) -> tuple[dict, int]:
+        tree: dict = {}
+        while i < len(mask) and mask[i] != ")":
+            name, subtree, i = parse_selector(i)
+            if name in tree and (tree[name] is None or subtree is None):
+                tree[name] = None  # Selecting a whole field wins
+            else:
+                tree[name] = {**tree.get(name, {}), **subtree} if name in tree else subtree
+            if i < len(mask) and mask[i] == ",":
+                i += 1
+        return tree, i
+
+    tree, _ = parse_selectors(0)
+    return tree
+
+
+def apply_field_mask(data, mask: str | dict):
+    """Keep only the fields a mask selects (lists are filtered item by item)."""
+    tree = parse_field_mask(mask) if isinstance(mask, str) else mask
+    if isinstance(data, list):
+        return [apply_field_mask(item, tree) for item in data]
+    if not isinstance(data, dict):
+        return data
+    return {
+        key: data[key] if subtree is None else apply_field_mask(data[key], subtree)
+        for key, subtree in tree.items()
+        if key in data
+    }
+
+
+def time_parse(payload: bytes, parse_items, repeat: int) -> float:
+    """Mean milliseconds to decode the JSON (and build data classes, if parse_items does)."""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        parse_items(json.loads(payload))
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def run_benchmark(repeat: int) -> None:
+    service = YouTubeService(api_key=None)
+    parsers = {
+        "videos.list": lambda body: [service._parse_video_item(i) for i in body["items"]],
+    }
+
+    print(f"{'endpoint':<20} {'full':>10} {'masked':>10} {'gzip full':>10} "
+          f"{'gzip mask':>10} {'parse full':>11} {'parse mask':>11}")
+
+    for endpoint, mask in FIELD_MASKS.items():
+        fixture = FIXTURES_DIR / f"{endpoint}.json"
+        if not fixture.exists():
+            continue
+
+        full = json.loads(fixture.read_text())
+        masked = apply_field_mask(full, mask)
+        full_bytes = json.dumps(full).encode()
+        masked_bytes = json.dumps(masked).encode()
+
+        parse = parsers.get(endpoint, lambda body: body)
+        full_ms = time_parse(full_bytes, parse, repeat)
+        masked_ms = time_parse(masked_bytes, parse, repeat)
+
+        if endpoint in parsers:
+            # The mask must not change what we parse
+            assert parse(json.loads(full_bytes)) == parse(json.loads(masked_bytes)), endpoint
+
+        print(
+            f"{endpoint:<20} {len(full_bytes):>9,}B {len(masked_bytes):>9,}B "
+            f"{len(gzip.compress(full_bytes)):>9,}B {len(gzip.compress(masked_bytes)):>9,}B "
+            f"{full_ms:>9.3f}ms {masked_ms:>9.3f}ms"
+        )
+
+
+def record_fixtures(channel: str, query: str) -> None:
+    """Save full (unmasked) responses from the live API as fixtures."""
+    api_key = os.environ.get("YOUTUBE_API_KEY")
+    if not api_key:
+        sys.exit("Error: YOUTUBE_API_KEY environment variable not set")
+
+    service = YouTubeService(api_key, field_masks={endpoint: None for endpoint in FIELD_MASKS})
+    channel_info = service.resolve_channel(channel)
+    if isinstance(channel_info, dict):
+        sys.exit(f"Error: {channel_info['error']}")
+
+    responses = {
+        "channels.list": service._call(
+            "channels.list", part="snippet,statistics,contentDetails", id=channel_info.channel_id
+        ),
+        "playlistItems.list": service._call(
+            "playlistItems.list",
+            part="contentDetails",
+            playlistId=channel_info.uploads_playlist_id,
+            maxResults=50,
+        ),
+        "search.list": service._call(
+            "search.list", part="id", q=query, type="video", maxResults=50
+        ),
+    }
+    video_ids = [
+        item["contentDetails"]["videoId"] for item in responses["playlistItems.list"]["items"]
+    ]
+    responses["videos.list"] = service._call(
+        "videos.list", part="snippet,statistics", id=",".join(video_ids)
+    )
+
+    FIXTURES_DIR.mkdir(exist_ok=True)
+    for endpoint, body in responses.items():
+        (FIXTURES_DIR / f"{endpoint}.json").write_text(
+            json.dumps(body, indent=2, ensure_ascii=False)
+        )
+        print(f"Recorded {endpoint} ({service.quota_used} quota units so far)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Field mask benchmark")
+    parser.add_argument("--repeat", type=int, default=200, help="Parse iterations")
+    parser.add_argument("--record", metavar="CHANNEL", help="Re-record fixtures from this channel")
+    parser.add_argument("--query", default="AI agents", help="Search query to record")
+    args = parser.parse_args()
+
+    if args.record:
+        record_fixtures(args.record, args.query)
+    else:
+        run_benchmark(args.repeat)
+
+
+if __name__ == "__main__":
+    main()
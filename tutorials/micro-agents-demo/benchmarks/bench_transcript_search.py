@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# /// script
+# dependencies = [
+#   "google-api-python-client>=2.150.0",
+#   "google-auth-oauthlib>=1.0.0",
+#   "youtube-transcript-api>=0.6.0",
+#   "pyyaml>=6.0",
+# ]
+# ///
+"""
+Benchmark: transcript search latency over a large synthetic store.
+
+Builds a TranscriptStore with N synthetic ten-minute transcripts (in a
+temp dir, not your workspace), then times search_transcripts queries.
+
+Usage:
+    uv run benchmarks/bench_transcript_search.py --videos 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from youtube import StoredTranscript, TranscriptStore  # noqa: E402
+
+# Zipf-ish vocabulary: a few very common words, a long tail of rare ones
+COMMON = "the a to and of is in it you that we this so for on with just like".split()
+TOPICAL = (
+    "agent agents model python code build prompt tool tools context memory api "
+    "deploy production data vector search workflow automation llm claude openai "
+    "framework test debug latency cache token tokens embedding retrieval"
+).split()
+
+QUERIES = [
+    ("common word", "the", False),
+    ("topical word", "retrieval", False),
+    ("two words", "vector cache", False),
+    ("prefix", "embed*", False),
+    ("phrase", "link in the description", True),
+    ("rare phrase", "context window budget", True),
+]
+
+
+def synthetic_segments(rng: random.Random, minutes: int = 10) -> list[tuple[float, float, str]]:
+    segments = []
+    t = 0.0
+    while t < minutes * 60:
+        words = [
+            rng.choice(COMMON) if rng.random() < 0.6 else rng.choice(TOPICAL)
+            for _ in range(rng.randint(5, 10))
+        ]
+        if rng.random() < 0.01:
+            words += "link in the description".split()
+        if rng.random() < 0.001:
+            words += "context window budget".split()
+        duration = rng.uniform(2.0, 4.0)
+        segments.append((round(t, 2), round(duration, 2), " ".join(words)))
+        t += duration
+    return segments
+
+
+def build_store(path: Path, videos: int, seed: int) -> TranscriptStore:
+    store = TranscriptStore(path)
+    store._db.execute("PRAGMA synchronous = OFF")  # Bulk load speed only
+    rng = random.Random(seed)
+
+    started = time.perf_counter()
+    for i in range(videos):
+        store.put(StoredTranscript(f"vid{i:07d}", "en", True, synthetic_segments(rng)))
+        if (i + 1) % 5000 == 0:
+            print(f"  indexed {i + 1:,} videos ({time.perf_counter() - started:.0f}s)")
+    return store
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Transcript search benchmark")
+    parser.add_argument("--videos", type=int, default=20_000, help="Synthetic transcripts")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per query")
+    parser.add_argument("--limit", type=int, default=20, help="Hits per query")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "transcripts.sqlite3"
+        print(f"Building store with {args.videos:,} transcripts...")
+        store = build_store(path, args.videos, args.seed)
+        print(f"Store size: {path.stat().st_size / 1e6:.0f} MB\n")
+
+        print(f"{'query':<14} {'hits':>5} {'p50':>9} {'max':>9}")
+        for label, query, phrase in QUERIES:
+            timings = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                hits = store.search(query, limit=args.limit, phrase=phrase)
+                timings.append((time.perf_counter() - started) * 1000)
+            print(
+                f"{label:<14} {len(hits):>5} {statistics.median(timings):>7.2f}ms "
+                f"{max(timings):>7.2f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# /// script
+# dependencies = [
+#   "google-api-python-client>=2.150.0",
+#   "google-auth-oauthlib>=1.0.0",
+#   "youtube-transcript-api>=0.6.0",
+#   "pyyaml>=6.0",
+#   "numpy>=1.26",
+#   "pyarrow>=14",
+# ]
+# ///
+"""
+Benchmark: a list of Videos vs. VideoTable, in memory and on export.
+
+Builds N synthetic videos.list items (default 100k), then measures the
+memory retained by three representations - Video without __slots__ (what
+Video used to be), Video with __slots__, and the columnar VideoTable - and
+how long each export format takes to write.
+
+Usage:
+    uv run benchmarks/bench_video_table.py --videos 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, field, fields, make_dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from youtube import (  # noqa: E402
+    Video,
+    VideoTable,
+    parse_video_item,
+    video_record,
+    write_ndjson,
+)
+
+# Video as it was before __slots__: same fields, a __dict__ per instance
+DictVideo = make_dataclass(
+    "DictVideo",
+    [
+        (f.name, f.type, field(default=f.default, default_factory=f.default_factory))
+        for f in fields(Video)
+    ],
+)
+
+TAGS = "tech review unboxing ai agents python tutorial gaming vlog news".split()
+
+
+def synthetic_items(videos: int, channels: int, seed: int) -> bytes:
+    """A videos.list response body with N items, as the API sends it."""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    items = []
+    for i in range(videos):
+        published = now - timedelta(seconds=rng.randint(3600, 365 * 86400))
+        items.append(
+            {
+                "id": f"vid{i:08d}",
+                "snippet": {
+                    "title": f"Video {i} about {rng.choice(TAGS)}",
+                    "channelTitle": f"Channel {rng.randrange(channels)}",
+                    "publishedAt": published.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "tags": rng.sample(TAGS, rng.randint(0, 4)),
+                },
+                "statistics": {
+                    "viewCount": str(int(rng.lognormvariate(9, 1.5))),
+                    "likeCount": str(rng.randint(0, 5000)),
+                    "commentCount": str(rng.randint(0, 500)),
+                },
+            }
+        )
+    return json.dumps({"items": items}).encode()
+
+
+def build_list(items: list[dict], cls: type) -> list:
+    videos = []
+    for item in items:
+        record = parse_video_item(item)
+        if record:
+            videos.append(cls(**record))
+    return videos
+
+
+def build_table(items: list[dict]) -> VideoTable:
+    table = VideoTable()
+    for item in items:
+        table.append_item(item)
+    return table
+
+
+def retained(payload: bytes, build) -> tuple[object, int]:
+    """Parse the response and build from it; bytes still held once the items are gone."""
+    gc.collect()
+    tracemalloc.start()
+    items = json.loads(payload)["items"]
+    built = build(items)
+    del items
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return built, current
+
+
+def write_json(videos: list[Video], path: Path) -> None:
+    """The --json path: deep-copied dicts, pretty-printed in one string."""
+    path.write_text(json.dumps([asdict(v) for v in videos], indent=2, default=str))
+
+
+def write_video_ndjson(videos: list[Video], path: Path) -> None:
+    with open(path, "w") as f:
+        write_ndjson(map(video_record, videos), f)
+
+
+def timed(write) -> float:
+    started = time.perf_counter()
+    write()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="VideoTable memory and export benchmark")
+    parser.add_argument("--videos", type=int, default=100_000, help="Synthetic videos")
+    parser.add_argument("--channels", type=int, default=500, help="Distinct channel names")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    payload = synthetic_items(args.videos, args.channels, args.seed)
+    print(f"{args.videos:,} videos, {len(payload) / 1e6:.0f} MB of API JSON\n")
+
+    print(f"{'representation':<24} {'memory':>10} {'per video':>10} {'build':>8}")
+    built = {}
+    for label, build in [
+        ("Video (no __slots__)", lambda items: build_list(items, DictVideo)),
+        ("Video (__slots__)", lambda items: build_list(items, Video)),
+        ("VideoTable", build_table),
+    ]:
+        items = json.loads(payload)["items"]
+        seconds = timed(lambda: build(items))  # Untraced: tracemalloc slows allocation
+        built[label], size = retained(payload, build)
+        print(f"{label:<24} {size / 1e6:>8.1f}MB {size / args.videos:>9.0f}B {seconds:>7.2f}s")
+    videos, table = built["Video (__slots__)"], built["VideoTable"]
+    del built["Video (no __slots__)"]
+
+    print(f"\n{'export':<34} {'time':>8} {'size':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        exports = [
+            ("asdict + json.dumps(indent=2)", "videos.json", lambda p: write_json(videos, p)),
+            ("write_ndjson(video_record)", "videos.ndjson", lambda p: write_video_ndjson(videos, p)),
+            ("VideoTable -> NDJSON", "table.ndjson", table.write),
+            ("VideoTable -> Arrow IPC", "table.arrow", table.write),
+            ("VideoTable -> Parquet (zstd)", "table.parquet", table.write),
+        ]
+        for label, name, write in exports:
+            path = tmp / name
+            seconds = timed(lambda: write(path))
+            print(f"{label:<34} {seconds:>7.2f}s {path.stat().st_size / 1e6:>8.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
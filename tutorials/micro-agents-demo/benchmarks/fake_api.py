@@ -0,0 +1,670 @@
+"""
+Offline fake of the YouTube Data API, for benchmarks.
+
+FakeYouTubeAPI answers the requests googleapiclient makes for search.list
+(videos or channels), channels.list (by id or forHandle), videos.list,
+playlistItems.list, resumable videos.insert and thumbnails.set. The
+recorded channel in fixtures/ is served as recorded. Any number of synthetic channels are
+generated on top of it, shaped like the fixtures: steady upload
+schedules, and videos that gain views as they age.
+
+Like the real API it honours part=, fields= masks, maxResults and
+pageToken, and answers a matching If-None-Match with a 304. It can also
+add latency, inject transient errors and enforce a daily quota.
+
+Plug it in wherever the tool makes HTTP connections:
+
+    api = FakeYouTubeAPI(channels=100, latency=0.05)
+    service = YouTubeService("fake-key", transport=api.http)
+    uploader = YouTubeUploader(None, transport=api.http)
+
+The generator is deterministic for a given seed. api.advance(seconds)
+moves its clock forward, so new uploads appear and view counts grow.
+api.stats() counts calls, quota units and bytes per run.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import math
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import cache
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import httplib2
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from bench_field_masks import FIXTURES_DIR, apply_field_mask, parse_field_mask  # noqa: E402
+from youtube import QUOTA_COSTS  # noqa: E402
+
+SEARCH_RESULTS_MAX = 500  # The API stops paging a search after about 500 results
+UPLOAD_INTERVALS_HOURS = (12, 24, 48, 72, 168)
+VIDEO_INDEX_OFFSET = 50_000  # Synthetic video IDs: channel, "v", upload number + offset
+OUTLIER_SHARE = 0.02
+OUTLIER_BOOST = 10.0
+
+SYNTHETIC_CHANNEL_ID = re.compile(r"^UCfake(\d{18})$")
+SYNTHETIC_HANDLE = re.compile(r"^fakechannel(\d+)$")
+SYNTHETIC_VIDEO_ID = re.compile(r"^(\d{5})v(\d{5})$")
+NON_ALNUM = re.compile(r"[^a-z0-9]")
+
+# What error injection picks from: (status, reason), or None for a dropped
+# connection. All of them are worth a retry.
+INJECTED_ERRORS = (
+    (500, "backendError"),
+    (503, "backendError"),
+    (429, "rateLimitExceeded"),
+    (403, "userRateLimitExceeded"),
+    None,
+)
+
+
+def load_fixture(endpoint: str) -> dict:
+    return json.loads((FIXTURES_DIR / f"{endpoint}.json").read_text())
+
+
+def rfc3339(ts: float) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def parse_rfc3339(value: str) -> float:
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+def make_etag(*parts: object) -> str:
+    digest = hashlib.sha1("\0".join(map(str, parts)).encode()).digest()
+    return base64.urlsafe_b64encode(digest).decode()[:27]
+
+
+def error_body(status: int, reason: str, message: str | None = None) -> dict:
+    """An error response, shaped like the API's (see api_error_reason)."""
+    message = message or f"Fake API error: {reason}"
+    domain = "youtube.quota" if reason == "quotaExceeded" else "global"
+    error = {"message": message, "domain": domain, "reason": reason}
+    return {"error": {"code": status, "message": message, "errors": [error]}}
+
+
+def select_parts(item: dict, part: str) -> dict:
+    """What part= leaves of a resource: kind, etag and id, plus the named parts."""
+    keep = {"kind", "etag", "id", *part.split(",")}
+    return {key: value for key, value in item.items() if key in keep}
+
+
+@cache
+def cached_field_mask(mask: str) -> dict:
+    return parse_field_mask(mask)
+
+
+@cache
+def channel_profile(seed: int, k: int) -> tuple[float, float, int, float]:
+    """Synthetic channel k: upload interval (s), schedule phase (s), subscribers, view scale."""
+    rng = random.Random(f"{seed}:channel:{k}")
+    interval = rng.choice(UPLOAD_INTERVALS_HOURS) * 3600.0
+    subscribers = int(rng.lognormvariate(10, 1.5))
+    return interval, rng.uniform(0, interval), subscribers, subscribers * rng.uniform(0.05, 0.5)
+
+
+@dataclass
+class FakeStats:
+    """What the fake served since the last reset_stats()."""
+
+    calls: Counter = field(default_factory=Counter)  # Endpoint -> requests
+    errors: Counter = field(default_factory=Counter)  # Endpoint -> errors returned
+    quota_used: int = 0
+    bytes_sent: int = 0  # Response bodies
+    bytes_received: int = 0  # Request bodies (upload chunks, mostly)
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+
+class FakeHttp:
+    """One connection to a FakeYouTubeAPI: what httplib2.Http is to the real one."""
+
+    def __init__(self, api: FakeYouTubeAPI):
+        self.api = api
+
+    def request(self, uri, method="GET", body=None, headers=None, **kwargs):
+        return self.api.handle(uri, method, body, headers or {})
+
+
+class FakeYouTubeAPI:
+    """A deterministic, in-process YouTube Data API."""
+
+    def __init__(
+        self,
+        channels: int = 100,
+        videos_per_channel: int = 500,
+        latency: float = 0.0,
+        jitter: float = 0.2,
+        error_rate: float = 0.0,
+        daily_quota: int | None = None,
+        upload_bandwidth: float | None = None,
+        seed: int = 42,
+    ):
+        """
+        Args:
+            channels: Synthetic channels (@fakechannel0, @fakechannel1, ...)
+            videos_per_channel: Uploads each synthetic channel starts with
+            latency: Seconds added to every request
+            jitter: Latency varies by up to this fraction either way
+            error_rate: Chance that a request fails with a transient error
+            daily_quota: Units before requests fail with quotaExceeded
+                (None = unlimited)
+            upload_bandwidth: Upload chunks take len / this many seconds
+                (bytes per second; None = instant)
+            seed: Same seed, same channels and videos
+        """
+        if not 0 < videos_per_channel < VIDEO_INDEX_OFFSET:
+            raise ValueError(f"videos_per_channel must be between 1 and {VIDEO_INDEX_OFFSET - 1}")
+        self.channels = channels
+        self.videos_per_channel = videos_per_channel
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.daily_quota = daily_quota
+        self.upload_bandwidth = upload_bandwidth
+        self.seed = seed
+
+        self.started_at = time.time()
+        self.now = self.started_at
+        self.uploads: dict[str, dict] = {}  # Video ID -> metadata, once an upload completes
+        self.thumbnails: dict[str, int] = {}  # Video ID -> thumbnail bytes
+        self._sessions: dict[str, dict] = {}  # upload_id -> {"metadata", "received", ...}
+        self._forced: list[tuple[str | None, tuple[int, str] | None]] = []
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._stats = FakeStats()
+        self._quota_today = 0
+
+        self._load_fixtures()
+
+    def _load_fixtures(self) -> None:
+        """The recorded channel, its uploads and videos; templates for synthetic items."""
+        channel = load_fixture("channels.list")["items"][0]
+        videos = load_fixture("videos.list")["items"]
+        uploads = load_fixture("playlistItems.list")["items"]
+
+        # Shift the recording so its newest upload is from today
+        newest = max(parse_rfc3339(v["snippet"]["publishedAt"]) for v in videos)
+        shift = self.now - 3600 - newest
+        self._recorded_channel = channel
+        self._recorded_handle = channel["snippet"]["customUrl"].lstrip("@").lower()
+        self._recorded_videos = {}
+        for video in videos:
+            published = parse_rfc3339(video["snippet"]["publishedAt"]) + shift
+            snippet = {**video["snippet"], "publishedAt": rfc3339(published)}
+            self._recorded_videos[video["id"]] = {**video, "snippet": snippet}
+        self._recorded_uploads = []
+        for item in uploads:
+            details = item["contentDetails"]
+            published = parse_rfc3339(details["videoPublishedAt"]) + shift
+            self._recorded_uploads.append(
+                {**item, "contentDetails": {**details, "videoPublishedAt": rfc3339(published)}}
+            )
+
+        self._video_template = videos[0]
+        self._upload_template = uploads[0]
+        self._descriptions = [v["snippet"].get("description", "") for v in videos]
+        self._vocabulary = sorted(
+            {word.lower() for v in videos for word in v["snippet"]["title"].split()}
+        )
+
+    # -------------------------------------------------------------------------
+    # Controls
+    # -------------------------------------------------------------------------
+
+    def http(self) -> FakeHttp:
+        """A new connection; pass api.http as a transport."""
+        return FakeHttp(self)
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward: channels upload on schedule, views grow."""
+        with self._lock:
+            self.now += seconds
+
+    def fail_next(
+        self, endpoint: str | None = None, status: int = 503, reason: str = "backendError"
+    ) -> None:
+        """Fail the next request to endpoint (None = any); status 0 drops the connection."""
+        with self._lock:
+            self._forced.append((endpoint, (status, reason) if status else None))
+
+    def stats(self) -> FakeStats:
+        with self._lock:
+            stats = self._stats
+            return FakeStats(
+                Counter(stats.calls),
+                Counter(stats.errors),
+                stats.quota_used,
+                stats.bytes_sent,
+                stats.bytes_received,
+            )
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats = FakeStats()
+
+    # -------------------------------------------------------------------------
+    # Requests
+    # -------------------------------------------------------------------------
+
+    def handle(self, uri: str, method: str, body, headers: dict) -> tuple[httplib2.Response, bytes]:
+        url = urlparse(uri)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        headers = {key.lower(): value for key, value in headers.items()}
+        resource = url.path.split("/v3/", 1)[-1]
+        if method == "PUT":
+            endpoint = "upload.chunk"
+        elif method == "POST":
+            endpoint = "thumbnails.set" if resource == "thumbnails/set" else f"{resource}.insert"
+        else:
+            endpoint = f"{resource}.list"
+        if hasattr(body, "read"):
+            body = body.read()  # MediaFileUpload sends file chunks as streams
+        if isinstance(body, str):
+            body = body.encode()
+
+        delay = self.latency * random.uniform(1 - self.jitter, 1 + self.jitter)
+        if endpoint == "upload.chunk" and self.upload_bandwidth and body:
+            delay += len(body) / self.upload_bandwidth
+        if delay > 0:
+            time.sleep(delay)
+
+        cost = QUOTA_COSTS.get(endpoint, 0)
+        with self._lock:
+            self._stats.calls[endpoint] += 1
+            self._stats.bytes_received += len(body or b"")
+            error = self._injected_error(endpoint)
+            if error is False and self.daily_quota is not None:
+                if self._quota_today + cost > self.daily_quota:
+                    error = (403, "quotaExceeded")
+            if error is False:
+                self._quota_today += cost
+                self._stats.quota_used += cost
+            else:
+                self._stats.errors[endpoint] += 1
+        if error is None:
+            raise ConnectionResetError(f"Connection reset by peer (injected, {endpoint})")
+        if error:
+            return self._error(*error)
+
+        handlers = {
+            "search.list": self._search,
+            "channels.list": self._channels,
+            "videos.list": self._videos,
+            "playlistItems.list": self._playlist_items,
+            "videos.insert": self._start_upload,
+            "upload.chunk": self._upload_chunk,
+            "thumbnails.set": self._set_thumbnail,
+        }
+        handler = handlers.get(endpoint)
+        if handler is None:
+            return self._error(404, "notFound", f"Not implemented by the fake: {endpoint}")
+        status, data, extra_headers = handler(params, body, headers)
+
+        if status == 200 and method == "GET":
+            if data["etag"] == headers.get("if-none-match"):
+                return self._respond(304, None)
+            if params.get("fields"):
+                data = apply_field_mask(data, cached_field_mask(params["fields"]))
+        return self._respond(status, data, extra_headers)
+
+    def _injected_error(self, endpoint: str):
+        """(status, reason) to fail with, None to drop the connection, or False."""
+        for i, (forced_endpoint, error) in enumerate(self._forced):
+            if forced_endpoint in (None, endpoint):
+                del self._forced[i]
+                return error
+        if self.error_rate and self._rng.random() < self.error_rate:
+            return self._rng.choice(INJECTED_ERRORS)
+        return False
+
+    def _respond(self, status: int, data, headers: dict | None = None):
+        content = json.dumps(data).encode() if data is not None else b""
+        with self._lock:
+            self._stats.bytes_sent += len(content)
+        response = httplib2.Response({"status": status, **(headers or {})})
+        if data is not None:
+            response["content-type"] = "application/json; charset=UTF-8"
+        return response, content
+
+    def _error(self, status: int, reason: str, message: str | None = None):
+        return self._respond(status, error_body(status, reason, message))
+
+    @staticmethod
+    def _list_response(kind: str, items: list[dict], total: int, page_token: str | None) -> dict:
+        response = {
+            "kind": f"youtube#{kind}ListResponse",
+            "etag": make_etag(kind, page_token, *(item["etag"] for item in items)),
+            "pageInfo": {"totalResults": total, "resultsPerPage": len(items)},
+            "items": items,
+        }
+        if page_token:
+            response["nextPageToken"] = page_token
+        return response
+
+    @staticmethod
+    def _page(params: dict, default_size: int = 5) -> tuple[int, int]:
+        """(offset, size) from pageToken and maxResults."""
+        offset = int(params["pageToken"][1:]) if params.get("pageToken") else 0
+        return offset, min(50, int(params.get("maxResults", default_size)))
+
+    # -------------------------------------------------------------------------
+    # Synthetic channels and videos
+    # -------------------------------------------------------------------------
+
+    def _newest_upload(self, k: int) -> int:
+        """Synthetic channel k's newest upload number (its first is 1 - videos_per_channel)."""
+        interval, phase, _, _ = channel_profile(self.seed, k)
+        return math.floor((self.now - self.started_at + phase) / interval)
+
+    def _published_at(self, k: int, n: int) -> float:
+        interval, phase, _, _ = channel_profile(self.seed, k)
+        return self.started_at - phase + n * interval
+
+    def _video_id(self, k: int, n: int) -> str:
+        return f"{k:05d}v{n + VIDEO_INDEX_OFFSET:05d}"
+
+    def _channel_item(self, k: int) -> dict:
+        _, _, subscribers, view_scale = channel_profile(self.seed, k)
+        videos = self._newest_upload(k) + self.videos_per_channel
+        template = self._recorded_channel
+        channel_id = f"UCfake{k:018d}"
+        title = f"Fake Channel {k}"
+        stats = {
+            **template["statistics"],
+            "subscriberCount": str(subscribers),
+            "videoCount": str(videos),
+            "viewCount": str(int(view_scale * videos)),
+        }
+        return {
+            **template,
+            "etag": make_etag(channel_id, videos),
+            "id": channel_id,
+            "snippet": {
+                **template["snippet"],
+                "title": title,
+                "customUrl": f"@fakechannel{k}",
+                "localized": {**template["snippet"]["localized"], "title": title},
+            },
+            "contentDetails": {"relatedPlaylists": {"likes": "", "uploads": f"UUfake{k:018d}"}},
+            "statistics": stats,
+        }
+
+    def _video_item(self, k: int, n: int) -> dict:
+        video_id = self._video_id(k, n)
+        rng = random.Random(f"{self.seed}:video:{k}:{n}")
+        _, _, _, view_scale = channel_profile(self.seed, k)
+        published = self._published_at(k, n)
+        age_hours = max(0.0, (self.now - published) / 3600)
+
+        quality = rng.lognormvariate(0, 0.5)
+        if rng.random() < OUTLIER_SHARE:
+            quality *= OUTLIER_BOOST
+        # Most views arrive in the first few days, then a long tail
+        curve = (1 - math.exp(-age_hours / 72)) * (1 + 0.1 * math.log1p(age_hours / 24))
+        views = int(view_scale * quality * curve)
+        likes = int(views * rng.uniform(0.01, 0.05))
+        comments = int(likes * rng.uniform(0.02, 0.1))
+
+        title = " ".join(rng.sample(self._vocabulary, 6)).capitalize()
+        template = self._video_template
+        thumbnails = {
+            size: {**thumbnail, "url": thumbnail["url"].replace(template["id"], video_id)}
+            for size, thumbnail in template["snippet"]["thumbnails"].items()
+        }
+        description = rng.choice(self._descriptions)
+        return {
+            **template,
+            "etag": make_etag(video_id, views, likes, comments),
+            "id": video_id,
+            "snippet": {
+                **template["snippet"],
+                "publishedAt": rfc3339(published),
+                "channelId": f"UCfake{k:018d}",
+                "channelTitle": f"Fake Channel {k}",
+                "title": title,
+                "description": description,
+                "thumbnails": thumbnails,
+                "tags": rng.sample(self._vocabulary, rng.randint(0, 8)),
+                "localized": {"title": title, "description": description},
+            },
+            "statistics": {
+                "viewCount": str(views),
+                "likeCount": str(likes),
+                "favoriteCount": "0",
+                "commentCount": str(comments),
+            },
+        }
+
+    def _upload_item(self, k: int, n: int) -> dict:
+        video_id = self._video_id(k, n)
+        return {
+            **self._upload_template,
+            "etag": make_etag("upload", video_id),
+            "id": make_etag("playlistItem", video_id),
+            "contentDetails": {
+                "videoId": video_id,
+                "videoPublishedAt": rfc3339(self._published_at(k, n)),
+            },
+        }
+
+    # -------------------------------------------------------------------------
+    # Endpoints: each returns (status, body, headers)
+    # -------------------------------------------------------------------------
+
+    def _channels(self, params: dict, body, headers: dict):
+        if "forHandle" in params:
+            handle = params["forHandle"].lstrip("@").lower()
+            match = SYNTHETIC_HANDLE.match(handle)
+            if handle == self._recorded_handle:
+                keys = [self._recorded_channel["id"]]
+            else:
+                keys = [f"UCfake{int(match.group(1)):018d}"] if match else []
+        elif "id" in params:
+            keys = params["id"].split(",")
+            if len(keys) > 50:
+                return self._error_status(400, "Too many IDs")
+        else:
+            return self._error_status(400, "No filter selected")
+
+        items = []
+        for channel_id in keys:
+            match = SYNTHETIC_CHANNEL_ID.match(channel_id)
+            if channel_id == self._recorded_channel["id"]:
+                items.append(self._recorded_channel)
+            elif match and int(match.group(1)) < self.channels:
+                items.append(self._channel_item(int(match.group(1))))
+        items = [select_parts(item, params.get("part", "")) for item in items]
+        return 200, self._list_response("channel", items, len(items), None), None
+
+    def _videos(self, params: dict, body, headers: dict):
+        ids = params.get("id", "").split(",") if params.get("id") else []
+        if len(ids) > 50:
+            return self._error_status(400, "Too many IDs")
+
+        items = []
+        for video_id in ids:
+            match = SYNTHETIC_VIDEO_ID.match(video_id)
+            if video_id in self._recorded_videos:
+                items.append(self._recorded_videos[video_id])
+            elif match:
+                k, n = int(match.group(1)), int(match.group(2)) - VIDEO_INDEX_OFFSET
+                if k < self.channels and -self.videos_per_channel < n <= self._newest_upload(k):
+                    items.append(self._video_item(k, n))
+        items = [select_parts(item, params.get("part", "")) for item in items]
+        return 200, self._list_response("video", items, len(items), None), None
+
+    def _playlist_items(self, params: dict, body, headers: dict):
+        playlist_id = params.get("playlistId", "")
+        offset, size = self._page(params)
+        match = SYNTHETIC_CHANNEL_ID.match("UC" + playlist_id[2:])
+
+        if playlist_id == self._recorded_channel["contentDetails"]["relatedPlaylists"]["uploads"]:
+            total = len(self._recorded_uploads)
+            items = self._recorded_uploads[offset : offset + size]
+        elif playlist_id.startswith("UU") and match and int(match.group(1)) < self.channels:
+            k = int(match.group(1))
+            newest = self._newest_upload(k)
+            total = newest + self.videos_per_channel
+            items = [
+                self._upload_item(k, newest - i) for i in range(offset, min(offset + size, total))
+            ]
+        else:
+            return self._error_status(404, "playlistNotFound")
+
+        items = [select_parts(item, params.get("part", "")) for item in items]
+        next_token = f"P{offset + size}" if offset + size < total else None
+        return 200, self._list_response("playlistItem", items, total, next_token), None
+
+    def _search(self, params: dict, body, headers: dict):
+        if params.get("type") == "channel":
+            return self._search_channels(params)
+        if params.get("type", "video") != "video" or not self.channels:
+            return 200, self._list_response("search", [], 0, None), None
+        offset, size = self._page(params)
+        results = self._search_results(
+            params.get("q", ""),
+            params.get("order", "relevance"),
+            parse_rfc3339(params["publishedAfter"]) if "publishedAfter" in params else None,
+        )
+
+        items = []
+        for k, n in results[offset : offset + size]:
+            video_id = self._video_id(k, n)
+            item = {
+                "kind": "youtube#searchResult",
+                "etag": make_etag("search", video_id),
+                "id": {"kind": "youtube#video", "videoId": video_id},
+                "snippet": {
+                    "publishedAt": rfc3339(self._published_at(k, n)),
+                    "channelId": f"UCfake{k:018d}",
+                    "channelTitle": f"Fake Channel {k}",
+                },
+            }
+            items.append(select_parts(item, params.get("part", "")))
+        total = random.Random(f"{self.seed}:total:{params.get('q')}").randint(10_000, 1_000_000)
+        next_token = f"P{offset + size}" if offset + size < len(results) else None
+        return 200, self._list_response("search", items, total, next_token), None
+
+    def _search_channels(self, params: dict):
+        # Channels whose title matches the query, ignoring case, spaces and
+        # punctuation - so a legacy /c/fake-channel-3 finds "Fake Channel 3"
+        query = NON_ALNUM.sub("", params.get("q", "").lower())
+        titles = {self._recorded_channel["id"]: self._recorded_channel["snippet"]["title"]}
+        titles.update((f"UCfake{k:018d}", f"Fake Channel {k}") for k in range(self.channels))
+        items = [
+            {
+                "kind": "youtube#searchResult",
+                "etag": make_etag("search", channel_id),
+                "id": {"kind": "youtube#channel", "channelId": channel_id},
+                "snippet": {"channelId": channel_id, "title": title},
+            }
+            for channel_id, title in titles.items()
+            if query and NON_ALNUM.sub("", title.lower()) == query
+        ][: int(params.get("maxResults", 5))]
+        items = [select_parts(item, params.get("part", "")) for item in items]
+        return 200, self._list_response("search", items, len(items), None), None
+
+    def _search_results(self, query: str, order: str, published_after: float | None):
+        """(channel, upload number) of every result, in order."""
+        rng = random.Random(f"{self.seed}:search:{query}")
+        results = []
+        for _ in range(SEARCH_RESULTS_MAX):
+            k = rng.randrange(self.channels)
+            newest = self._newest_upload(k)
+            oldest = 1 - self.videos_per_channel
+            if published_after is not None:
+                interval, phase, _, _ = channel_profile(self.seed, k)
+                first = math.ceil((published_after - self.started_at + phase) / interval)
+                oldest = max(oldest, first)
+            if oldest <= newest:
+                results.append((k, rng.randint(oldest, newest)))
+        results = list(dict.fromkeys(results))
+
+        if order == "date":
+            results.sort(key=lambda kn: self._published_at(*kn), reverse=True)
+        elif order == "viewCount":
+            views = {kn: int(self._video_item(*kn)["statistics"]["viewCount"]) for kn in results}
+            results.sort(key=views.__getitem__, reverse=True)
+        return results
+
+    def _start_upload(self, params: dict, body, headers: dict):
+        metadata = json.loads(body) if body and params.get("uploadType") == "resumable" else {}
+        with self._lock:
+            upload_id = f"{len(self._sessions) + 1:09d}"
+            self._sessions[upload_id] = {"metadata": metadata, "received": 0}
+        location = (
+            "https://youtube.googleapis.com/upload/youtube/v3/videos"
+            f"?uploadType=resumable&upload_id={upload_id}"
+        )
+        if params.get("uploadType") != "resumable":
+            # A one-shot upload: the whole file was the body
+            return self._finish_upload(upload_id)
+        return 200, None, {"location": location}
+
+    def _upload_chunk(self, params: dict, body, headers: dict):
+        session = self._sessions.get(params.get("upload_id", ""))
+        if session is None:
+            return self._error_status(404, "uploadNotFound")
+        if "video_id" in session:
+            return 200, session["response"], None
+
+        content_range = headers.get("content-range", "")
+        match = re.match(r"bytes (?:(\d+)-(\d+)|\*)/(\d+|\*)", content_range)
+        if match is None:
+            return self._error_status(400, "badContentRange")
+        first, last, total = match.groups()
+        with self._lock:
+            if first is not None and int(first) <= session["received"]:
+                session["received"] = max(session["received"], int(last) + 1)
+            complete = total != "*" and session["received"] == int(total)
+        if complete:
+            return self._finish_upload(params["upload_id"])
+
+        extra_headers = {}
+        if session["received"]:
+            extra_headers["range"] = f"bytes=0-{session['received'] - 1}"
+        return 308, None, extra_headers
+
+    def _finish_upload(self, upload_id: str):
+        session = self._sessions[upload_id]
+        video_id = f"up{upload_id}"
+        response = {
+            "kind": "youtube#video",
+            "etag": make_etag("upload", video_id),
+            "id": video_id,
+            "snippet": session["metadata"].get("snippet", {}),
+            "status": {**session["metadata"].get("status", {}), "uploadStatus": "uploaded"},
+        }
+        with self._lock:
+            session.update(video_id=video_id, response=response)
+            self.uploads[video_id] = session["metadata"]
+        return 200, response, None
+
+    def _set_thumbnail(self, params: dict, body, headers: dict):
+        video_id = params.get("videoId", "")
+        if video_id not in self.uploads:
+            return self._error_status(404, "videoNotFound")
+        with self._lock:
+            self.thumbnails[video_id] = len(body or b"")
+        url = f"https://i.ytimg.com/vi/{video_id}/default.jpg"
+        item = {"default": {"url": url, "width": 120, "height": 90}}
+        return 200, {"kind": "youtube#thumbnailSetResponse", "items": [item]}, None
+
+    @staticmethod
+    def _error_status(status: int, reason: str):
+        return status, error_body(status, reason), None
@@ -5,6 +5,7 @@
 #   "google-auth-oauthlib>=1.0.0",
 #   "youtube-transcript-api>=0.6.0",
 #   "pyyaml>=6.0",
+#   "numpy>=1.26",
 # ]
 # ///
 """
@@ -12,48 +13,251 @@ YouTube Tool - Research, search, and upload videos.
 
 Usage:
     uv run youtube.py get_channel_videos @mkbhd --days 30
+    uv run youtube.py sync_channel @mkbhd --days 30
+    uv run youtube.py watch --file watchlist.txt
+    uv run youtube.py compare_channels --file competitors.txt --days 90
     uv run youtube.py search_videos "AI agents" --max 20
     uv run youtube.py get_transcript VIDEO_ID
+    uv run youtube.py get_transcripts --file video_ids.txt --workers 4
+    uv run youtube.py search_transcripts '"link in the description"'
+    uv run youtube.py trending --hours 48
     uv run youtube.py upload video.mp4 --title "My Video" --description "..."
+    uv run youtube.py upload_batch --workers 2
+    uv run youtube.py quota
+    uv run youtube.py serve --stdio
 
 Environment:
     YOUTUBE_API_KEY - Required for research commands.
     YOUTUBE_CLIENT_SECRETS - Path to OAuth client_secrets.json (for upload).
+    YOUTUBE_DAILY_QUOTA - Daily quota units to allow (default: 10000).
+    YOUTUBE_MAX_RPS - Max API requests per second (default: 10).
+    YOUTUBE_DAEMON - Set to 0 to run every command in-process (no daemon).
 """
 
 from __future__ import annotations
 
 import argparse
+import bisect
+import contextvars
+import hashlib
+import importlib
+import inspect
 import json
+import math
+import mmap
 import os
+import random
 import re
+import sqlite3
 import statistics
 import sys
-from dataclasses import asdict, dataclass, field
+import threading
+import time
+import zlib
+from array import array
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, fields, is_dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-import yaml
+try:
+    import fcntl  # Cross-process lock for the shared quota file
+except ImportError:  # Windows
+    fcntl = None
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+# Wall-clock start, for --timing
+STARTED_AT = time.perf_counter()
+
+# Small, and needed by every `except HttpError`. Everything heavier
+# (discovery, httplib2, OAuth, transcripts, yaml) is imported on first use
+# via lazy_import, so a cached lookup never pays for it.
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaFileUpload
-from youtube_transcript_api import YouTubeTranscriptApi
-from youtube_transcript_api._errors import (
-    NoTranscriptFound,
-    TranscriptsDisabled,
-    VideoUnavailable,
-)
 
 
 # =============================================================================
 # Helpers
 # =============================================================================
 
+# Seconds spent in each deferred import, for --timing
+IMPORT_TIMES: dict[str, float] = {}
+
+
+def lazy_import(module: str) -> Any:
+    """Import a heavy dependency on first use, recording how long it took.
+
+    Always goes through import_module, never straight to sys.modules: a
+    module another thread is still importing is in sys.modules half
+    initialized, and import_module waits for it to finish.
+    """
+    loaded = module in sys.modules
+    started = time.perf_counter()
+    imported = importlib.import_module(module)
+    if not loaded:
+        IMPORT_TIMES.setdefault(module, time.perf_counter() - started)
+    return imported
+
+
+# Quota cost per API call, in units. The default daily quota is 10,000 units.
+# https://developers.google.com/youtube/v3/determine_quota_cost
+QUOTA_COSTS = {
+    "search.list": 100,
+    "channels.list": 1,
+    "playlistItems.list": 1,
+    "videos.list": 1,
+    "videos.insert": 1600,
+    "thumbnails.set": 50,
+}
+
+# Channel inputs: youtube.com/@handle, /channel/UC..., /c/name, or a bare handle.
+# Compiled once - compare_channels and watch parse hundreds of inputs per run.
+CHANNEL_URL_PATTERNS = (
+    re.compile(r"(?:https?://)?(?:www\.)?youtube\.com/@([\w-]+)"),
+    re.compile(r"(?:https?://)?(?:www\.)?youtube\.com/channel/(UC[\w-]+)"),
+    re.compile(r"(?:https?://)?(?:www\.)?youtube\.com/c/([\w-]+)"),
+)
+BARE_HANDLE_PATTERN = re.compile(r"^[\w-]+$")
+
+# Partial-response masks: only the fields the data classes read. etag keeps
+# cache revalidation working and nextPageToken keeps paging working.
+# https://developers.google.com/youtube/v3/getting-started#partial
+FIELD_MASKS = {
+    "channels.list": (
+        "etag,items(id,snippet(title,customUrl),statistics(subscriberCount,videoCount),"
+        "contentDetails/relatedPlaylists/uploads)"
+    ),
+    "search.list": "etag,nextPageToken,pageInfo/totalResults,items(id/videoId,snippet/channelId)",
+    "playlistItems.list": "etag,nextPageToken,items/contentDetails(videoId,videoPublishedAt)",
+    "videos.list": (
+        "etag,items(id,snippet(title,channelTitle,publishedAt,tags),"
+        "statistics(viewCount,likeCount,commentCount))"
+    ),
+}
+
+# HTTP statuses worth retrying: rate limiting and server-side failures
+TRANSIENT_STATUSES = {429, 500, 502, 503, 504}
+
+# 403 reasons that mean "slow down" (retry) vs "done for today" (don't)
+RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}
+QUOTA_EXCEEDED_REASONS = {"quotaExceeded", "dailyLimitExceeded"}
+
+
+def api_error_reason(error: HttpError) -> str | None:
+    """The machine-readable reason from an API error body, e.g. "quotaExceeded"."""
+    try:
+        return json.loads(error.content)["error"]["errors"][0]["reason"]
+    except (ValueError, KeyError, IndexError, TypeError):
+        return None
+
+
+def is_transient_error(error: Exception) -> bool:
+    """True for errors a retry can fix (not bad requests or exhausted quota)."""
+    if isinstance(error, HttpError):
+        if error.resp.status == 403:
+            return api_error_reason(error) in RATE_LIMIT_REASONS
+        return error.resp.status in TRANSIENT_STATUSES
+    return isinstance(error, (OSError, TimeoutError))
+
+
+@dataclass
+class QuotaScope:
+    """Quota units spent inside one operation (see YouTubeService._track_quota)."""
+
+    units: int = 0
+
+
+# Open quota scopes for the current call stack. A ContextVar, not a plain
+# attribute, so concurrent operations on one service each count their own.
+_quota_scopes: contextvars.ContextVar[tuple[QuotaScope, ...]] = contextvars.ContextVar(
+    "quota_scopes", default=()
+)
+
+
+def submit_with_context(pool: ThreadPoolExecutor, fn: Callable, *args: Any, **kwargs: Any):
+    """pool.submit that carries the caller's context (and quota scopes) along."""
+    return pool.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+# How outlier_score is computed: "zscore" (of raw views, against the mean and
+# standard deviation) or "robust" (see robust_outlier_scores)
+OUTLIER_SCORES = ("zscore", "robust")
+
+
+def view_stats(videos: list[Video]) -> tuple[float, float]:
+    """(mean, standard deviation) of the videos' view counts."""
+    view_counts = [v.view_count for v in videos]
+    std_dev_views = statistics.stdev(view_counts) if len(view_counts) > 1 else 0.0
+    return statistics.mean(view_counts), std_dev_views
+
+
+def score_outliers(
+    videos: list[Video], method: str = "zscore", groups: list[str] | None = None
+) -> tuple[float, float]:
+    """Set each video's outlier_score and is_outlier, scored within its
+    channel, and sort by score; returns (mean views, standard deviation).
+
+    groups is each video's channel ID (display names can collide); by
+    default the videos are one channel's. Robust scores for many channels
+    come from one grouped pass, so small channels borrow the pooled age
+    slope (see robust_outlier_scores).
+    """
+    avg_views, std_dev_views = view_stats(videos)
+    channels: dict[str | None, int] = {}
+    codes = [channels.setdefault(group, len(channels)) for group in groups or [None] * len(videos)]
+
+    if method == "robust":
+        np = lazy_import("numpy")
+        now = datetime.now(timezone.utc)
+        ages = [
+            (now - datetime.fromisoformat(v.published_at)).total_seconds() / 86400
+            for v in videos
+        ]
+        scores = robust_outlier_scores(
+            np.array([v.view_count for v in videos]), np.array(codes), np.array(ages)
+        )
+        for video, z, expected in zip(
+            videos, scores.z.tolist(), scores.expected_views.tolist()
+        ):
+            video.outlier_score = round(z, 2)
+            video.is_outlier = video.outlier_score > 2.0
+            video.expected_views = round(expected)
+    else:
+        by_channel: dict[int, list[Video]] = {}
+        for video, code in zip(videos, codes):
+            by_channel.setdefault(code, []).append(video)
+        for channel_videos in by_channel.values():
+            mean, std_dev = (
+                (avg_views, std_dev_views) if len(by_channel) == 1 else view_stats(channel_videos)
+            )
+            for video in channel_videos:
+                if std_dev > 0:
+                    video.outlier_score = round((video.view_count - mean) / std_dev, 2)
+                    video.is_outlier = video.outlier_score > 2.0
+                else:
+                    video.outlier_score = 0.0
+                    video.is_outlier = False
+
+    videos.sort(key=lambda v: v.outlier_score or 0, reverse=True)
+    return avg_views, std_dev_views
+
+
+def read_channel_file(path: str) -> list[str]:
+    """Channels from a file, one per line (# starts a comment)."""
+    channels = []
+    with open(path) as f:
+        for line in f:
+            line = line.split("#", 1)[0].strip()
+            if line:
+                channels.append(line)
+    return channels
+
+
+def sync_cutoff(now: float, days_back: int) -> datetime:
+    """Start of a sync window: days_back before now, to the second."""
+    return datetime.fromtimestamp(int(now), timezone.utc) - timedelta(days=days_back)
+
 
 def parse_markdown_metadata(content: str) -> dict:
     """Parse markdown file with YAML frontmatter.
@@ -81,6 +285,7 @@ def parse_markdown_metadata(content: str) -> dict:
 
     frontmatter_str, body = match.groups()
 
+    yaml = lazy_import("yaml")
     try:
         metadata = yaml.safe_load(frontmatter_str) or {}
     except yaml.YAMLError:
@@ -95,7 +300,7 @@ def parse_markdown_metadata(content: str) -> dict:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class Video:
     """A YouTube video with computed metrics."""
 
@@ -112,9 +317,14 @@ class Video:
     outlier_score: float | None = None
     is_outlier: bool | None = None
     tags: list[str] = field(default_factory=list)
+    views_per_hour: float | None = None  # Measured from stored snapshots, if any
+    expected_views: int | None = None  # Typical for the channel at this age (robust scoring)
 
 
-@dataclass
+VIDEO_FIELDS = tuple(f.name for f in fields(Video))
+
+
+@dataclass(slots=True)
 class ChannelInfo:
     """Information about a YouTube channel."""
 
@@ -123,6 +333,7 @@ class ChannelInfo:
     subscriber_count: int
     total_video_count: int
     handle: str | None = None
+    uploads_playlist_id: str | None = None
 
 
 @dataclass
@@ -135,6 +346,23 @@ class ChannelVideosResponse:
     avg_views: float
     std_dev_views: float
     videos: list[Video]
+    quota_used: int = 0
+
+
+@dataclass
+class ChannelSyncResponse:
+    """Response from sync_channel."""
+
+    channel_id: str
+    channel_name: str
+    period_days: int
+    new_videos: int
+    refreshed_videos: int
+    total_videos: int
+    avg_views: float
+    std_dev_views: float
+    videos: list[Video]
+    quota_used: int = 0
 
 
 @dataclass
@@ -146,394 +374,2605 @@ class SearchResponse:
     avg_views: float
     top_channels: list[dict]
     videos: list[Video]
+    quota_used: int = 0
+
+
+@dataclass
+class SearchStats:
+    """Running aggregates over streamed search results."""
+
+    total_results: int = 0
+    video_count: int = 0
+    total_views: int = 0
+    channel_counts: dict[str, int] = field(default_factory=dict)
+
+    def add(self, video: Video) -> None:
+        self.video_count += 1
+        self.total_views += video.view_count
+        self.channel_counts[video.channel_name] = (
+            self.channel_counts.get(video.channel_name, 0) + 1
+        )
+
+    @property
+    def avg_views(self) -> float:
+        return self.total_views / self.video_count if self.video_count else 0.0
+
+    def top_channels(self, n: int = 5) -> list[dict]:
+        return [
+            {"name": name, "video_count": count}
+            for name, count in sorted(
+                self.channel_counts.items(), key=lambda x: x[1], reverse=True
+            )[:n]
+        ]
+
+
+@dataclass
+class CompareChannelsResponse:
+    """Response from compare_channels."""
+
+    period_days: int
+    channels: list[dict]
+    top_outliers: list[Video]
+    quota_used: int = 0
 
 
 # =============================================================================
-# YouTube Service
+# Analytics
 # =============================================================================
 
+# Robust scores are on log views (views are heavy-tailed), scaled so that
+# 1 MAD-sigma matches a standard deviation for normally distributed data
+MAD_TO_SIGMA = 1.4826
 
-class YouTubeService:
-    """YouTube Data API v3 wrapper providing research tools."""
+# Channels with fewer videos than this borrow the dataset-wide age slope
+MIN_VIDEOS_FOR_AGE_FIT = 10
 
-    def __init__(self, api_key: str):
-        self.youtube = build("youtube", "v3", developerKey=api_key)
 
-    def resolve_channel(self, channel_input: str) -> ChannelInfo | dict:
-        """Resolve a channel from @handle, URL, or channel ID."""
-        try:
-            channel_id = self._parse_channel_input(channel_input)
-            if channel_id is None:
-                return {"error": f"Could not parse channel input: {channel_input}"}
-
-            if channel_id.startswith("@"):
-                search_response = (
-                    self.youtube.search()
-                    .list(part="snippet", q=channel_id, type="channel", maxResults=1)
-                    .execute()
-                )
-                if not search_response.get("items"):
-                    return {"error": f"Channel not found: {channel_id}"}
-                channel_id = search_response["items"][0]["snippet"]["channelId"]
-
-            response = (
-                self.youtube.channels()
-                .list(part="snippet,statistics", id=channel_id)
-                .execute()
-            )
+@dataclass
+class OutlierScores:
+    """Per-video robust outlier statistics (NumPy arrays, one entry per video)."""
 
-            if not response.get("items"):
-                return {"error": f"Channel not found: {channel_id}"}
+    log_z: Any  # (log views - channel median) / channel MAD-sigma
+    z: Any  # The same, after adjusting for video age: the outlier score
+    expected_views: Any  # Typical views for this channel at this video's age
+    baseline_views: Any  # Channel median views
 
-            item = response["items"][0]
-            snippet = item["snippet"]
-            stats = item["statistics"]
 
-            return ChannelInfo(
-                channel_id=item["id"],
-                handle=snippet.get("customUrl"),
-                name=snippet["title"],
-                subscriber_count=int(stats.get("subscriberCount", 0)),
-                total_video_count=int(stats.get("videoCount", 0)),
-            )
+def grouped_median(values: Any, groups: Any, n_groups: int) -> Any:
+    """Median of values within each group (NaN for an empty group).
 
-        except HttpError as e:
-            return {"error": f"YouTube API error: {e.reason}"}
-        except Exception as e:
-            return {"error": f"Error resolving channel: {str(e)}"}
+    groups holds integer codes 0..n_groups-1. All groups are sorted at
+    once, as a single float key: group code + the value scaled into
+    [0, 0.5). That is an order of magnitude faster than np.lexsort and
+    loses nothing that matters for a median (~1e-10 of the value range).
+    """
+    np = lazy_import("numpy")
+    counts = np.bincount(groups, minlength=n_groups)
+    medians = np.full(n_groups, np.nan)
+    if len(values) == 0:
+        return medians
+
+    low_value, value_range = values.min(), values.max() - values.min()
+    if value_range > 0:
+        scale = 0.5 / value_range
+        keys = np.sort(groups + (values - low_value) * scale)
+        ordered = (keys - np.floor(keys)) / scale + low_value
+    else:
+        ordered = np.full(len(values), low_value, dtype=np.float64)
+
+    starts = np.cumsum(counts) - counts
+    present = counts > 0
+    low = (starts + (counts - 1) // 2)[present]
+    high = (starts + counts // 2)[present]
+    medians[present] = (ordered[low] + ordered[high]) / 2
+    return medians
+
+
+def robust_outlier_scores(views: Any, groups: Any, ages_days: Any) -> OutlierScores:
+    """Robust, age-adjusted outlier scores for many channels' videos at once.
+
+    Args:
+        views: View counts
+        groups: Channel of each video, as integer codes 0..n-1
+        ages_days: Days since each video was published
+
+    Per channel (grouped operations over the whole dataset, no Python loop):
+    log views are fitted against log age by least squares, so older videos
+    aren't outliers just for having had longer to collect views. The
+    residuals are then centred on their median and scaled by their median
+    absolute deviation (MAD), which - unlike the standard deviation - the
+    outliers being looked for can't inflate.
+    """
+    np = lazy_import("numpy")
+    groups = np.asarray(groups, dtype=np.int64)
+    n_groups = int(groups.max()) + 1 if len(groups) else 0
+    y = np.log1p(np.asarray(views, dtype=np.float64))
+    x = np.log1p(np.maximum(np.asarray(ages_days, dtype=np.float64), 0))
+
+    def sums(values: Any) -> Any:
+        return np.bincount(groups, weights=values, minlength=n_groups)
+
+    # Per-channel least squares of y on x, from grouped sums
+    n = np.bincount(groups, minlength=n_groups).astype(np.float64)
+    sx, sy, sxx, sxy = sums(x), sums(y), sums(x * x), sums(x * y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_x, mean_y = sx / n, sy / n
+        var_x = sxx - sx * mean_x
+        slope = (sxy - sx * mean_y) / var_x
+
+        # Small or single-age channels: the pooled within-channel slope
+        pooled_var = var_x[n > 0].sum()
+        pooled_slope = (sxy - sx * mean_y)[n > 0].sum() / pooled_var if pooled_var > 0 else 0.0
+        fit = (n >= MIN_VIDEOS_FOR_AGE_FIT) & (var_x > 1e-9)
+        slope = np.where(fit, slope, pooled_slope)
+
+    trend = mean_y[groups] + slope[groups] * (x - mean_x[groups])
+    residual = y - trend
+
+    def robust_z(values: Any) -> tuple[Any, Any]:
+        center = grouped_median(values, groups, n_groups)
+        deviation = np.abs(values - center[groups])
+        sigma = MAD_TO_SIGMA * grouped_median(deviation, groups, n_groups)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z = np.where(sigma[groups] > 0, (values - center[groups]) / sigma[groups], 0.0)
+        return z, center
+
+    log_z, log_center = robust_z(y)
+    z, residual_center = robust_z(residual)
+
+    return OutlierScores(
+        log_z=log_z,
+        z=z,
+        expected_views=np.expm1(trend + residual_center[groups]),
+        baseline_views=np.expm1(log_center[groups]),
+    )
 
-    def get_channel_videos(
-        self, channel_id: str, days_back: int = 30, max_results: int = 50
-    ) -> ChannelVideosResponse | dict:
-        """Get videos from a channel with performance metrics and outlier analysis."""
-        try:
-            channel_response = (
-                self.youtube.channels().list(part="snippet", id=channel_id).execute()
-            )
-            if not channel_response.get("items"):
-                return {"error": f"Channel not found: {channel_id}"}
 
-            channel_name = channel_response["items"][0]["snippet"]["title"]
-            published_after = datetime.now(timezone.utc) - timedelta(days=days_back)
+# =============================================================================
+# Video Table
+# =============================================================================
 
-            search_response = (
-                self.youtube.search()
-                .list(
-                    part="id",
-                    channelId=channel_id,
-                    type="video",
-                    order="date",
-                    publishedAfter=published_after.isoformat(),
-                    maxResults=max_results,
-                )
-                .execute()
-            )
+# VideoTable's typed columns (array typecodes). None and missing values
+# are NaN in float columns and -1 in is_outlier.
+VIDEO_TABLE_COLUMNS = {
+    "channel": "I",  # Index into channel_names
+    "published_at": "q",  # Unix seconds
+    "view_count": "q",
+    "like_count": "q",
+    "comment_count": "q",
+    "engagement_rate": "d",
+    "views_per_day": "d",
+    "outlier_score": "d",
+    "is_outlier": "b",
+    "views_per_hour": "d",
+    "expected_views": "d",
+}
+
+
+def parse_video_item(item: dict) -> dict | None:
+    """A videos.list item as Video fields (None if it's missing any)."""
+    try:
+        snippet = item["snippet"]
+        stats = item.get("statistics", {})
+
+        video_id = item["id"]
+        published_at = datetime.fromisoformat(snippet["publishedAt"].replace("Z", "+00:00"))
+
+        view_count = int(stats.get("viewCount", 0))
+        like_count = int(stats.get("likeCount", 0))
+        comment_count = int(stats.get("commentCount", 0))
+
+        engagement_rate = 0.0
+        if view_count > 0:
+            engagement_rate = (like_count + comment_count) / view_count
+
+        days_since_published = (datetime.now(timezone.utc) - published_at).days
+        views_per_day = view_count / max(days_since_published, 1)
+
+        return {
+            "video_id": video_id,
+            "title": snippet["title"],
+            "url": f"https://www.youtube.com/watch?v={video_id}",
+            "channel_name": snippet["channelTitle"],
+            "published_at": published_at.isoformat(),
+            "view_count": view_count,
+            "like_count": like_count,
+            "comment_count": comment_count,
+            "engagement_rate": round(engagement_rate, 4),
+            "views_per_day": round(views_per_day, 2),
+            "tags": snippet.get("tags", []),
+        }
+    except (KeyError, ValueError):
+        return None
 
-            video_ids = [
-                item["id"]["videoId"] for item in search_response.get("items", [])
-            ]
 
-            if not video_ids:
-                return ChannelVideosResponse(
-                    channel_name=channel_name,
-                    period_days=days_back,
-                    total_videos=0,
-                    avg_views=0.0,
-                    std_dev_views=0.0,
-                    videos=[],
-                )
+def video_record(video: Video) -> dict:
+    """A Video as a plain dict - what asdict gives, without its deep copy."""
+    return {name: getattr(video, name) for name in VIDEO_FIELDS}
 
-            videos = self._fetch_video_details(video_ids)
 
-            if not videos:
-                return ChannelVideosResponse(
-                    channel_name=channel_name,
-                    period_days=days_back,
-                    total_videos=0,
-                    avg_views=0.0,
-                    std_dev_views=0.0,
-                    videos=[],
-                )
+def write_ndjson(records: Iterable[dict], fp, batch: int = 1000) -> int:
+    """Stream records as NDJSON, joined into one write per batch; returns the count."""
+    dumps = json.JSONEncoder(separators=(",", ":"), default=str).encode
+    lines: list[str] = []
+    count = 0
+    for record in records:
+        lines.append(dumps(record))
+        count += 1
+        if len(lines) >= batch:
+            fp.write("\n".join(lines) + "\n")
+            lines.clear()
+    if lines:
+        fp.write("\n".join(lines) + "\n")
+    return count
 
-            view_counts = [v.view_count for v in videos]
-            avg_views = statistics.mean(view_counts)
-            std_dev_views = (
-                statistics.stdev(view_counts) if len(view_counts) > 1 else 0.0
-            )
 
-            for video in videos:
-                if std_dev_views > 0:
-                    video.outlier_score = round(
-                        (video.view_count - avg_views) / std_dev_views, 2
-                    )
-                    video.is_outlier = video.outlier_score > 2.0
-                else:
-                    video.outlier_score = 0.0
-                    video.is_outlier = False
+class VideoTable:
+    """Many videos, stored column by column.
 
-            videos.sort(key=lambda v: v.outlier_score or 0, reverse=True)
+    Numbers live in typed arrays (8 bytes or less a value, no Python
+    objects), channel names are stored once each, and tags are one flat
+    list with offsets. For large research dumps this takes a fraction of
+    the memory of a list of Videos, and exports straight to Parquet or
+    Arrow IPC (needs pyarrow) and NDJSON.
 
-            return ChannelVideosResponse(
-                channel_name=channel_name,
-                period_days=days_back,
-                total_videos=len(videos),
-                avg_views=round(avg_views, 2),
-                std_dev_views=round(std_dev_views, 2),
-                videos=videos,
-            )
+    Rows come in from API items (append_item, without building Videos) or
+    from Videos (append), and go back out as Videos via row(i) or iteration.
+    """
 
-        except HttpError as e:
-            return {"error": f"YouTube API error: {e.reason}"}
-        except Exception as e:
-            return {"error": f"Error fetching channel videos: {str(e)}"}
+    def __init__(self):
+        self.video_ids: list[str] = []
+        self.titles: list[str] = []
+        self.channel_names: list[str] = []
+        self._channel_index: dict[str, int] = {}
+        self.columns = {name: array(typecode) for name, typecode in VIDEO_TABLE_COLUMNS.items()}
+        self.tags: list[str] = []
+        self.tag_offsets = array("I", [0])  # Row i's tags: tags[offsets[i]:offsets[i + 1]]
+
+    def __len__(self) -> int:
+        return len(self.video_ids)
+
+    def __iter__(self) -> Iterator[Video]:
+        return (self.row(i) for i in range(len(self)))
+
+    @classmethod
+    def from_videos(cls, videos: Iterable[Video]) -> VideoTable:
+        table = cls()
+        for video in videos:
+            table.append(video)
+        return table
+
+    def append_item(self, item: dict) -> bool:
+        """Add a videos.list item; False if it couldn't be parsed."""
+        record = parse_video_item(item)
+        if record is None:
+            return False
+        self._append(record)
+        return True
+
+    def append(self, video: Video) -> None:
+        self._append(video_record(video))
+
+    def _append(self, record: dict) -> None:
+        channel = self._channel_index.get(record["channel_name"])
+        if channel is None:
+            channel = self._channel_index[record["channel_name"]] = len(self.channel_names)
+            self.channel_names.append(record["channel_name"])
+
+        self.video_ids.append(record["video_id"])
+        self.titles.append(record["title"])
+        columns = self.columns
+        columns["channel"].append(channel)
+        columns["published_at"].append(
+            int(datetime.fromisoformat(record["published_at"]).timestamp())
+        )
+        for name in ("view_count", "like_count", "comment_count"):
+            columns[name].append(record[name])
+        for name in (
+            "engagement_rate",
+            "views_per_day",
+            "outlier_score",
+            "views_per_hour",
+            "expected_views",
+        ):
+            value = record.get(name)
+            columns[name].append(math.nan if value is None else value)
+        is_outlier = record.get("is_outlier")
+        columns["is_outlier"].append(-1 if is_outlier is None else int(is_outlier))
+
+        self.tags.extend(sys.intern(tag) for tag in record.get("tags") or ())
+        self.tag_offsets.append(len(self.tags))
+
+    def record(self, i: int) -> dict:
+        """Row i as a plain dict, with the same fields as a Video."""
+        columns = self.columns
+
+        def optional(name: str) -> float | None:
+            value = columns[name][i]
+            return None if math.isnan(value) else value
+
+        video_id = self.video_ids[i]
+        is_outlier = columns["is_outlier"][i]
+        expected_views = optional("expected_views")
+        return {
+            "video_id": video_id,
+            "title": self.titles[i],
+            "url": f"https://www.youtube.com/watch?v={video_id}",
+            "channel_name": self.channel_names[columns["channel"][i]],
+            "published_at": datetime.fromtimestamp(
+                columns["published_at"][i], timezone.utc
+            ).isoformat(),
+            "view_count": columns["view_count"][i],
+            "like_count": columns["like_count"][i],
+            "comment_count": columns["comment_count"][i],
+            "engagement_rate": columns["engagement_rate"][i],
+            "views_per_day": columns["views_per_day"][i],
+            "outlier_score": optional("outlier_score"),
+            "is_outlier": None if is_outlier < 0 else bool(is_outlier),
+            "tags": self.tags[self.tag_offsets[i] : self.tag_offsets[i + 1]],
+            "views_per_hour": optional("views_per_hour"),
+            "expected_views": None if expected_views is None else int(expected_views),
+        }
 
-    def search_videos(
-        self,
-        query: str,
-        max_results: int = 25,
-        days_back: int | None = None,
-        order_by: str = "relevance",
-    ) -> SearchResponse | dict:
-        """Search YouTube videos by keyword."""
+    def row(self, i: int) -> Video:
+        return Video(**self.record(i))
+
+    def write_ndjson(self, fp) -> int:
+        """Stream every row as an NDJSON line; returns the row count."""
+        return write_ndjson((self.record(i) for i in range(len(self))), fp)
+
+    def to_arrow(self):
+        """The table as a pyarrow.Table (zero-copy for the numeric columns)."""
         try:
-            order_map = {
-                "relevance": "relevance",
-                "view_count": "viewCount",
-                "date": "date",
-            }
-            order = order_map.get(order_by, "relevance")
-
-            search_params: dict[str, Any] = {
-                "part": "id",
-                "q": query,
-                "type": "video",
-                "order": order,
-                "maxResults": max_results,
+            pa = lazy_import("pyarrow")
+        except ImportError:
+            raise ImportError(
+                "Parquet/Arrow export needs pyarrow: uv run --with pyarrow tools/youtube.py ..."
+            ) from None
+        np = lazy_import("numpy")
+
+        def numeric(values: array) -> Any:
+            return np.frombuffer(values, dtype=values.typecode)
+
+        columns = {name: numeric(values) for name, values in self.columns.items()}
+        is_outlier = columns["is_outlier"]
+        return pa.table(
+            {
+                "video_id": pa.array(self.video_ids, pa.string()),
+                "title": pa.array(self.titles, pa.string()),
+                "channel_name": pa.DictionaryArray.from_arrays(
+                    pa.array(columns["channel"].astype(np.int32)),
+                    pa.array(self.channel_names, pa.string()),
+                ),
+                "published_at": pa.array(columns["published_at"], pa.timestamp("s", tz="UTC")),
+                "view_count": pa.array(columns["view_count"]),
+                "like_count": pa.array(columns["like_count"]),
+                "comment_count": pa.array(columns["comment_count"]),
+                "engagement_rate": pa.array(columns["engagement_rate"]),
+                "views_per_day": pa.array(columns["views_per_day"]),
+                "outlier_score": pa.array(columns["outlier_score"], from_pandas=True),  # NaN -> null
+                "is_outlier": pa.array(is_outlier == 1, mask=is_outlier < 0),
+                "tags": pa.ListArray.from_arrays(
+                    pa.array(numeric(self.tag_offsets).astype(np.int32)),
+                    pa.array(self.tags, pa.string()),
+                ),
+                "views_per_hour": pa.array(columns["views_per_hour"], from_pandas=True),
+                "expected_views": pa.array(columns["expected_views"], from_pandas=True),
             }
+        )
 
-            if days_back is not None:
-                published_after = datetime.now(timezone.utc) - timedelta(days=days_back)
-                search_params["publishedAfter"] = published_after.isoformat()
+    def write(self, path: Path) -> int:
+        """Export by extension: .parquet, .arrow/.feather (Arrow IPC), or .ndjson/.jsonl."""
+        path = Path(path)
+        suffix = path.suffix.lower()
+        if suffix in (".ndjson", ".jsonl"):
+            with open(path, "w") as f:
+                return self.write_ndjson(f)
+        if suffix == ".parquet":
+            table = self.to_arrow()
+            lazy_import("pyarrow.parquet").write_table(table, path, compression="zstd")
+            return len(self)
+        if suffix in (".arrow", ".feather"):
+            table = self.to_arrow()
+            ipc = lazy_import("pyarrow.ipc")
+            with ipc.new_file(str(path), table.schema) as writer:
+                writer.write_table(table)
+            return len(self)
+        raise ValueError(f"Unknown export format: {path.name} (use .parquet, .arrow or .ndjson)")
 
-            search_response = self.youtube.search().list(**search_params).execute()
 
-            total_results = search_response.get("pageInfo", {}).get("totalResults", 0)
-            video_ids = [
-                item["id"]["videoId"] for item in search_response.get("items", [])
-            ]
+# =============================================================================
+# Response Cache
+# =============================================================================
 
-            if not video_ids:
-                return SearchResponse(
-                    query=query,
-                    total_results=0,
-                    avg_views=0.0,
-                    top_channels=[],
-                    videos=[],
-                )
+DEFAULT_CACHE_PATH = Path.home() / ".youtube-agent" / "cache.sqlite3"
 
-            videos = self._fetch_video_details(video_ids)
-            avg_views = (
-                statistics.mean([v.view_count for v in videos]) if videos else 0.0
-            )
+# Seconds a cached response is served without asking the API again
+CACHE_TTLS = {
+    "channels.list": 7 * 24 * 3600,  # Channel identity rarely changes
+    "search.list": 6 * 3600,
+    "playlistItems.list": 3600,  # New uploads
+    "videos.list": 15 * 60,  # Statistics move fast
+}
 
-            channel_counts: dict[str, int] = {}
-            for video in videos:
-                channel_counts[video.channel_name] = (
-                    channel_counts.get(video.channel_name, 0) + 1
-                )
 
-            top_channels = [
-                {"name": name, "video_count": count}
-                for name, count in sorted(
-                    channel_counts.items(), key=lambda x: x[1], reverse=True
-                )[:5]
-            ]
+class CacheMiss(Exception):
+    """Raised in offline mode when a response isn't in the cache."""
+
+
+class ResponseCache:
+    """SQLite-backed cache of API responses, keyed on endpoint + params.
+
+    Fresh entries (younger than the endpoint's TTL) are served without a
+    network call. Stale entries are revalidated with their ETag, so an
+    unchanged resource comes back as a 304 with no body to download.
+    """
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_CACHE_PATH,
+        ttls: dict[str, int] | None = None,
+        offline: bool = False,
+    ):
+        self.path = Path(path)
+        self.ttls = {**CACHE_TTLS, **(ttls or {})}
+        self.offline = offline
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                endpoint TEXT NOT NULL,
+                etag TEXT,
+                body TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            )"""
+        )
+        self._db.commit()
+
+    @staticmethod
+    def key(endpoint: str, params: dict) -> str:
+        """Stable cache key for a request."""
+        clean = {k: v for k, v in params.items() if v is not None}
+        return f"{endpoint}?{json.dumps(clean, sort_keys=True)}"
+
+    def get(self, key: str) -> tuple[dict, str | None, float] | None:
+        """Return (body, etag, age_seconds) or None."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body, etag, fetched_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        body, etag, fetched_at = row
+        return json.loads(body), etag, time.time() - fetched_at
+
+    def is_fresh(self, endpoint: str, age: float) -> bool:
+        return age < self.ttls.get(endpoint, 0)
 
-            return SearchResponse(
-                query=query,
-                total_results=total_results,
-                avg_views=round(avg_views, 2),
-                top_channels=top_channels,
-                videos=videos,
+    def put(self, key: str, endpoint: str, body: dict) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, endpoint, body.get("etag"), json.dumps(body), time.time()),
             )
+            self._db.commit()
 
-        except HttpError as e:
-            return {"error": f"YouTube API error: {e.reason}"}
-        except Exception as e:
-            return {"error": f"Error searching videos: {str(e)}"}
+    def touch(self, key: str) -> None:
+        """Mark an entry fresh again after a 304 Not Modified."""
+        with self._lock:
+            self._db.execute(
+                "UPDATE responses SET fetched_at = ? WHERE key = ?", (time.time(), key)
+            )
+            self._db.commit()
 
-    def get_transcript(self, video_id: str, max_chars: int = 5000) -> dict:
-        """Get video transcript/captions."""
-        try:
-            api = YouTubeTranscriptApi()
-            # Try English first, then fall back to any available language
-            try:
-                transcript = api.fetch(video_id, languages=["en"])
-                language = "en"
-            except NoTranscriptFound:
-                # Fall back to first available transcript
-                transcript_list = api.list(video_id)
-                transcript = transcript_list.find_transcript(
-                    [t.language_code for t in transcript_list]
-                ).fetch()
-                language = transcript_list[0].language_code if transcript_list else "unknown"
 
-            full_text = " ".join([snippet.text for snippet in transcript])
+# =============================================================================
+# Transcript Store
+# =============================================================================
 
-            if len(full_text) > max_chars:
-                full_text = full_text[:max_chars] + "... [truncated]"
+WORKSPACE_DIR = Path(__file__).resolve().parent.parent / "workspace"
+DEFAULT_TRANSCRIPTS_PATH = WORKSPACE_DIR / "transcripts" / "transcripts.sqlite3"
 
-            return {
-                "video_id": video_id,
-                "language": language,
-                "is_generated": getattr(transcript, 'is_generated', False),
-                "transcript": full_text,
-            }
+# A segment is (start_seconds, duration_seconds, text)
+Segment = tuple[float, float, str]
 
-        except TranscriptsDisabled:
-            return {"error": f"Transcripts are disabled for video: {video_id}"}
-        except NoTranscriptFound:
-            return {"error": f"No transcript found for video: {video_id}"}
-        except VideoUnavailable:
-            return {"error": f"Video unavailable: {video_id}"}
-        except Exception as e:
-            return {"error": f"Error fetching transcript: {str(e)}"}
+# Transcripts are indexed for search in chunks of about this many seconds,
+# so a phrase spanning two caption segments still matches
+SEARCH_CHUNK_SECONDS = 30.0
 
-    def _parse_channel_input(self, channel_input: str) -> str | None:
-        """Parse channel input and return channel ID or @handle."""
-        channel_input = channel_input.strip()
+# BM25-ranking every match of a common word takes hundreds of ms at tens
+# of thousands of videos, so only the most recently indexed matches are
+# ranked. Selective queries (the useful ones) have fewer than this anyway.
+SEARCH_RANK_CANDIDATES = 2000
 
-        if channel_input.startswith("@"):
-            return channel_input
 
-        url_patterns = [
-            r"(?:https?://)?(?:www\.)?youtube\.com/@([\w-]+)",
-            r"(?:https?://)?(?:www\.)?youtube\.com/channel/(UC[\w-]+)",
-            r"(?:https?://)?(?:www\.)?youtube\.com/c/([\w-]+)",
-        ]
+@dataclass(slots=True)
+class StoredTranscript:
+    """A full, timestamped transcript (or why there isn't one)."""
 
-        for pattern in url_patterns:
-            match = re.match(pattern, channel_input)
-            if match:
-                result = match.group(1)
-                if not result.startswith("UC"):
-                    return f"@{result}"
-                return result
+    video_id: str
+    language: str | None
+    is_generated: bool
+    segments: list[Segment]
+    error: str | None = None
+
+    def text(self, start: float | None = None, end: float | None = None) -> str:
+        """Joined text of the segments overlapping [start, end) seconds."""
+        segments = self.segments
+        if start is not None:
+            # Segments are in time order: skip straight to the first one that
+            # hasn't ended before `start`
+            starts = [s[0] for s in segments]
+            first = max(0, bisect.bisect_right(starts, start) - 1)
+            segments = [s for s in segments[first:] if s[0] + s[1] > start]
+        if end is not None:
+            segments = [s for s in segments if s[0] < end]
+        return " ".join(text for _, _, text in segments)
+
+
+@dataclass(slots=True)
+class TranscriptHit:
+    """A search match: where in which video."""
 
-        if channel_input.startswith("UC"):
-            return channel_input
+    video_id: str
+    start: float  # Seconds into the video
+    timestamp: str
+    url: str
+    snippet: str
 
-        if re.match(r"^[\w-]+$", channel_input):
-            return f"@{channel_input}"
 
-        return None
+def format_timestamp(seconds: float) -> str:
+    """1234.5 -> "20:34" (or "1:02:03" past an hour)."""
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}" if hours else f"{minutes}:{secs:02d}"
 
-    def _fetch_video_details(self, video_ids: list[str]) -> list[Video]:
-        """Fetch detailed video information for a list of video IDs."""
-        videos = []
 
-        for i in range(0, len(video_ids), 50):
-            batch_ids = video_ids[i : i + 50]
+def first_term_pattern(query: str) -> re.Pattern | None:
+    """Regex for the first word or "phrase" of an FTS5 query, punctuation-tolerant."""
+    for phrase, word in re.findall(r'"([^"]+)"|([\w*]+)', query):
+        term = phrase or word
+        if term in ("AND", "OR", "NOT"):
+            continue
+        words = re.findall(r"\w+", term)
+        if words:
+            return re.compile(r"\b" + r"\W+".join(re.escape(w) for w in words), re.IGNORECASE)
+    return None
 
-            response = (
-                self.youtube.videos()
-                .list(part="snippet,statistics", id=",".join(batch_ids))
-                .execute()
-            )
 
-            for item in response.get("items", []):
-                video = self._parse_video_item(item)
-                if video:
-                    videos.append(video)
+def chunk_segments(segments: list[Segment]) -> list[tuple[float, str, list[tuple[int, float]]]]:
+    """Group segments into ~SEARCH_CHUNK_SECONDS chunks for indexing.
 
-        return videos
+    Returns (chunk_start, text, offsets) where offsets maps each segment's
+    character position in the chunk text to its start time.
+    """
+    chunks = []
+    for start, _, text in segments:
+        if not chunks or start >= chunks[-1][0] + SEARCH_CHUNK_SECONDS:
+            chunks.append((start, [], []))
+        _, texts, offsets = chunks[-1]
+        offsets.append((sum(len(t) + 1 for t in texts), start))
+        texts.append(text)
+    return [(start, " ".join(texts), offsets) for start, texts, offsets in chunks]
 
-    def _parse_video_item(self, item: dict) -> Video | None:
-        """Parse a YouTube API video item into a Video."""
+
+class TranscriptStore:
+    """Full transcripts on disk, one zlib-compressed row per video.
+
+    Stores every timestamped segment (not a truncated string), so any
+    max_chars or time range is served locally. Videos without a transcript
+    are remembered too, so batch runs don't keep asking for them.
+
+    Transcripts are also indexed for full-text search (SQLite FTS5), kept
+    up to date as each transcript is stored.
+    """
+
+    def __init__(self, path: Path = DEFAULT_TRANSCRIPTS_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS transcripts (
+                video_id TEXT PRIMARY KEY,
+                language TEXT,
+                is_generated INTEGER NOT NULL DEFAULT 0,
+                segment_count INTEGER NOT NULL DEFAULT 0,
+                duration REAL NOT NULL DEFAULT 0,
+                segments BLOB,
+                error TEXT,
+                fetched_at REAL NOT NULL
+            )"""
+        )
+
+        # Search index: chunk text lives in `chunks`; the FTS5 table indexes it
+        # without a second copy (external content), keyed by chunk id
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS chunks (
+                id INTEGER PRIMARY KEY,
+                video_id TEXT NOT NULL,
+                start REAL NOT NULL,
+                text TEXT NOT NULL,
+                offsets TEXT NOT NULL
+            )"""
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS chunks_video ON chunks (video_id)")
         try:
-            snippet = item["snippet"]
-            stats = item.get("statistics", {})
+            self._db.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS chunks_fts"
+                " USING fts5(text, content='chunks', content_rowid='id')"
+            )
+            self.searchable = True
+        except sqlite3.OperationalError:  # SQLite built without FTS5
+            self.searchable = False
+        self._db.commit()
+
+        if self.searchable:
+            self._index_missing()
+
+    def _index_missing(self) -> None:
+        """Index transcripts stored before the search index existed."""
+        with self._lock:
+            video_ids = [
+                video_id
+                for (video_id,) in self._db.execute(
+                    "SELECT video_id FROM transcripts t WHERE segments IS NOT NULL"
+                    " AND NOT EXISTS (SELECT 1 FROM chunks c WHERE c.video_id = t.video_id)"
+                )
+            ]
+        for video_id in video_ids:
+            transcript = self.get(video_id)
+            with self._lock:
+                self._index(video_id, transcript.segments)
+                self._db.commit()
+
+    def _index(self, video_id: str, segments: list[Segment]) -> None:
+        """Replace a video's chunks in the search index (caller holds the lock)."""
+        if not self.searchable:
+            return
+        # External-content FTS tables are told what to forget, then the rows go
+        self._db.execute(
+            "INSERT INTO chunks_fts (chunks_fts, rowid, text)"
+            " SELECT 'delete', id, text FROM chunks WHERE video_id = ?",
+            (video_id,),
+        )
+        self._db.execute("DELETE FROM chunks WHERE video_id = ?", (video_id,))
 
-            video_id = item["id"]
-            published_at = datetime.fromisoformat(
-                snippet["publishedAt"].replace("Z", "+00:00")
+        for start, text, offsets in chunk_segments(segments):
+            cursor = self._db.execute(
+                "INSERT INTO chunks (video_id, start, text, offsets) VALUES (?, ?, ?, ?)",
+                (video_id, start, text, json.dumps(offsets)),
+            )
+            self._db.execute(
+                "INSERT INTO chunks_fts (rowid, text) VALUES (?, ?)", (cursor.lastrowid, text)
             )
 
-            view_count = int(stats.get("viewCount", 0))
-            like_count = int(stats.get("likeCount", 0))
-            comment_count = int(stats.get("commentCount", 0))
+    def search(self, query: str, limit: int = 20, phrase: bool = False) -> list[TranscriptHit]:
+        """Full-text search across every stored transcript, best matches first.
 
-            engagement_rate = 0.0
-            if view_count > 0:
-                engagement_rate = (like_count + comment_count) / view_count
+        query uses FTS5 syntax: words (all must match), "exact phrases",
+        OR, NOT, prefix*. phrase=True searches the whole query as one phrase.
+        Raises ValueError for a malformed query.
 
-            days_since_published = (datetime.now(timezone.utc) - published_at).days
-            views_per_day = view_count / max(days_since_published, 1)
+        Ranking covers the newest SEARCH_RANK_CANDIDATES matching chunks,
+        which keeps even one-common-word queries in milliseconds.
+        """
+        if not self.searchable:
+            raise ValueError("Transcript search needs SQLite with FTS5")
+        if phrase:
+            query = '"' + query.replace('"', '""') + '"'
 
-            return Video(
-                video_id=video_id,
-                title=snippet["title"],
-                url=f"https://www.youtube.com/watch?v={video_id}",
-                channel_name=snippet["channelTitle"],
-                published_at=published_at.isoformat(),
-                view_count=view_count,
-                like_count=like_count,
-                comment_count=comment_count,
-                engagement_rate=round(engagement_rate, 4),
-                views_per_day=round(views_per_day, 2),
-                tags=snippet.get("tags", []),
+        with self._lock:
+            try:
+                rows = self._db.execute(
+                    """SELECT c.video_id, c.start, c.text, c.offsets
+                       FROM (
+                           SELECT rowid, bm25(chunks_fts) AS score FROM chunks_fts
+                           WHERE chunks_fts MATCH ? ORDER BY rowid DESC LIMIT ?
+                       ) AS m
+                       JOIN chunks c ON c.id = m.rowid
+                       ORDER BY m.score
+                       LIMIT ?""",
+                    (query, SEARCH_RANK_CANDIDATES, limit),
+                ).fetchall()
+            except sqlite3.OperationalError as e:
+                raise ValueError(f"Invalid search query: {e}") from None
+
+        # Pin each hit to the caption segment where the first term/phrase starts
+        pattern = first_term_pattern(query)
+
+        hits = []
+        for video_id, start, text, offsets in rows:
+            match = pattern.search(text) if pattern else None
+            snippet = text[:160]
+            if match:
+                offsets = json.loads(offsets)
+                index = bisect.bisect_right([offset for offset, _ in offsets], match.start()) - 1
+                start = offsets[max(index, 0)][1]
+                before = text[max(0, match.start() - 70) : match.start()]
+                after = text[match.end() : match.end() + 70]
+                snippet = f"...{before}[{match.group()}]{after}..."
+            hits.append(
+                TranscriptHit(
+                    video_id=video_id,
+                    start=start,
+                    timestamp=format_timestamp(start),
+                    url=f"https://www.youtube.com/watch?v={video_id}&t={int(start)}s",
+                    snippet=snippet,
+                )
             )
-        except (KeyError, ValueError):
+        return hits
+
+    def get(self, video_id: str) -> StoredTranscript | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT language, is_generated, segments, error FROM transcripts"
+                " WHERE video_id = ?",
+                (video_id,),
+            ).fetchone()
+        if row is None:
             return None
+        language, is_generated, blob, error = row
+        segments = [tuple(s) for s in json.loads(zlib.decompress(blob))] if blob else []
+        return StoredTranscript(video_id, language, bool(is_generated), segments, error)
+
+    def stored_ids(self, video_ids: list[str]) -> set[str]:
+        """Which of these videos are already stored (with or without a transcript)."""
+        found: set[str] = set()
+        with self._lock:
+            for i in range(0, len(video_ids), 500):  # Stay under SQLite's variable limit
+                chunk = video_ids[i : i + 500]
+                rows = self._db.execute(
+                    f"SELECT video_id FROM transcripts WHERE video_id IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                found.update(video_id for (video_id,) in rows)
+        return found
+
+    def put(self, transcript: StoredTranscript) -> None:
+        segments = transcript.segments
+        blob = zlib.compress(json.dumps(segments).encode(), 6) if segments else None
+        duration = segments[-1][0] + segments[-1][1] if segments else 0.0
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO transcripts VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    transcript.video_id,
+                    transcript.language,
+                    int(transcript.is_generated),
+                    len(segments),
+                    duration,
+                    blob,
+                    transcript.error,
+                    time.time(),
+                ),
+            )
+            self._index(transcript.video_id, segments)
+            self._db.commit()
 
 
 # =============================================================================
-# YouTube Uploader (OAuth)
+# Snapshot Store
 # =============================================================================
 
-# OAuth scopes for uploading
-UPLOAD_SCOPES = [
-    "https://www.googleapis.com/auth/youtube.upload",
-    "https://www.googleapis.com/auth/youtube.force-ssl",
-]
+DEFAULT_SNAPSHOTS_DIR = WORKSPACE_DIR / "snapshots"
 
-DEFAULT_TOKEN_PATH = Path.home() / ".youtube-agent" / "token.json"
+# One fixed-width, append-only file per column (array typecodes): 24 bytes a
+# snapshot. Views get 64 bits - the biggest videos are past 2^32.
+SNAPSHOT_COLUMNS = {
+    "video": "I",  # Line number in videos.jsonl
+    "time": "I",  # Unix seconds
+    "views": "q",
+    "likes": "I",
+    "comments": "I",
+}
 
+# Window for the measured views_per_hour attached to fetched videos
+VELOCITY_WINDOW_HOURS = 48
 
-class YouTubeUploader:
-    """YouTube uploader using OAuth credentials."""
+# Rows older than this are dropped, once the oldest is a day past it (so
+# the columns are rewritten at most daily, not on every append)
+SNAPSHOT_RETENTION_DAYS = 90
+SNAPSHOT_COMPACT_SLACK = 86400
 
-    def __init__(
-        self,
-        client_secrets_path: Path,
-        token_path: Path = DEFAULT_TOKEN_PATH,
-    ):
-        self.client_secrets_path = Path(client_secrets_path)
-        self.token_path = Path(token_path)
 
-        if not self.client_secrets_path.exists():
-            raise FileNotFoundError(
-                f"Client secrets not found: {self.client_secrets_path}\n"
-                "Download OAuth credentials from Google Cloud Console."
-            )
+@dataclass(slots=True)
+class VideoGrowth:
+    """A video's measured growth over a window of snapshots."""
 
-        self.credentials = self._get_credentials()
-        self.youtube = build("youtube", "v3", credentials=self.credentials)
+    video_id: str
+    title: str
+    channel_name: str
+    published_at: str
+    view_count: int  # At the latest snapshot
+    views_gained: int
+    hours_observed: float  # First to last snapshot in the window
+    views_per_hour: float
+    acceleration: float | None  # Change in views/hour per hour (needs 3+ snapshots)
+    snapshots: int
 
-    def _get_credentials(self) -> Credentials:
-        """Get or refresh OAuth credentials."""
-        credentials = None
 
-        if self.token_path.exists():
-            credentials = Credentials.from_authorized_user_file(
+def measure_growth(points: list[tuple[int, int]]) -> tuple[float, float | None]:
+    """(views per hour, acceleration) from time-ordered (unix_time, views) points.
+
+    Acceleration compares the slope before and after the point nearest the
+    middle of the span, per hour between the two halves' midpoints.
+    """
+    (t0, v0), (tn, vn) = points[0], points[-1]
+    velocity = (vn - v0) / ((tn - t0) / 3600)
+    if len(points) < 3:
+        return velocity, None
+
+    tm, vm = min(points[1:-1], key=lambda p: abs(p[0] - (t0 + tn) / 2))
+    early_hours, late_hours = (tm - t0) / 3600, (tn - tm) / 3600
+    if early_hours <= 0 or late_hours <= 0:
+        return velocity, None
+    early, late = (vm - v0) / early_hours, (vn - vm) / late_hours
+    return velocity, (late - early) / ((early_hours + late_hours) / 2)
+
+
+class SnapshotStore:
+    """Append-only time series of video statistics, stored column by column.
+
+    Every videos.list response fetched from the API is recorded (a cache
+    hit is not a new observation), so velocity comes from real deltas
+    between snapshots rather than lifetime views / age. Rows are appended
+    in time order: a window query bisects the memory-mapped time column
+    and reads only the window's rows, so it doesn't slow down as the
+    store grows. Rows past retention_days are compacted away.
+
+    Video IDs are stored once, with title and channel for display, in
+    videos.jsonl; rows refer to them by line number. Appends take a file
+    lock, so the daemon and CLI runs can record into the same store.
+    """
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_SNAPSHOTS_DIR,
+        retention_days: float | None = SNAPSHOT_RETENTION_DAYS,
+    ):
+        self.path = Path(path)
+        self.retention_days = retention_days  # None = keep every row
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._videos: list[dict] = []
+        self._index: dict[str, int] = {}
+        self._videos_read = 0  # Bytes of videos.jsonl loaded so far
+
+    def _column_path(self, name: str) -> Path:
+        return self.path / f"{name}.bin"
+
+    @contextmanager
+    def _locked(self, shared: bool = False) -> Iterator[None]:
+        """Thread and file lock: whole rows for writers, no half-done compaction for readers."""
+        with self._lock:
+            lock_file = open(self.path / ".lock", "w")
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                lock_file.close()  # Releases the flock
+
+    def _load_videos(self) -> None:
+        """Pick up videos.jsonl entries appended (by any process) since the last load."""
+        path = self.path / "videos.jsonl"
+        if not path.exists():
+            return
+        with open(path, "rb") as f:
+            f.seek(self._videos_read)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Still being written
+                entry = json.loads(line)
+                self._index[entry["video_id"]] = len(self._videos)
+                self._videos.append(entry)
+                self._videos_read += len(line)
+
+    def _row_count(self) -> int:
+        """Complete rows: a write cut short leaves some columns one row longer."""
+        counts = []
+        for name, typecode in SNAPSHOT_COLUMNS.items():
+            path = self._column_path(name)
+            size = path.stat().st_size if path.exists() else 0
+            counts.append(size // array(typecode).itemsize)
+        return min(counts)
+
+    def _read_column(self, name: str, start: int, stop: int) -> array:
+        values = array(SNAPSHOT_COLUMNS[name])
+        if stop > start:
+            with open(self._column_path(name), "rb") as f:
+                f.seek(start * values.itemsize)
+                values.fromfile(f, stop - start)
+        return values
+
+    def _time_range(self, start: float, stop: float, rows: int) -> tuple[int, int]:
+        """Rows [first, last) snapshotted between start and stop, bisected in place."""
+        if rows == 0:
+            return 0, 0
+        itemsize = array(SNAPSHOT_COLUMNS["time"]).itemsize
+        with open(self._column_path("time"), "rb") as f:
+            with mmap.mmap(f.fileno(), rows * itemsize, access=mmap.ACCESS_READ) as mapped:
+                times = memoryview(mapped).cast(SNAPSHOT_COLUMNS["time"])
+                try:
+                    return bisect.bisect_left(times, start), bisect.bisect_right(times, stop)
+                finally:
+                    times.release()  # The map can't close while a view is open
+
+    def _compact(self, before: float, rows: int) -> int:
+        """Drop the rows snapshotted before a time (call locked); returns how many."""
+        drop, _ = self._time_range(before, before, rows)
+        if drop == 0:
+            return 0
+        for name, typecode in SNAPSHOT_COLUMNS.items():
+            path = self._column_path(name)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                self._read_column(name, drop, rows).tofile(f)
+            os.replace(tmp_path, path)
+        return drop
+
+    def compact(self, now: float | None = None) -> int:
+        """Drop rows older than retention_days now; returns how many were dropped."""
+        if self.retention_days is None:
+            return 0
+        now = now if now is not None else time.time()
+        with self._locked():
+            return self._compact(now - self.retention_days * 86400, self._row_count())
+
+    def record(self, items: list[dict], at: float | None = None) -> int:
+        """Append one snapshot per videos.list item; returns how many were recorded."""
+        items = [item for item in items if "id" in item and "statistics" in item]
+        if not items:
+            return 0
+
+        columns = {name: array(typecode) for name, typecode in SNAPSHOT_COLUMNS.items()}
+        with self._locked():
+            self._load_videos()
+            rows = self._row_count()
+            for name, typecode in SNAPSHOT_COLUMNS.items():
+                path = self._column_path(name)
+                if path.exists():
+                    os.truncate(path, rows * array(typecode).itemsize)
+
+            # Keep the time column sorted even if the clock steps back
+            last = self._read_column("time", rows - 1, rows) if rows else [0]
+            timestamp = max(int(at if at is not None else time.time()), last[0])
+
+            new_videos = []
+            for item in items:
+                index = self._index.get(item["id"])
+                if index is None:
+                    snippet = item.get("snippet", {})
+                    entry = {
+                        "video_id": item["id"],
+                        "title": snippet.get("title", ""),
+                        "channel_name": snippet.get("channelTitle", ""),
+                        "published_at": snippet.get("publishedAt", ""),
+                    }
+                    index = len(self._videos)
+                    self._index[item["id"]] = index
+                    self._videos.append(entry)
+                    new_videos.append(entry)
+
+                stats = item["statistics"]
+                columns["video"].append(index)
+                columns["time"].append(timestamp)
+                columns["views"].append(int(stats.get("viewCount", 0)))
+                columns["likes"].append(int(stats.get("likeCount", 0)))
+                columns["comments"].append(int(stats.get("commentCount", 0)))
+
+            # Dictionary first, so every row written refers to a known video
+            if new_videos:
+                data = "".join(json.dumps(entry) + "\n" for entry in new_videos).encode()
+                with open(self.path / "videos.jsonl", "ab") as f:
+                    f.write(data)
+                self._videos_read += len(data)
+            for name, values in columns.items():
+                with open(self._column_path(name), "ab") as f:
+                    values.tofile(f)
+
+            if self.retention_days is not None and rows:
+                cutoff = timestamp - self.retention_days * 86400
+                if self._read_column("time", 0, 1)[0] < cutoff - SNAPSHOT_COMPACT_SLACK:
+                    self._compact(cutoff, rows + len(items))
+
+        return len(items)
+
+    def history(self, video_id: str) -> list[dict]:
+        """Every snapshot of one video, oldest first."""
+        with self._locked(shared=True):
+            self._load_videos()
+            index = self._index.get(video_id)
+            if index is None:
+                return []
+            rows = self._row_count()
+            columns = {name: self._read_column(name, 0, rows) for name in SNAPSHOT_COLUMNS}
+
+        return [
+            {
+                "time": datetime.fromtimestamp(columns["time"][row], timezone.utc).isoformat(),
+                "views": columns["views"][row],
+                "likes": columns["likes"][row],
+                "comments": columns["comments"][row],
+            }
+            for row, video in enumerate(columns["video"])
+            if video == index
+        ]
+
+    def growth(
+        self,
+        hours: float = VELOCITY_WINDOW_HOURS,
+        video_ids: list[str] | None = None,
+        now: float | None = None,
+    ) -> list[VideoGrowth]:
+        """Velocity and acceleration of videos snapshotted 2+ times in the last `hours`.
+
+        Unordered; sort by views_per_hour or acceleration. Pass video_ids
+        to measure only those videos.
+        """
+        now = now if now is not None else time.time()
+        with self._locked(shared=True):
+            self._load_videos()
+            rows = self._row_count()
+            first, last = self._time_range(now - hours * 3600, now, rows)
+            times = self._read_column("time", first, last)
+            video_column = self._read_column("video", first, last)
+            views = self._read_column("views", first, last)
+            videos = list(self._videos)
+            wanted = (
+                {self._index[v] for v in video_ids if v in self._index}
+                if video_ids is not None
+                else None
+            )
+
+        series: dict[int, list[tuple[int, int]]] = {}
+        for row, index in enumerate(video_column):
+            if wanted is None or index in wanted:
+                series.setdefault(index, []).append((times[row], views[row]))
+
+        results = []
+        for index, points in series.items():
+            if points[-1][0] <= points[0][0]:
+                continue  # Fewer than two distinct snapshot times
+            velocity, acceleration = measure_growth(points)
+            entry = videos[index]
+            results.append(
+                VideoGrowth(
+                    video_id=entry["video_id"],
+                    title=entry["title"],
+                    channel_name=entry["channel_name"],
+                    published_at=entry["published_at"],
+                    view_count=points[-1][1],
+                    views_gained=points[-1][1] - points[0][1],
+                    hours_observed=round((points[-1][0] - points[0][0]) / 3600, 2),
+                    views_per_hour=round(velocity, 2),
+                    acceleration=round(acceleration, 2) if acceleration is not None else None,
+                    snapshots=len(points),
+                )
+            )
+        return results
+
+
+# =============================================================================
+# Channel Store
+# =============================================================================
+
+DEFAULT_CHANNELS_PATH = WORKSPACE_DIR / "channels" / "channels.sqlite3"
+
+
+@dataclass(slots=True)
+class ChannelState:
+    """A synced channel and its watermark: the newest upload seen so far.
+
+    Every upload published since synced_since has been listed, so a sync
+    whose window starts no earlier can stop at the watermark.
+    """
+
+    channel_id: str
+    name: str
+    handle: str | None
+    uploads_playlist_id: str
+    watermark_video_id: str | None = None
+    watermark_published_at: str | None = None
+    synced_at: float | None = None
+    synced_since: str | None = None
+
+
+class ChannelStore:
+    """Synced channels and the latest stats of their videos (SQLite).
+
+    sync_channel keeps this up to date: per-channel watermarks so only
+    new uploads are listed, and one row per video with its latest metrics.
+    """
+
+    def __init__(self, path: Path = DEFAULT_CHANNELS_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS channels (
+                channel_id TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                handle TEXT,
+                uploads_playlist_id TEXT NOT NULL,
+                watermark_video_id TEXT,
+                watermark_published_at TEXT,
+                synced_at REAL,
+                synced_since TEXT
+            )"""
+        )
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(channels)")}
+        if "synced_since" not in columns:
+            # Stores from before synced_since: each channel's next sync lists its full window
+            self._db.execute("ALTER TABLE channels ADD COLUMN synced_since TEXT")
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS videos (
+                video_id TEXT PRIMARY KEY,
+                channel_id TEXT NOT NULL,
+                published_at TEXT NOT NULL,
+                data TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            )"""
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS videos_channel ON videos (channel_id, published_at)"
+        )
+        self._db.commit()
+
+    def find(self, channel: str) -> ChannelState | None:
+        """A synced channel by channel ID or @handle (case-insensitive)."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT * FROM channels WHERE channel_id = ? OR lower(handle) = lower(?)",
+                (channel, channel),
+            ).fetchone()
+        return ChannelState(*row) if row else None
+
+    def save_channel(self, state: ChannelState) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO channels VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    state.channel_id,
+                    state.name,
+                    state.handle,
+                    state.uploads_playlist_id,
+                    state.watermark_video_id,
+                    state.watermark_published_at,
+                    state.synced_at,
+                    state.synced_since,
+                ),
+            )
+            self._db.commit()
+
+    def video_ids(self, channel_id: str, published_after: str) -> list[str]:
+        """Stored videos of a channel published after an ISO time, newest first."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT video_id FROM videos WHERE channel_id = ? AND published_at >= ?"
+                " ORDER BY published_at DESC",
+                (channel_id, published_after),
+            ).fetchall()
+        return [video_id for (video_id,) in rows]
+
+    def videos(self, channel_id: str, published_after: str) -> list[Video]:
+        """Stored videos (latest metrics) of a channel published after an ISO time."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT data FROM videos WHERE channel_id = ? AND published_at >= ?"
+                " ORDER BY published_at DESC",
+                (channel_id, published_after),
+            ).fetchall()
+        return [Video(**json.loads(data)) for (data,) in rows]
+
+    def put_videos(self, channel_id: str, videos: list[Video]) -> None:
+        now = time.time()
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO videos VALUES (?, ?, ?, ?, ?)",
+                [
+                    (v.video_id, channel_id, v.published_at, json.dumps(asdict(v)), now)
+                    for v in videos
+                ],
+            )
+            self._db.commit()
+
+
+# =============================================================================
+# Channel Index
+# =============================================================================
+
+DEFAULT_CHANNEL_INDEX_PATH = Path.home() / ".youtube-agent" / "channels.json"
+CHANNEL_INDEX_TTL = 7 * 24 * 3600  # Same as cached channels.list responses
+CHANNELS_PER_CALL = 50  # channels.list takes up to 50 IDs
+
+
+class ChannelIndex:
+    """Channel inputs (@handles, IDs) resolved to channels, kept between runs.
+
+    A fresh entry (younger than ttl) resolves with no API call. A stale
+    one is still worth having: its channel ID lets the refresh go into a
+    50-ID channels.list batch, where an unknown @handle needs its own
+    forHandle call. Handles are matched case-insensitively.
+
+    Kept in memory, and in a JSON file if path is set: save() merges this
+    process's entries into the file under a lock, so CLI runs and the
+    daemon share one index.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = DEFAULT_CHANNEL_INDEX_PATH,
+        ttl: int = CHANNEL_INDEX_TTL,
+    ):
+        self.path = Path(path) if path is not None else None  # None = in memory only
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._keys: dict[str, str] = {}  # Input key -> channel ID
+        self._channels: dict[str, dict] = {}  # Channel ID -> ChannelInfo fields + resolved_at
+        self._changed: set[str] = set()
+
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            state = self._read()
+            self._keys, self._channels = state["keys"], state["channels"]
+
+    @staticmethod
+    def normalize(key: str) -> str:
+        return key.lower() if key.startswith("@") else key
+
+    def _read(self) -> dict:
+        try:
+            state = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            state = {}
+        return {"keys": state.get("keys", {}), "channels": state.get("channels", {})}
+
+    def channel_id(self, key: str) -> str | None:
+        """The channel ID a key is known to resolve to, fresh or not."""
+        key = self.normalize(key)
+        with self._lock:
+            return key if key in self._channels else self._keys.get(key)
+
+    def get(self, key: str, now: float | None = None) -> ChannelInfo | None:
+        """The channel for a key, if resolved within the last ttl seconds."""
+        channel_id = self.channel_id(key)
+        with self._lock:
+            entry = self._channels.get(channel_id) if channel_id else None
+        if entry is None or (now or time.time()) - entry["resolved_at"] > self.ttl:
+            return None
+        return ChannelInfo(**{k: v for k, v in entry.items() if k != "resolved_at"})
+
+    def put(self, info: ChannelInfo, keys: Iterable[str] = (), now: float | None = None) -> None:
+        """Record a resolved channel, under its ID, its handle and any other keys."""
+        keys = {self.normalize(k) for k in (*keys, info.handle or "") if k}
+        keys.discard(info.channel_id)
+        with self._lock:
+            self._channels[info.channel_id] = {**asdict(info), "resolved_at": now or time.time()}
+            for key in keys:
+                self._keys[key] = info.channel_id
+            self._changed.add(info.channel_id)
+
+    def save(self) -> None:
+        """Merge this process's new entries into the index file."""
+        if self.path is None:
+            return
+        with self._lock:
+            if not self._changed:
+                return
+            lock_file = open(self.path.with_suffix(".lock"), "w")
+            try:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                state = self._read()
+                for channel_id in self._changed:
+                    state["channels"][channel_id] = self._channels[channel_id]
+                state["keys"].update(
+                    (key, channel_id)
+                    for key, channel_id in self._keys.items()
+                    if channel_id in self._changed
+                )
+                tmp_path = self.path.with_suffix(".tmp")
+                tmp_path.write_text(json.dumps(state))
+                os.replace(tmp_path, self.path)
+                self._keys, self._channels = state["keys"], state["channels"]
+                self._changed.clear()
+            finally:
+                lock_file.close()  # Releases the flock
+
+
+# =============================================================================
+# Quota Scheduler
+# =============================================================================
+
+DEFAULT_QUOTA_PATH = Path.home() / ".youtube-agent" / "quota.json"
+DEFAULT_DAILY_QUOTA = 10_000
+DEFAULT_REQUESTS_PER_SECOND = 10.0
+
+# The daily quota resets at midnight Pacific Time
+try:
+    QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+except ZoneInfoNotFoundError:  # No tz database (e.g. Windows without tzdata)
+    QUOTA_TIMEZONE = timezone(timedelta(hours=-8))
+
+
+class QuotaExceeded(Exception):
+    """Raised when a call would go over the daily quota."""
+
+
+class QuotaScheduler:
+    """Every API call goes through here: daily quota, rate limit, and retries.
+
+    - Units: each call reserves its endpoint's cost (QUOTA_COSTS) up front
+      and is refused with QuotaExceeded if that would pass units_per_day.
+      Used units are kept in a JSON file (locked while updated), so
+      concurrent and successive CLI runs share one daily budget.
+    - Rate: a token bucket allows requests_per_second on average, with
+      short bursts up to `burst`.
+    - Retries: 429, 5xx and 403 rateLimitExceeded are retried with
+      exponential backoff and full jitter. A 403 quotaExceeded is not -
+      it marks the day as spent, so later calls fail fast.
+    """
+
+    def __init__(
+        self,
+        units_per_day: int = DEFAULT_DAILY_QUOTA,
+        requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+        burst: int | None = None,
+        path: Path | None = DEFAULT_QUOTA_PATH,
+        max_retries: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+    ):
+        self.units_per_day = units_per_day
+        self.requests_per_second = requests_per_second
+        self.burst = burst or max(1, int(requests_per_second))
+        self.path = Path(path) if path is not None else None  # None = in memory only
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._refilled_at = time.monotonic()
+        self._state = {"date": self._today(), "used": 0}
+
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.now(QUOTA_TIMEZONE).date().isoformat()
+
+    @contextmanager
+    def _locked_state(self) -> Iterator[dict]:
+        """Read-modify-write the day's usage under a thread and file lock."""
+        with self._lock:
+            if self.path is None:
+                state = self._state
+            else:
+                lock_file = open(self.path.with_suffix(".lock"), "w")
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    state = json.loads(self.path.read_text())
+                except (OSError, ValueError):
+                    state = {}
+
+            if state.get("date") != self._today():
+                state = {"date": self._today(), "used": 0}
+
+            try:
+                yield state
+            finally:
+                if self.path is None:
+                    self._state = state
+                else:
+                    tmp_path = self.path.with_suffix(".tmp")
+                    tmp_path.write_text(json.dumps(state))
+                    os.replace(tmp_path, self.path)
+                    lock_file.close()  # Releases the flock
+
+    def used(self) -> int:
+        """Units used today (across every process sharing the quota file)."""
+        with self._locked_state() as state:
+            return state["used"]
+
+    def remaining(self) -> int:
+        return max(0, self.units_per_day - self.used())
+
+    def reserve(self, endpoint: str) -> None:
+        """Charge one call's cost against today's quota, or raise QuotaExceeded."""
+        cost = QUOTA_COSTS.get(endpoint, 1)
+        with self._locked_state() as state:
+            if state["used"] + cost > self.units_per_day:
+                raise QuotaExceeded(
+                    f"Daily quota exhausted: {endpoint} needs {cost} units, "
+                    f"{self.units_per_day - state['used']} of {self.units_per_day} left "
+                    "(resets at midnight Pacific Time)"
+                )
+            state["used"] += cost
+
+    def _exhaust(self) -> None:
+        """The API says the quota is gone - believe it for the rest of the day."""
+        with self._locked_state() as state:
+            state["used"] = max(state["used"], self.units_per_day)
+
+    def _wait_for_token(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._refilled_at
+                self._tokens = min(self.burst, self._tokens + elapsed * self.requests_per_second)
+                self._refilled_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.requests_per_second
+            time.sleep(wait)
+
+    def run(self, endpoint: str, execute: Callable[[], Any]) -> Any:
+        """Run one API call (execute) within the quota and rate limits.
+
+        Every attempt, including retries, is charged - the API bills
+        failed requests too.
+        """
+        for attempt in range(self.max_retries + 1):
+            self.reserve(endpoint)
+            self._wait_for_token()
+            try:
+                return execute()
+            except HttpError as e:
+                if e.resp.status == 403 and api_error_reason(e) in QUOTA_EXCEEDED_REASONS:
+                    self._exhaust()
+                    raise QuotaExceeded(f"YouTube API quota exceeded ({endpoint})") from e
+                if not is_transient_error(e) or attempt == self.max_retries:
+                    raise
+            except Exception as e:
+                if not is_transient_error(e) or attempt == self.max_retries:
+                    raise
+
+            # Full jitter keeps concurrent retries from hitting the API in lockstep
+            time.sleep(random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt)))
+
+
+# =============================================================================
+# YouTube Service
+# =============================================================================
+
+
+class YouTubeService:
+    """YouTube Data API v3 wrapper providing research tools."""
+
+    def __init__(
+        self,
+        api_key: str,
+        cache: ResponseCache | None = None,
+        scheduler: QuotaScheduler | None = None,
+        field_masks: dict[str, str | None] | None = None,
+        transcripts: TranscriptStore | None = None,
+        snapshots: SnapshotStore | None = None,
+        channels: ChannelStore | None = None,
+        index: ChannelIndex | None = None,
+        transport: Callable[[], Any] | None = None,
+    ):
+        """
+        Args:
+            api_key: YouTube Data API key
+            cache: Local response cache (None = always call the API)
+            scheduler: Shared quota/rate limiter (default: in-memory only)
+            field_masks: Per-endpoint overrides of FIELD_MASKS - a wider mask
+                if you need more fields, or None for full responses
+            transcripts: Local transcript store (None = always download)
+            snapshots: Video statistics time series, appended to on every
+                videos.list fetch (None = don't record)
+            channels: Synced channels and their watermarks (needed for
+                sync_channel)
+            index: Resolved channels, for resolving without API calls
+                (default: in-memory only)
+            transport: Makes an HTTP connection (called once per thread);
+                anything with httplib2's request() works, e.g. the fake API
+                in benchmarks/fake_api.py (default: build_http)
+        """
+        self.api_key = api_key
+        self.field_masks = {**FIELD_MASKS, **(field_masks or {})}
+        self.transcripts = transcripts
+        self.snapshots = snapshots
+        self.channels = channels
+        self.index = index or ChannelIndex(path=None)
+        self.transport = transport
+        self._youtube = None
+        self.cache = cache
+        self.scheduler = scheduler or QuotaScheduler(path=None)
+        self.quota_used = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def youtube(self):
+        """The API client, built on first use - cache hits never need it."""
+        with self._lock:
+            if self._youtube is None:
+                discovery = lazy_import("googleapiclient.discovery")
+                self._youtube = discovery.build("youtube", "v3", developerKey=self.api_key)
+        return self._youtube
+
+    def _http(self):
+        """Per-thread HTTP connection (httplib2 is not thread-safe)."""
+        if not hasattr(self._local, "http"):
+            transport = self.transport or lazy_import("googleapiclient.http").build_http
+            self._local.http = transport()
+        return self._local.http
+
+    def _add_quota(self, endpoint: str) -> None:
+        cost = QUOTA_COSTS.get(endpoint, 1)
+        with self._lock:
+            self.quota_used += cost
+            for scope in _quota_scopes.get():
+                scope.units += cost
+
+    @contextmanager
+    def _track_quota(self) -> Iterator[QuotaScope]:
+        """Count the quota spent by everything called inside the block."""
+        scope = QuotaScope()
+        token = _quota_scopes.set(_quota_scopes.get() + (scope,))
+        try:
+            yield scope
+        finally:
+            _quota_scopes.reset(token)
+
+    def _call(self, endpoint: str, **params: Any) -> dict:
+        """Execute an API call like "videos.list", tracking its quota cost.
+
+        With a cache: fresh responses are served locally, stale ones are
+        revalidated with If-None-Match, and offline mode never touches the
+        network (raising CacheMiss instead).
+
+        The endpoint's field mask is sent unless params has its own fields=.
+        videos.list responses from the network (not the cache) are recorded
+        as statistics snapshots.
+        """
+        params.setdefault("fields", self.field_masks.get(endpoint))
+        cached = None
+        if self.cache is not None:
+            key = ResponseCache.key(endpoint, params)
+            cached = self.cache.get(key)
+            if cached is not None:
+                body, _, age = cached
+                if self.cache.offline or self.cache.is_fresh(endpoint, age):
+                    return body
+            if self.cache.offline:
+                raise CacheMiss(f"Not cached (offline mode): {endpoint} {params}")
+
+        resource, method = endpoint.split(".")
+        request = getattr(getattr(self.youtube, resource)(), method)(**params)
+        if cached is not None and cached[1]:
+            request.headers["If-None-Match"] = cached[1]
+
+        try:
+            response = self.scheduler.run(
+                endpoint, lambda: request.execute(http=self._http())
+            )
+        except HttpError as e:
+            if e.resp.status == 304 and cached is not None:
+                self._add_quota(endpoint)
+                self.cache.touch(key)
+                self._record_snapshots(endpoint, cached[0])  # Unchanged as of now
+                return cached[0]
+            raise
+
+        self._add_quota(endpoint)
+        if self.cache is not None:
+            self.cache.put(key, endpoint, response)
+        self._record_snapshots(endpoint, response)
+        return response
+
+    def _record_snapshots(self, endpoint: str, response: dict) -> None:
+        if self.snapshots is not None and endpoint == "videos.list":
+            self.snapshots.record(response.get("items", []))
+
+    def resolve_channel(self, channel_input: str) -> ChannelInfo | dict:
+        """Resolve a channel from @handle, URL, or channel ID."""
+        return self.resolve_channels([channel_input])[channel_input]
+
+    def resolve_channels(
+        self, channel_inputs: list[str], max_workers: int = 8
+    ) -> dict[str, ChannelInfo | dict]:
+        """Resolve many channels (@handles, URLs, IDs) in as few calls as possible.
+
+        Channels in the index resolve for free. Channel IDs - given, or
+        known from an earlier lookup of the handle - are fetched 50 per
+        channels.list call. Handles seen for the first time cost one
+        forHandle call each (1 unit, where a channel search costs 100),
+        made concurrently. A legacy /c/ URL or bare name that forHandle
+        doesn't match falls back to a channel search (100 units, once:
+        the match is indexed). Everything fetched goes into the index.
+
+        Returns each input's ChannelInfo, or an {"error": ...} dict.
+        """
+        now = time.time()
+        results: dict[str, ChannelInfo | dict] = {}
+        by_id: dict[str, list[str]] = {}  # Channel ID -> inputs
+        by_handle: dict[str, list[str]] = {}  # Unknown handle -> inputs
+        by_name: dict[str, list[str]] = {}  # Handle forHandle missed -> /c/ or bare inputs
+
+        for channel_input in channel_inputs:
+            key = self._parse_channel_input(channel_input)
+            if key is None:
+                error = f"Could not parse channel input: {channel_input}"
+                results[channel_input] = {"error": error}
+                continue
+            channel_info = self.index.get(key, now)
+            if channel_info is not None:
+                results[channel_input] = channel_info
+                continue
+            channel_id = self.index.channel_id(key)
+            if channel_id is None and not key.startswith("@"):
+                channel_id = key
+            if channel_id is not None:
+                by_id.setdefault(channel_id, []).append(channel_input)
+            else:
+                by_handle.setdefault(self.index.normalize(key), []).append(channel_input)
+
+        def lookup(**params: str) -> tuple[list[dict], dict | None]:
+            try:
+                response = self._call(
+                    "channels.list", part="snippet,statistics,contentDetails", **params
+                )
+                return response.get("items", []), None
+            except HttpError as e:
+                return [], {"error": f"YouTube API error: {e.reason}"}
+            except Exception as e:
+                return [], {"error": f"Error resolving channel: {str(e)}"}
+
+        ids = list(by_id)
+        calls = [
+            ("id", ids[i : i + CHANNELS_PER_CALL]) for i in range(0, len(ids), CHANNELS_PER_CALL)
+        ]
+        calls += [("forHandle", [handle]) for handle in by_handle]
+        if calls:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as pool:
+                futures = [
+                    submit_with_context(pool, lookup, **{kind: ",".join(keys)})
+                    for kind, keys in calls
+                ]
+                responses = [future.result() for future in futures]
+        else:
+            responses = []
+
+        for (kind, keys), (items, error) in zip(calls, responses):
+            found = {}
+            for item in items:
+                channel_info = self._parse_channel_item(item)
+                if channel_info is not None:
+                    found[channel_info.channel_id] = channel_info
+            for key in keys:
+                inputs = by_id[key] if kind == "id" else by_handle[key]
+                channel_info = found.get(key) if kind == "id" else next(iter(found.values()), None)
+                if channel_info is None:
+                    names = [i for i in inputs if self._is_legacy_name(i)]
+                    if kind == "forHandle" and not error and names:
+                        by_name[key] = names
+                    for channel_input in inputs:
+                        results[channel_input] = error or {"error": f"Channel not found: {key}"}
+                    continue
+                self.index.put(channel_info, [key] if kind == "forHandle" else [], now)
+                for channel_input in inputs:
+                    results[channel_input] = channel_info
+
+        def search(key: str) -> ChannelInfo | dict | None:
+            try:
+                response = self._call(
+                    "search.list", part="snippet", q=key[1:], type="channel", maxResults=1
+                )
+            except HttpError as e:
+                return {"error": f"YouTube API error: {e.reason}"}
+            except Exception as e:
+                return {"error": f"Error resolving channel: {str(e)}"}
+            items = response.get("items", [])
+            if not items:
+                return None
+            items, error = lookup(id=items[0]["snippet"]["channelId"])
+            return error or next(filter(None, map(self._parse_channel_item, items)), None)
+
+        if by_name:
+            # Custom URLs predate handles and needn't match one: search by name
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(by_name))) as pool:
+                futures = {key: submit_with_context(pool, search, key) for key in by_name}
+            for key, future in futures.items():
+                channel_info = future.result()
+                if isinstance(channel_info, ChannelInfo):
+                    self.index.put(channel_info, [key], now)
+                for channel_input in by_name[key]:
+                    results[channel_input] = channel_info or results[channel_input]
+
+        self.index.save()
+        return {channel_input: results[channel_input] for channel_input in channel_inputs}
+
+    @staticmethod
+    def _parse_channel_item(item: dict) -> ChannelInfo | None:
+        """Parse a channels.list item into a ChannelInfo."""
+        try:
+            snippet = item["snippet"]
+            stats = item.get("statistics", {})
+            return ChannelInfo(
+                channel_id=item["id"],
+                handle=snippet.get("customUrl"),
+                name=snippet["title"],
+                subscriber_count=int(stats.get("subscriberCount", 0)),
+                total_video_count=int(stats.get("videoCount", 0)),
+                uploads_playlist_id=item.get("contentDetails", {})
+                .get("relatedPlaylists", {})
+                .get("uploads"),
+            )
+        except (KeyError, ValueError):
+            return None
+
+    def get_channel_videos(
+        self,
+        channel_id: str,
+        days_back: int = 30,
+        max_results: int = 50,
+        channel_info: ChannelInfo | None = None,
+        score: str | None = "zscore",
+    ) -> ChannelVideosResponse | dict:
+        """Get videos from a channel with performance metrics and outlier analysis.
+
+        Pages through the channel's uploads playlist (1 unit per 50 videos)
+        instead of search.list (100 units per call, capped at 50 results).
+        Pass the ChannelInfo from resolve_channel to skip the channel lookup.
+        score picks the outlier score (see OUTLIER_SCORES); None leaves the
+        videos unscored, for a caller scoring several channels together.
+        """
+        with self._track_quota() as quota:
+            try:
+                if channel_info and channel_info.uploads_playlist_id:
+                    channel_name = channel_info.name
+                    uploads_playlist_id = channel_info.uploads_playlist_id
+                else:
+                    channel_response = self._call(
+                        "channels.list", part="snippet,contentDetails", id=channel_id
+                    )
+                    if not channel_response.get("items"):
+                        return {"error": f"Channel not found: {channel_id}"}
+
+                    item = channel_response["items"][0]
+                    channel_name = item["snippet"]["title"]
+                    uploads_playlist_id = item["contentDetails"]["relatedPlaylists"]["uploads"]
+
+                published_after = datetime.now(timezone.utc) - timedelta(days=days_back)
+                video_ids = self._fetch_upload_ids(
+                    uploads_playlist_id, published_after, max_results
+                )
+
+                videos = self._fetch_video_details(video_ids) if video_ids else []
+
+                if not videos:
+                    return ChannelVideosResponse(
+                        channel_name=channel_name,
+                        period_days=days_back,
+                        total_videos=0,
+                        avg_views=0.0,
+                        std_dev_views=0.0,
+                        videos=[],
+                        quota_used=quota.units,
+                    )
+
+                avg_views, std_dev_views = (
+                    score_outliers(videos, score) if score else view_stats(videos)
+                )
+
+                return ChannelVideosResponse(
+                    channel_name=channel_name,
+                    period_days=days_back,
+                    total_videos=len(videos),
+                    avg_views=round(avg_views, 2),
+                    std_dev_views=round(std_dev_views, 2),
+                    videos=videos,
+                    quota_used=quota.units,
+                )
+
+            except HttpError as e:
+                return {"error": f"YouTube API error: {e.reason}"}
+            except Exception as e:
+                return {"error": f"Error fetching channel videos: {str(e)}"}
+
+    def sync_channel(
+        self,
+        channel_input: str,
+        days_back: int = 30,
+        max_results: int = 500,
+        score: str = "zscore",
+    ) -> ChannelSyncResponse | dict:
+        """Bring a channel's videos in the channel store up to date, cheaply.
+
+        The first sync resolves the channel and lists its uploads back
+        days_back, like get_channel_videos. After that the channel isn't
+        resolved again (a @handle costs 100 units via search), and the
+        watermark - the newest upload seen - means only newer uploads are
+        listed, usually one 1-unit page. A wider days_back than any sync
+        so far (or a listing max_results cut short) is listed in full
+        instead, so older uploads are never skipped. Stats for every stored video
+        published within days_back are refreshed in 50-ID videos.list
+        batches, and the results merged back into the store.
+        """
+        if self.channels is None:
+            return {"error": "sync_channel needs a channel store"}
+
+        with self._track_quota() as quota:
+            try:
+                state = self._channel_state(channel_input)
+                if isinstance(state, dict):
+                    return state
+
+                now = time.time()
+                published_after = sync_cutoff(now, days_back)
+                new_ids = self._list_new_uploads(state, published_after, max_results)
+                new_set = set(new_ids)
+                video_ids = new_ids + [
+                    v
+                    for v in self.channels.video_ids(state.channel_id, published_after.isoformat())
+                    if v not in new_set
+                ]
+
+                videos = self._fetch_video_details(video_ids) if video_ids else []
+                avg_views, std_dev_views = (
+                    score_outliers(videos, score) if videos else (0.0, 0.0)
+                )
+                new_videos = self._merge_synced(state, new_set, videos, now)
+
+                return ChannelSyncResponse(
+                    channel_id=state.channel_id,
+                    channel_name=state.name,
+                    period_days=days_back,
+                    new_videos=len(new_videos),
+                    refreshed_videos=len(videos) - len(new_videos),
+                    total_videos=len(videos),
+                    avg_views=round(avg_views, 2),
+                    std_dev_views=round(std_dev_views, 2),
+                    videos=videos,
+                    quota_used=quota.units,
+                )
+
+            except HttpError as e:
+                return {"error": f"YouTube API error: {e.reason}"}
+            except Exception as e:
+                return {"error": f"Error syncing channel: {str(e)}"}
+
+    def _channel_state(self, channel_input: str) -> ChannelState | dict:
+        """The stored sync state of a channel, or a fresh one (resolving it)."""
+        key = self._parse_channel_input(channel_input)
+        if key is None:
+            return {"error": f"Could not parse channel input: {channel_input}"}
+
+        state = self.channels.find(key)
+        if state is not None:
+            return state
+
+        channel_info = self.resolve_channel(channel_input)
+        if isinstance(channel_info, dict):
+            return channel_info
+        return ChannelState(
+            channel_id=channel_info.channel_id,
+            name=channel_info.name,
+            handle=channel_info.handle,
+            uploads_playlist_id=channel_info.uploads_playlist_id,
+        )
+
+    def _list_new_uploads(
+        self, state: ChannelState, published_after: datetime, max_results: int
+    ) -> list[str]:
+        """Uploads since published_after that aren't in the store yet, newest first.
+
+        If earlier syncs listed everything back to published_after, only
+        uploads newer than the watermark are listed. Otherwise (a wider
+        window, or a first sync) the whole window is. Moves the state's
+        watermark and synced_since; _merge_synced saves them.
+        """
+        covered = (
+            state.watermark_video_id is not None
+            and state.synced_since is not None
+            and datetime.fromisoformat(state.synced_since.replace("Z", "+00:00"))
+            <= published_after
+        )
+        uploads, stopped = self._scan_uploads(
+            state.uploads_playlist_id,
+            published_after,
+            max_results,
+            stop_at=state.watermark_video_id if covered else None,
+            stop_before=state.watermark_published_at if covered else None,
+        )
+
+        if uploads:
+            state.watermark_video_id, state.watermark_published_at = uploads[0]
+        if stopped == "limit":
+            # Cut short by max_results: complete only down to the last one listed
+            if uploads:
+                state.synced_since = uploads[-1][1]
+        elif stopped != "watermark":
+            state.synced_since = published_after.isoformat()
+
+        if covered:
+            return [video_id for video_id, _ in uploads]
+        stored = set(self.channels.video_ids(state.channel_id, published_after.isoformat()))
+        return [video_id for video_id, _ in uploads if video_id not in stored]
+
+    def _merge_synced(
+        self, state: ChannelState, new_ids: set[str], videos: list[Video], now: float
+    ) -> list[Video]:
+        """Store refreshed videos and the state _list_new_uploads moved; returns the new ones."""
+        self.channels.put_videos(state.channel_id, videos)
+
+        new_videos = [v for v in videos if v.video_id in new_ids]
+        state.synced_at = now
+        self.channels.save_channel(state)
+        return new_videos
+
+    def get_many_channels(
+        self,
+        channel_inputs: list[str],
+        days_back: int = 30,
+        max_results: int = 50,
+        max_workers: int = 8,
+        quota_budget: int | None = None,
+        top_n: int = 20,
+        on_result: Callable[[str, ChannelVideosResponse | dict], None] | None = None,
+        score: str = "zscore",
+    ) -> CompareChannelsResponse:
+        """Analyze many channels concurrently and rank outliers across all of them.
+
+        All channels are resolved up front in one batch (see
+        resolve_channels), then each is fetched in a worker thread. on_result
+        is called (in the caller's thread) as each channel finishes, so
+        results can be streamed while slower channels are still running.
+        Once quota_budget units are spent, channels not yet started are
+        skipped. A repeated input is analyzed (and listed) once.
+
+        Robust scores are computed in one grouped pass over every channel,
+        once all are fetched (so on_result calls wait for that), letting
+        channels with few videos borrow the pooled age slope.
+        """
+        channel_inputs = list(dict.fromkeys(channel_inputs))
+        with self._track_quota() as quota:
+            resolved = self.resolve_channels(channel_inputs, max_workers=max_workers)
+
+            def analyze(channel_input: str) -> ChannelVideosResponse | dict:
+                if quota_budget is not None and quota.units >= quota_budget:
+                    return {"error": "Quota budget exhausted"}
+                channel_info = resolved[channel_input]
+                if isinstance(channel_info, dict):
+                    return channel_info
+                return self.get_channel_videos(
+                    channel_id=channel_info.channel_id,
+                    days_back=days_back,
+                    max_results=max_results,
+                    channel_info=channel_info,
+                    score=None if score == "robust" else score,
+                )
+
+            results: dict[str, ChannelVideosResponse | dict] = {}
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = {
+                    submit_with_context(pool, analyze, c): c for c in channel_inputs
+                }
+                for future in as_completed(futures):
+                    channel_input = futures[future]
+                    results[channel_input] = future.result()
+                    if on_result and score != "robust":
+                        on_result(channel_input, results[channel_input])
+
+            if score == "robust":
+                fetched = [
+                    (resolved[c].channel_id, results[c])
+                    for c in results
+                    if not isinstance(results[c], dict)
+                ]
+                videos = [video for _, result in fetched for video in result.videos]
+                groups = [channel_id for channel_id, result in fetched for _ in result.videos]
+                if videos:
+                    score_outliers(videos, score, groups)
+                for _, result in fetched:
+                    result.videos.sort(key=lambda v: v.outlier_score or 0, reverse=True)
+                if on_result:
+                    for channel_input, result in results.items():
+                        on_result(channel_input, result)
+
+            channels = []
+            all_videos: list[Video] = []
+            for channel_input in channel_inputs:
+                result = results[channel_input]
+                if isinstance(result, dict):
+                    channels.append({"input": channel_input, "error": result["error"]})
+                    continue
+                channels.append(
+                    {
+                        "input": channel_input,
+                        "channel_name": result.channel_name,
+                        "total_videos": result.total_videos,
+                        "avg_views": result.avg_views,
+                        "std_dev_views": result.std_dev_views,
+                        "outliers": sum(1 for v in result.videos if v.is_outlier),
+                    }
+                )
+                all_videos.extend(result.videos)
+
+            # Outlier scores are relative to each video's own channel, so they
+            # compare fairly across channels of very different sizes
+            all_videos.sort(key=lambda v: v.outlier_score or 0, reverse=True)
+
+            return CompareChannelsResponse(
+                period_days=days_back,
+                channels=channels,
+                top_outliers=all_videos[:top_n],
+                quota_used=quota.units,
+            )
+
+    def iter_search_videos(
+        self,
+        query: str,
+        max_results: int = 25,
+        days_back: int | None = None,
+        order_by: str = "relevance",
+        stats: SearchStats | None = None,
+    ) -> Iterator[Video]:
+        """Yield search results page by page, past the API's 50-per-call cap.
+
+        The next search page is requested in the background while video
+        details for the current page are fetched, so the two round trips
+        overlap. Pass a SearchStats to keep running aggregates as videos
+        are yielded. Each page costs 100 quota units.
+        """
+        order_map = {
+            "relevance": "relevance",
+            "view_count": "viewCount",
+            "date": "date",
+        }
+        search_params: dict[str, Any] = {
+            "part": "id",
+            "q": query,
+            "type": "video",
+            "order": order_map.get(order_by, "relevance"),
+        }
+
+        if days_back is not None:
+            published_after = datetime.now(timezone.utc) - timedelta(days=days_back)
+            # Round to the hour so repeat searches share a cache key
+            published_after = published_after.replace(minute=0, second=0, microsecond=0)
+            search_params["publishedAfter"] = published_after.isoformat()
+
+        remaining = max_results
+        with ThreadPoolExecutor(max_workers=1) as pool:
+
+            def request_page(page_token: str | None = None):
+                return submit_with_context(
+                    pool,
+                    self._call,
+                    "search.list",
+                    **search_params,
+                    maxResults=min(50, remaining),
+                    pageToken=page_token,
+                )
+
+            next_page = request_page()
+            while next_page is not None:
+                search_response = next_page.result()
+                video_ids = [
+                    item["id"]["videoId"] for item in search_response.get("items", [])
+                ][:remaining]
+                remaining -= len(video_ids)
+                if stats is not None:
+                    stats.total_results = search_response.get("pageInfo", {}).get(
+                        "totalResults", 0
+                    )
+
+                page_token = search_response.get("nextPageToken")
+                next_page = None
+                if page_token and video_ids and remaining > 0:
+                    next_page = request_page(page_token)
+
+                for video in self._fetch_video_details(video_ids) if video_ids else []:
+                    if stats is not None:
+                        stats.add(video)
+                    yield video
+
+    def search_videos(
+        self,
+        query: str,
+        max_results: int = 25,
+        days_back: int | None = None,
+        order_by: str = "relevance",
+        on_result: Callable[[Video], None] | None = None,
+    ) -> SearchResponse | dict:
+        """Search YouTube videos by keyword.
+
+        on_result is called with each video as its page arrives, so
+        results can be streamed before the search finishes.
+        """
+        with self._track_quota() as quota:
+            try:
+                stats = SearchStats()
+                videos = []
+                for video in self.iter_search_videos(
+                    query, max_results, days_back, order_by, stats=stats
+                ):
+                    videos.append(video)
+                    if on_result:
+                        on_result(video)
+
+                return SearchResponse(
+                    query=query,
+                    total_results=stats.total_results if videos else 0,
+                    avg_views=round(stats.avg_views, 2),
+                    top_channels=stats.top_channels(),
+                    videos=videos,
+                    quota_used=quota.units,
+                )
+
+            except HttpError as e:
+                return {"error": f"YouTube API error: {e.reason}"}
+            except Exception as e:
+                return {"error": f"Error searching videos: {str(e)}"}
+
+    def _fetch_transcript(self, video_id: str) -> StoredTranscript:
+        """Download every timestamped segment of a transcript (English preferred).
+
+        Videos that simply have no transcript come back with error set;
+        anything that might work on a retry (network, rate limiting) raises.
+        """
+        transcript_api = lazy_import("youtube_transcript_api")
+        errors = lazy_import("youtube_transcript_api._errors")
+        try:
+            api = transcript_api.YouTubeTranscriptApi()
+            # Try English first, then fall back to any available language
+            try:
+                transcript = api.fetch(video_id, languages=["en"])
+                language = "en"
+            except errors.NoTranscriptFound:
+                # Fall back to first available transcript
+                transcript_list = api.list(video_id)
+                transcript = transcript_list.find_transcript(
+                    [t.language_code for t in transcript_list]
+                ).fetch()
+                language = getattr(transcript, "language_code", "unknown")
+
+        except errors.TranscriptsDisabled:
+            error = f"Transcripts are disabled for video: {video_id}"
+        except errors.NoTranscriptFound:
+            error = f"No transcript found for video: {video_id}"
+        except errors.VideoUnavailable:
+            error = f"Video unavailable: {video_id}"
+        else:
+            return StoredTranscript(
+                video_id=video_id,
+                language=language,
+                is_generated=getattr(transcript, "is_generated", False),
+                segments=[(s.start, s.duration, s.text) for s in transcript],
+            )
+
+        return StoredTranscript(video_id, None, False, [], error=error)
+
+    def _load_transcript(self, video_id: str, refresh: bool = False) -> StoredTranscript:
+        """A transcript from the store, fetching (and storing) it if needed."""
+        if self.transcripts is not None and not refresh:
+            stored = self.transcripts.get(video_id)
+            if stored is not None:
+                return stored
+
+        transcript = self._fetch_transcript(video_id)
+        if self.transcripts is not None:
+            self.transcripts.put(transcript)
+        return transcript
+
+    def get_transcript(
+        self,
+        video_id: str,
+        max_chars: int = 5000,
+        start: float | None = None,
+        end: float | None = None,
+        refresh: bool = False,
+    ) -> dict:
+        """Get video transcript/captions, optionally only from start to end seconds.
+
+        With a transcript store, the full transcript is downloaded once and
+        every later call (any max_chars or time range) is served locally.
+        """
+        try:
+            transcript = self._load_transcript(video_id, refresh)
+        except Exception as e:
+            return {"error": f"Error fetching transcript: {str(e)}"}
+
+        if transcript.error:
+            return {"error": transcript.error}
+
+        full_text = transcript.text(start, end)
+
+        if len(full_text) > max_chars:
+            full_text = full_text[:max_chars] + "... [truncated]"
+
+        return {
+            "video_id": video_id,
+            "language": transcript.language,
+            "is_generated": transcript.is_generated,
+            "transcript": full_text,
+        }
+
+    def get_transcripts(
+        self,
+        video_ids: list[str],
+        max_workers: int = 4,
+        delay: float = 0.5,
+        refresh: bool = False,
+        on_result: Callable[[dict], None] | None = None,
+    ) -> dict:
+        """Harvest many transcripts into the transcript store.
+
+        Up to max_workers downloads run at once, but new ones start at most
+        every `delay` seconds - the transcript endpoint isn't part of the
+        official API and blocks clients that hammer it. Videos already in
+        the store are skipped unless refresh. on_result is called with each
+        video's outcome as it finishes.
+        """
+        video_ids = list(dict.fromkeys(video_ids))  # Dedupe, keep order
+        stored = set()
+        if self.transcripts is not None and not refresh:
+            stored = self.transcripts.stored_ids(video_ids)
+
+        lock = threading.Lock()
+        next_start = time.monotonic()
+
+        def harvest(video_id: str) -> dict:
+            nonlocal next_start
+            with lock:
+                now = time.monotonic()
+                start_at = max(now, next_start)
+                next_start = start_at + delay
+            time.sleep(start_at - now)
+
+            try:
+                transcript = self._fetch_transcript(video_id)
+            except Exception as e:
+                # Not stored, so the next run tries again
+                return {"video_id": video_id, "status": "failed", "error": str(e)}
+
+            if self.transcripts is not None:
+                self.transcripts.put(transcript)
+            if transcript.error:
+                return {"video_id": video_id, "status": "unavailable", "error": transcript.error}
+            return {
+                "video_id": video_id,
+                "status": "fetched",
+                "language": transcript.language,
+                "segment_count": len(transcript.segments),
+            }
+
+        results = [{"video_id": v, "status": "stored"} for v in video_ids if v in stored]
+        if on_result:
+            for result in results:
+                on_result(result)
+
+        to_fetch = [v for v in video_ids if v not in stored]
+        if to_fetch:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = [pool.submit(harvest, video_id) for video_id in to_fetch]
+                for future in as_completed(futures):
+                    results.append(future.result())
+                    if on_result:
+                        on_result(results[-1])
+
+        counts = {"stored": 0, "fetched": 0, "unavailable": 0, "failed": 0}
+        for result in results:
+            counts[result["status"]] += 1
+
+        return {"total": len(video_ids), **counts, "results": results}
+
+    @staticmethod
+    def _is_legacy_name(channel_input: str) -> bool:
+        """True for a /c/ custom URL or a bare name (read as a handle, but may not be one)."""
+        channel_input = channel_input.strip()
+        return bool(
+            CHANNEL_URL_PATTERNS[2].match(channel_input) or BARE_HANDLE_PATTERN.match(channel_input)
+        )
+
+    def _parse_channel_input(self, channel_input: str) -> str | None:
+        """Parse channel input and return channel ID or @handle."""
+        channel_input = channel_input.strip()
+
+        if channel_input.startswith("@"):
+            return channel_input
+
+        for pattern in CHANNEL_URL_PATTERNS:
+            match = pattern.match(channel_input)
+            if match:
+                result = match.group(1)
+                if not result.startswith("UC"):
+                    return f"@{result}"
+                return result
+
+        if channel_input.startswith("UC"):
+            return channel_input
+
+        if BARE_HANDLE_PATTERN.match(channel_input):
+            return f"@{channel_input}"
+
+        return None
+
+    def _fetch_upload_ids(
+        self,
+        uploads_playlist_id: str,
+        published_after: datetime,
+        max_results: int,
+    ) -> list[str]:
+        """Page through an uploads playlist, newest first, until past the cutoff."""
+        uploads, _ = self._scan_uploads(uploads_playlist_id, published_after, max_results)
+        return [video_id for video_id, _ in uploads]
+
+    def _scan_uploads(
+        self,
+        uploads_playlist_id: str,
+        published_after: datetime,
+        max_results: int,
+        stop_at: str | None = None,
+        stop_before: str | None = None,
+    ) -> tuple[list[tuple[str, str]], str]:
+        """Page through an uploads playlist, newest first.
+
+        Stops at the video ID stop_at or anything published before
+        stop_before ("watermark"), past the cutoff ("cutoff"), at the end
+        of the playlist ("end") or after max_results ("limit"). Returns
+        (video ID, publish time) pairs and why the scan stopped.
+        """
+        uploads: list[tuple[str, str]] = []
+        page_token = None
+        if stop_before is not None:
+            stop_before = datetime.fromisoformat(stop_before.replace("Z", "+00:00"))
+
+        while len(uploads) < max_results:
+            response = self._call(
+                "playlistItems.list",
+                part="contentDetails",
+                playlistId=uploads_playlist_id,
+                maxResults=min(50, max_results - len(uploads)),
+                pageToken=page_token,
+            )
+
+            for item in response.get("items", []):
+                details = item["contentDetails"]
+                if details["videoId"] == stop_at:
+                    return uploads, "watermark"
+                # Private and deleted videos have no publish time
+                if "videoPublishedAt" not in details:
+                    continue
+                published_at = datetime.fromisoformat(
+                    details["videoPublishedAt"].replace("Z", "+00:00")
+                )
+                # Uploads are newest first, so the first old video ends the scan
+                if published_at < published_after:
+                    return uploads, "cutoff"
+                if stop_before is not None and published_at < stop_before:
+                    return uploads, "watermark"  # The watermark video is gone
+                uploads.append((details["videoId"], details["videoPublishedAt"]))
+
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                return uploads, "end"
+
+        return uploads, "limit"
+
+    def _fetch_video_details(
+        self,
+        video_ids: list[str],
+        max_workers: int = 8,
+    ) -> list[Video]:
+        """Fetch detailed video information for a list of video IDs.
+
+        Batches of 50 IDs are fetched concurrently; the scheduler retries a
+        batch that hits a transient error, without re-fetching the others.
+        Videos come back in the same order as video_ids. With a snapshot
+        store, views_per_hour is measured over the last VELOCITY_WINDOW_HOURS.
+        """
+        batches = [video_ids[i : i + 50] for i in range(0, len(video_ids), 50)]
+        if not batches:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as pool:
+            futures = [
+                submit_with_context(
+                    pool,
+                    self._call,
+                    "videos.list",
+                    part="snippet,statistics",
+                    id=",".join(batch),
+                )
+                for batch in batches
+            ]
+            responses = [future.result() for future in futures]
+
+        videos = []
+        for response in responses:
+            for item in response.get("items", []):
+                video = self._parse_video_item(item)
+                if video:
+                    videos.append(video)
+
+        if self.snapshots is not None and videos:
+            measured = {
+                growth.video_id: growth.views_per_hour
+                for growth in self.snapshots.growth(
+                    VELOCITY_WINDOW_HOURS, video_ids=[v.video_id for v in videos]
+                )
+            }
+            for video in videos:
+                video.views_per_hour = measured.get(video.video_id)
+
+        return videos
+
+    def _parse_video_item(self, item: dict) -> Video | None:
+        """Parse a YouTube API video item into a Video."""
+        record = parse_video_item(item)
+        return Video(**record) if record else None
+
+
+# =============================================================================
+# YouTube Uploader (OAuth)
+# =============================================================================
+
+# OAuth scopes for uploading
+UPLOAD_SCOPES = [
+    "https://www.googleapis.com/auth/youtube.upload",
+    "https://www.googleapis.com/auth/youtube.force-ssl",
+]
+
+DEFAULT_TOKEN_PATH = Path.home() / ".youtube-agent" / "token.json"
+DEFAULT_UPLOADS_DIR = Path.home() / ".youtube-agent" / "uploads"
+
+# Resumable upload chunks must be multiples of 256 KiB (except the last).
+# Chunk size follows measured throughput, so each chunk takes about
+# UPLOAD_CHUNK_SECONDS: big enough to keep the connection busy, small
+# enough that a failed chunk doesn't cost much to resend.
+UPLOAD_CHUNK_ALIGN = 256 * 1024
+UPLOAD_MIN_CHUNK = UPLOAD_CHUNK_ALIGN
+UPLOAD_MAX_CHUNK = 256 * 1024 * 1024
+UPLOAD_INITIAL_CHUNK = 1024 * 1024
+UPLOAD_CHUNK_SECONDS = 10.0
+UPLOAD_SESSION_TTL = 6 * 24 * 3600  # The API expires upload sessions after a week
+
+
+@dataclass(slots=True)
+class UploadProgress:
+    """An upload progress event, sent to upload's on_progress after each chunk."""
+
+    video_path: str
+    bytes_sent: int  # Confirmed by the server
+    total_bytes: int
+    chunk_size: int  # For the next chunk
+    bytes_per_second: float  # Over the last chunk
+    resumed: bool  # Continuing a session from an earlier run
+    retries: int = 0  # Failed attempts so far
+
+
+def next_chunk_size(chunk_size: int, sent: int, seconds: float) -> int:
+    """The chunk size that should take UPLOAD_CHUNK_SECONDS at the measured rate.
+
+    Moves at most 2x per chunk, so one slow or fast chunk doesn't swing it.
+    """
+    target = sent / seconds * UPLOAD_CHUNK_SECONDS if seconds > 0 else chunk_size * 2
+    target = min(chunk_size * 2, max(chunk_size / 2, target))
+    aligned = int(target) // UPLOAD_CHUNK_ALIGN * UPLOAD_CHUNK_ALIGN
+    return min(UPLOAD_MAX_CHUNK, max(UPLOAD_MIN_CHUNK, aligned))
+
+
+class UploadSessions:
+    """Resumable upload sessions on disk, so an upload survives a restart.
+
+    One JSON file per upload: the session URI, the bytes the server has
+    confirmed, and the chunk size reached - then, once it completes, the
+    uploaded video, kept until the caller has recorded it. An upload is
+    identified by the video file (path, size, mtime) and its metadata, so
+    an edited file or a changed title starts a fresh session instead of
+    resuming a stale one.
+    """
+
+    def __init__(self, path: Path = DEFAULT_UPLOADS_DIR, ttl: int = UPLOAD_SESSION_TTL):
+        self.path = Path(path)
+        self.ttl = ttl
+
+    def key(self, video_path: Path, body: dict) -> str:
+        stat = video_path.stat()
+        identity = [str(video_path.resolve()), str(stat.st_size), str(stat.st_mtime_ns)]
+        identity.append(json.dumps(body, sort_keys=True))
+        return hashlib.sha256("\0".join(identity).encode()).hexdigest()[:16]
+
+    def load(self, key: str) -> dict | None:
+        """A saved session, unless it's missing, unreadable or too old to resume."""
+        try:
+            session = json.loads((self.path / f"{key}.json").read_text())
+        except (OSError, ValueError):
+            return None
+        if time.time() - session.get("created_at", 0) > self.ttl:
+            self.clear(key)
+            return None
+        return session
+
+    def save(self, key: str, session: dict) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path / f"{key}.tmp"
+        tmp_path.write_text(json.dumps(session))
+        os.replace(tmp_path, self.path / f"{key}.json")
+
+    def clear(self, key: str) -> None:
+        (self.path / f"{key}.json").unlink(missing_ok=True)
+
+
+class YouTubeUploader:
+    """YouTube uploader using OAuth credentials.
+
+    Given a transport, its connections are used as they are and no OAuth
+    flow runs: the transport is responsible for any authorization (the
+    fake API in benchmarks/fake_api.py needs none).
+    """
+
+    def __init__(
+        self,
+        client_secrets_path: Path | None,
+        token_path: Path = DEFAULT_TOKEN_PATH,
+        scheduler: QuotaScheduler | None = None,
+        sessions: UploadSessions | None = None,
+        transport: Callable[[], Any] | None = None,
+    ):
+        self.client_secrets_path = Path(client_secrets_path) if client_secrets_path else None
+        self.token_path = Path(token_path)
+        self.scheduler = scheduler or QuotaScheduler(path=None)
+        self.sessions = sessions or UploadSessions()
+        self.transport = transport
+        self.credentials = None
+
+        if transport is None:
+            if not (self.client_secrets_path and self.client_secrets_path.exists()):
+                raise FileNotFoundError(
+                    f"Client secrets not found: {self.client_secrets_path}\n"
+                    "Download OAuth credentials from Google Cloud Console."
+                )
+            self.credentials = self._get_credentials()
+
+        self._local = threading.local()
+        self.youtube = self._client()
+
+    def _client(self):
+        """Per-thread API client (its httplib2 connection is not thread-safe)."""
+        if not hasattr(self._local, "youtube"):
+            discovery = lazy_import("googleapiclient.discovery")
+            if self.transport is not None:
+                self._local.youtube = discovery.build("youtube", "v3", http=self.transport())
+            else:
+                self._local.youtube = discovery.build(
+                    "youtube", "v3", credentials=self.credentials
+                )
+        return self._local.youtube
+
+    def _get_credentials(self):
+        """Get or refresh OAuth credentials."""
+        oauth2 = lazy_import("google.oauth2.credentials")
+        transport = lazy_import("google.auth.transport.requests")
+        oauth_flow = lazy_import("google_auth_oauthlib.flow")
+        credentials = None
+
+        if self.token_path.exists():
+            credentials = oauth2.Credentials.from_authorized_user_file(
                 str(self.token_path), UPLOAD_SCOPES
             )
 
         if not credentials or not credentials.valid:
             if credentials and credentials.expired and credentials.refresh_token:
-                credentials.refresh(Request())
+                credentials.refresh(transport.Request())
             else:
-                flow = InstalledAppFlow.from_client_secrets_file(
+                flow = oauth_flow.InstalledAppFlow.from_client_secrets_file(
                     str(self.client_secrets_path), UPLOAD_SCOPES
                 )
                 credentials = flow.run_local_server(port=0)
@@ -553,9 +2992,22 @@ class YouTubeUploader:
         category_id: str = "22",  # People & Blogs
         privacy: str = "private",
         thumbnail_path: Path | None = None,
+        on_progress: Callable[[UploadProgress], None] | None = None,
+        on_uploaded: Callable[[dict], None] | None = None,
     ) -> dict:
         """Upload a video to YouTube.
 
+        The upload is resumable and survives restarts: the session URI and
+        the confirmed byte offset are saved after every chunk (see
+        UploadSessions), and uploading the same file again continues where
+        the last attempt stopped. Transient errors are retried with backoff,
+        resuming from the offset the server reports.
+
+        The finished video stays in the session until on_uploaded has
+        returned, so a crash before the caller records it (say, in an
+        UploadQueue) returns the same video next time instead of uploading
+        the file twice.
+
         Args:
             video_path: Path to video file
             title: Video title
@@ -564,6 +3016,9 @@ class YouTubeUploader:
             category_id: YouTube category ID (22 = People & Blogs, 10 = Music)
             privacy: private, unlisted, or public
             thumbnail_path: Optional thumbnail image
+            on_progress: Called with an UploadProgress after each chunk
+            on_uploaded: Called with the result once the video exists,
+                before its session is cleared and the thumbnail is set
 
         Returns:
             Dict with video_id and url
@@ -585,43 +3040,146 @@ class YouTubeUploader:
             },
         }
 
-        media = MediaFileUpload(
-            str(video_path),
-            mimetype="video/mp4",
-            resumable=True,
-            chunksize=1024 * 1024,
-        )
-
         try:
-            request = self.youtube.videos().insert(
-                part="snippet,status",
-                body=body,
-                media_body=media,
-            )
-
-            response = None
-            while response is None:
-                status, response = request.next_chunk()
-                if status:
-                    print(f"Upload progress: {int(status.progress() * 100)}%")
-
+            key = self.sessions.key(video_path, body)
+            response = self._upload_resumable(video_path, body, key, on_progress)
             video_id = response["id"]
-
-            if thumbnail_path:
-                self.set_thumbnail(video_id, thumbnail_path)
-
-            return {
+            result = {
                 "video_id": video_id,
                 "url": f"https://youtube.com/watch?v={video_id}",
                 "title": title,
                 "privacy": privacy,
             }
+            if on_uploaded:
+                on_uploaded(result)
+            self.sessions.clear(key)
+
+            if thumbnail_path:
+                self.set_thumbnail(video_id, thumbnail_path)
+
+            return result
 
         except HttpError as e:
             return {"error": f"Upload failed: {e.reason}"}
         except Exception as e:
             return {"error": f"Upload failed: {str(e)}"}
 
+    def _upload_resumable(
+        self,
+        video_path: Path,
+        body: dict,
+        key: str,
+        on_progress: Callable[[UploadProgress], None] | None,
+    ) -> dict:
+        """Send the file chunk by chunk, saving the session as it goes; returns the video.
+
+        The video is saved in the session too, and the session left for the
+        caller to clear once it has recorded the video.
+        """
+        session = self.sessions.load(key)
+        if session is not None and "video" in session:
+            return session["video"]  # Uploaded before, but never recorded
+        total_bytes = video_path.stat().st_size
+
+        media = lazy_import("googleapiclient.http").MediaFileUpload(
+            str(video_path),
+            mimetype="video/mp4",
+            resumable=True,
+            chunksize=session["chunk_size"] if session else UPLOAD_INITIAL_CHUNK,
+        )
+        request = self._client().videos().insert(
+            part="snippet,status",
+            body=body,
+            media_body=media,
+        )
+
+        resumed = False
+        if session is not None:
+            request.resumable_uri = session["uri"]
+            done = self._sync_offset(request, total_bytes)
+            if done is not None:
+                self.sessions.save(key, {**session, "video": done})
+                return done
+            resumed = request.resumable_uri is not None
+        if not resumed:
+            # Charged once per session - the chunk requests below are one call
+            self.scheduler.reserve("videos.insert")
+            session = {"created_at": time.time()}
+
+        retries = failures = 0
+        response = None
+        while response is None:
+            sent_before = request.resumable_progress
+            started = time.monotonic()
+            try:
+                _, response = request.next_chunk()
+            except Exception as e:
+                if not is_transient_error(e) or failures == self.scheduler.max_retries:
+                    raise
+                # After a failed chunk, next_chunk first asks the server how
+                # much arrived, and carries on from there
+                delay = min(self.scheduler.max_delay, self.scheduler.base_delay * 2**failures)
+                time.sleep(random.uniform(0, delay))
+                retries += 1
+                failures += 1
+                continue
+            failures = 0
+
+            seconds = time.monotonic() - started
+            bytes_sent = total_bytes if response is not None else request.resumable_progress
+            rate = (bytes_sent - sent_before) / seconds if seconds > 0 else 0.0
+            if response is None:
+                # The chunk size is private to MediaFileUpload, but read
+                # afresh for every next_chunk
+                media._chunksize = next_chunk_size(
+                    media.chunksize(), bytes_sent - sent_before, seconds
+                )
+                session.update(
+                    uri=request.resumable_uri, offset=bytes_sent, chunk_size=media.chunksize()
+                )
+                self.sessions.save(key, session)
+            if on_progress:
+                on_progress(
+                    UploadProgress(
+                        video_path=str(video_path),
+                        bytes_sent=bytes_sent,
+                        total_bytes=total_bytes,
+                        chunk_size=media.chunksize(),
+                        bytes_per_second=rate,
+                        resumed=resumed,
+                        retries=retries,
+                    )
+                )
+
+        session["video"] = response
+        self.sessions.save(key, session)
+        return response
+
+    def _sync_offset(self, request: Any, total_bytes: int) -> dict | None:
+        """Ask the server how much of a session it has, and continue from there.
+
+        Returns the uploaded video if the session had already completed.
+        A session the server no longer knows is dropped (resumable_uri is
+        reset), so the next chunk starts a new one.
+        """
+        resp, content = request.http.request(
+            request.resumable_uri,
+            "PUT",
+            headers={"Content-Range": f"bytes */{total_bytes}", "Content-Length": "0"},
+        )
+        if resp.status in (200, 201):
+            return json.loads(content)
+        if resp.status == 308:
+            # Range: bytes=0-N means N + 1 bytes arrived; no Range means none did
+            confirmed = resp.get("range", "")
+            request.resumable_progress = int(confirmed.split("-")[1]) + 1 if confirmed else 0
+            return None
+        if resp.status in (404, 410):
+            request.resumable_uri = None
+            request.resumable_progress = 0
+            return None
+        raise HttpError(resp, content, uri=request.resumable_uri)
+
     def set_thumbnail(self, video_id: str, thumbnail_path: Path) -> dict:
         """Set custom thumbnail for a video."""
         thumbnail_path = Path(thumbnail_path)
@@ -634,17 +3192,866 @@ class YouTubeUploader:
         mimetype = mimetype_map.get(ext, "image/png")
 
         try:
-            media = MediaFileUpload(str(thumbnail_path), mimetype=mimetype)
-            self.youtube.thumbnails().set(
-                videoId=video_id,
-                media_body=media,
-            ).execute()
-            return {"success": True, "video_id": video_id}
+            media = lazy_import("googleapiclient.http").MediaFileUpload(
+                str(thumbnail_path), mimetype=mimetype
+            )
+            request = self._client().thumbnails().set(
+                videoId=video_id,
+                media_body=media,
+            )
+            self.scheduler.run("thumbnails.set", request.execute)
+            return {"success": True, "video_id": video_id}
+
+        except HttpError as e:
+            return {"error": f"Thumbnail failed: {e.reason}"}
+        except Exception as e:
+            return {"error": f"Thumbnail failed: {str(e)}"}
+
+
+# =============================================================================
+# Upload Queue
+# =============================================================================
+
+DEFAULT_PROJECTS_DIR = WORKSPACE_DIR / "projects"
+DEFAULT_UPLOAD_QUEUE_PATH = Path.home() / ".youtube-agent" / "upload_queue.json"
+VIDEO_EXTENSIONS = (".mp4", ".mov", ".m4v", ".mkv", ".webm", ".avi")
+
+
+@dataclass(slots=True)
+class UploadJob:
+    """One project's upload: the metadata scan_projects read, and how far it got."""
+
+    project: str  # Folder name under workspace/projects
+    video_path: str
+    title: str
+    description: str = ""
+    tags: list[str] = field(default_factory=list)
+    category_id: str = "22"
+    privacy: str = "private"
+    thumbnail_path: str | None = None
+    # pending -> uploading -> uploaded (thumbnail still to set) -> done, or failed
+    status: str = "pending"
+    video_id: str | None = None
+    error: str | None = None
+
+
+def scan_projects(projects_dir: Path = DEFAULT_PROJECTS_DIR) -> tuple[list[UploadJob], dict]:
+    """Upload jobs for project folders holding one video file and a metadata.md.
+
+    Each metadata.md is parsed here, once. Returns (jobs, {project: why
+    it was skipped}).
+    """
+    jobs, skipped = [], {}
+    projects = sorted(p for p in Path(projects_dir).iterdir() if p.is_dir())
+    for project in projects:
+        videos = [p for p in project.iterdir() if p.suffix.lower() in VIDEO_EXTENSIONS]
+        metadata_path = project / "metadata.md"
+        if not videos:
+            skipped[project.name] = "no video file"
+            continue
+        if len(videos) > 1:
+            skipped[project.name] = f"{len(videos)} video files, expected one"
+            continue
+        if not metadata_path.exists():
+            skipped[project.name] = "no metadata.md"
+            continue
+
+        metadata = parse_markdown_metadata(metadata_path.read_text())
+        if not metadata.get("title"):
+            skipped[project.name] = "no title in metadata.md"
+            continue
+
+        tags = metadata.get("tags") or []
+        if isinstance(tags, str):
+            tags = [t.strip() for t in tags.split(",")]
+        thumbnail = metadata.get("thumbnail")
+        jobs.append(
+            UploadJob(
+                project=project.name,
+                video_path=str(videos[0].resolve()),
+                title=str(metadata["title"]),
+                description=metadata.get("description") or "",
+                tags=[str(tag) for tag in tags],
+                category_id=str(metadata.get("category", "22")),
+                privacy=metadata.get("privacy", "private"),
+                thumbnail_path=str((project / thumbnail).resolve()) if thumbnail else None,
+            )
+        )
+    return jobs, skipped
+
+
+class UploadQueue:
+    """Upload jobs, saved to a JSON file on every status change.
+
+    A batch that dies part-way picks up where it stopped: done jobs are
+    never uploaded again, an uploaded job only needs its thumbnail, and a
+    job caught mid-upload resumes its upload session (see UploadSessions).
+    """
+
+    def __init__(self, path: Path = DEFAULT_UPLOAD_QUEUE_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        try:
+            saved = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            saved = []
+        self.jobs = {job["video_path"]: UploadJob(**job) for job in saved}
+
+    def add(self, jobs: list[UploadJob]) -> None:
+        """Queue scanned jobs. Jobs not yet started (or failed) take the new
+        metadata; the rest keep theirs, so a half-done upload still resumes."""
+        with self._lock:
+            for job in jobs:
+                queued = self.jobs.get(job.video_path)
+                if queued is None or queued.status in ("pending", "failed"):
+                    self.jobs[job.video_path] = job
+            self._save()
+
+    def unfinished(self) -> list[UploadJob]:
+        with self._lock:
+            return [job for job in self.jobs.values() if job.status != "done"]
+
+    def update(self, job: UploadJob, **changes: Any) -> None:
+        with self._lock:
+            for name, value in changes.items():
+                setattr(job, name, value)
+            self._save()
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps([asdict(job) for job in self.jobs.values()], indent=2))
+        os.replace(tmp_path, self.path)
+
+
+def run_upload_batch(
+    uploader: YouTubeUploader,
+    queue: UploadQueue,
+    max_workers: int = 2,
+    on_event: Callable[[dict], None] | None = None,
+) -> dict:
+    """Upload every unfinished job in the queue, max_workers at a time.
+
+    As each upload finishes its thumbnail is set on a separate pool, so it
+    overlaps with the next upload instead of holding up a worker.
+    on_event gets one dict per step ("started", "progress", "uploaded",
+    "done", "failed"), one at a time.
+    """
+    lock = threading.Lock()
+
+    def emit(event: dict) -> None:
+        if on_event:
+            with lock:
+                on_event(event)
+
+    def set_thumbnail(job: UploadJob) -> None:
+        result = uploader.set_thumbnail(job.video_id, Path(job.thumbnail_path))
+        if "error" in result:
+            queue.update(job, error=result["error"])  # Still "uploaded": retried next run
+            emit({"type": "failed", "project": job.project, "error": result["error"]})
+        else:
+            queue.update(job, status="done", error=None)
+            emit({"type": "done", "project": job.project, "video_id": job.video_id})
+
+    def record(job: UploadJob, result: dict) -> None:
+        # Before the upload session is cleared: see YouTubeUploader.upload
+        status = "uploaded" if job.thumbnail_path else "done"
+        queue.update(job, status=status, video_id=result["video_id"])
+
+    def upload(job: UploadJob) -> None:
+        queue.update(job, status="uploading", error=None)
+        emit({"type": "started", "project": job.project, "title": job.title})
+        result = uploader.upload(
+            video_path=Path(job.video_path),
+            title=job.title,
+            description=job.description,
+            tags=job.tags,
+            category_id=job.category_id,
+            privacy=job.privacy,
+            on_progress=lambda p: emit({"type": "progress", "project": job.project, **asdict(p)}),
+            on_uploaded=lambda result: record(job, result),
+        )
+        if "error" in result:
+            if job.video_id is None:
+                queue.update(job, status="failed", error=result["error"])
+            emit({"type": "failed", "project": job.project, "error": result["error"]})
+            return
+
+        emit({"type": "uploaded", "project": job.project, "url": result["url"]})
+        if job.thumbnail_path:
+            futures.append(thumbnails.submit(set_thumbnail, job))
+        else:
+            emit({"type": "done", "project": job.project, "video_id": job.video_id})
+
+    jobs = queue.unfinished()
+    futures = []
+    # Leaving the block waits for the uploads, then for the thumbnails they queued
+    with (
+        ThreadPoolExecutor(max_workers=max_workers) as thumbnails,
+        ThreadPoolExecutor(max_workers=max_workers) as uploads,
+    ):
+        for job in jobs:
+            if job.status == "uploaded":
+                futures.append(thumbnails.submit(set_thumbnail, job))
+            else:
+                futures.append(uploads.submit(upload, job))
+    for future in futures:
+        future.result()  # Re-raise anything unexpected
+
+    counts = {"done": 0, "uploaded": 0, "failed": 0}
+    for job in jobs:
+        counts[job.status] = counts.get(job.status, 0) + 1
+    return {"total": len(jobs), **counts, "jobs": [asdict(job) for job in jobs]}
+
+
+# =============================================================================
+# Watchlist Scheduler
+# =============================================================================
+
+DEFAULT_WATCH_BUDGET = 5_000  # Units per day: half the default daily quota
+WATCH_MIN_INTERVAL = 3600  # Refresh a channel at most hourly...
+WATCH_MAX_INTERVAL = 86400  # ...and at least daily, if the budget allows
+WATCH_BATCH_WINDOW = 300  # Channels due this soon join the current refresh
+WATCH_RETRY_INTERVAL = 3600  # After an error or a spent quota
+
+
+@dataclass(slots=True)
+class WatchPlan:
+    """How often, and when next, the watcher refreshes one channel."""
+
+    channel: str  # As written in the watchlist
+    channel_id: str | None  # None until the first sync
+    priority: float
+    interval: float  # Seconds between refreshes
+    next_due: float  # Unix time
+    units: float  # Expected quota cost of one refresh
+
+
+class ChannelWatcher:
+    """Keeps a watchlist of channels synced through the day, within a budget.
+
+    Each channel's refresh rate follows its priority - channels that
+    uploaded recently, or often have outliers, are refreshed up to hourly,
+    quiet ones down to daily - scaled so a day of refreshes costs about
+    budget units. A refresh is a sync_channel, except that channels due
+    together share their stats refresh: one 50-ID videos.list call covers
+    videos from several channels.
+
+    The schedule is derived from the channel store (last sync, watermark,
+    stored outliers), so a restarted watcher picks up where it left off.
+    clock and sleep are injectable, to run a schedule on simulated time.
+    """
+
+    def __init__(
+        self,
+        service: YouTubeService,
+        channels: list[str],
+        days_back: int = 30,
+        budget: int = DEFAULT_WATCH_BUDGET,
+        max_results: int = 500,
+        max_workers: int = 8,
+        score: str = "zscore",
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            service: Service with a channel store
+            channels: Channel @handles, URLs, or IDs
+            days_back: Keep stats fresh for videos from the last N days
+            budget: Quota units to spend per 24 hours
+            max_results: Max new videos to list per channel refresh
+            max_workers: Channels listed in parallel
+            score: Outlier score for refreshed videos (see OUTLIER_SCORES)
+            clock: Current Unix time
+            sleep: Wait this many seconds
+        """
+        if service.channels is None:
+            raise ValueError("ChannelWatcher needs a service with a channel store")
+        self.service = service
+        self.channels = list(dict.fromkeys(channels))
+        self.days_back = days_back
+        self.budget = budget
+        self.max_results = max_results
+        self.max_workers = max_workers
+        self.score = score
+        self.clock = clock
+        self.sleep = sleep
+
+        self._spent: list[tuple[float, int]] = []  # (time, units) in the last 24h
+        self._retry_at: dict[str, float] = {}
+
+    def priority(self, state: ChannelState | None, now: float) -> tuple[float, float]:
+        """(priority, expected units per refresh) from a channel's stored history.
+
+        Recency is 1 for an upload today, halving after a quiet week; a
+        channel whose tracked videos are 10% outliers counts double.
+        """
+        if state is None:
+            return 1.0, 1.0  # Never synced: the first sync is due now anyway
+
+        videos = self.service.channels.videos(
+            state.channel_id, sync_cutoff(now, self.days_back).isoformat()
+        )
+        outlier_rate = sum(1 for v in videos if v.is_outlier) / len(videos) if videos else 0.0
+
+        days_quiet = float(self.days_back)
+        if state.watermark_published_at:
+            last_upload = datetime.fromisoformat(state.watermark_published_at).timestamp()
+            days_quiet = max(0.0, (now - last_upload) / 86400)
+
+        recency = 1 / (1 + days_quiet / 7)
+        # One playlistItems page, plus this channel's share of the stats batches
+        return recency * (1 + 10 * outlier_rate), 1 + len(videos) / 50
+
+    def plan(self) -> list[WatchPlan]:
+        """Every channel's refresh interval and next due time, soonest first."""
+        now = self.clock()
+        entries = []
+        for channel in self.channels:
+            key = self.service._parse_channel_input(channel)
+            state = self.service.channels.find(key) if key else None
+            entries.append((channel, state, *self.priority(state, now)))
+
+        # Refreshes per day proportional to priority, scaled to spend the budget,
+        # then held between daily and hourly
+        scale = self.budget / sum(priority * units for _, _, priority, units in entries)
+        per_day = [
+            min(86400 / WATCH_MIN_INTERVAL, max(86400 / WATCH_MAX_INTERVAL, scale * priority))
+            for _, _, priority, _ in entries
+        ]
+        cost = sum(rate * units for rate, (_, _, _, units) in zip(per_day, entries))
+        if cost > self.budget:  # The daily minimum alone is over budget
+            per_day = [rate * self.budget / cost for rate in per_day]
+
+        plans = []
+        for rate, (channel, state, priority, units) in zip(per_day, entries):
+            # Stretched by a stable 0-20% per channel, so equal intervals drift
+            # apart instead of all falling due at the same moment
+            jitter = int(hashlib.sha1(channel.encode()).hexdigest()[:8], 16) / 0xFFFFFFFF
+            interval = 86400 / rate * (1 + 0.2 * jitter)
+
+            next_due = now
+            if state is not None and state.synced_at is not None:
+                next_due = state.synced_at + interval
+            next_due = max(next_due, self._retry_at.get(channel, next_due))
+
+            plans.append(
+                WatchPlan(
+                    channel=channel,
+                    channel_id=state.channel_id if state else None,
+                    priority=round(priority, 3),
+                    interval=round(interval),
+                    next_due=next_due,
+                    units=round(units, 2),
+                )
+            )
+
+        plans.sort(key=lambda p: p.next_due)
+        return plans
+
+    def spent(self, now: float) -> int:
+        """Units spent by this watcher in the last 24 hours."""
+        self._spent = [(t, units) for t, units in self._spent if t > now - 86400]
+        return sum(units for _, units in self._spent)
+
+    def run_once(self) -> tuple[dict | None, float]:
+        """Refresh the channels that are due, within the budget.
+
+        Returns (summary, or None if nothing ran; when to run again).
+        """
+        now = self.clock()
+        plans = self.plan()
+        due = [p for p in plans if p.next_due <= now + WATCH_BATCH_WINDOW]
+        if not due:
+            return None, plans[0].next_due if plans else now + WATCH_MAX_INTERVAL
+
+        spent = self.spent(now)
+        if spent and spent + sum(p.units for p in due) > self.budget:
+            # Wait until enough of the last 24h's spending ages out
+            return None, self._spent[0][0] + 86400
+
+        try:
+            summary = self.refresh(due, now)
+        except (QuotaExceeded, HttpError) as e:
+            for plan in due:
+                self._retry_at[plan.channel] = now + WATCH_RETRY_INTERVAL
+            summary = {"time": now, "channels": 0, "error": str(e)}
+
+        plans = self.plan()
+        return summary, plans[0].next_due if plans else now + WATCH_MAX_INTERVAL
+
+    def refresh(self, due: list[WatchPlan], now: float) -> dict:
+        """Sync several channels, with one shared, batched stats refresh."""
+        channels = self.service.channels
+        published_after = sync_cutoff(now, self.days_back)
+
+        def list_new(plan: WatchPlan) -> tuple[ChannelState | dict, list[str]]:
+            try:
+                state = self.service._channel_state(plan.channel)
+                if isinstance(state, dict):
+                    return state, []
+                return state, self.service._list_new_uploads(
+                    state, published_after, self.max_results
+                )
+            except HttpError as e:
+                return {"error": f"YouTube API error: {e.reason}"}, []
+
+        with self.service._track_quota() as quota:
+            # Channels never synced need resolving: batch that, rather than
+            # one lookup per channel in list_new
+            unsynced = [plan.channel for plan in due if plan.channel_id is None]
+            if unsynced:
+                self.service.resolve_channels(unsynced, max_workers=self.max_workers)
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                listed = [
+                    future.result()
+                    for future in [submit_with_context(pool, list_new, p) for p in due]
+                ]
+
+            errors = {}
+            owners: dict[str, str] = {}  # video_id -> channel_id
+            synced = []
+            for plan, (state, new_ids) in zip(due, listed):
+                if isinstance(state, dict):
+                    errors[plan.channel] = state["error"]
+                    self._retry_at[plan.channel] = now + WATCH_RETRY_INTERVAL
+                    continue
+                self._retry_at.pop(plan.channel, None)
+                synced.append((state, set(new_ids)))
+                tracked = channels.video_ids(state.channel_id, published_after.isoformat())
+                for video_id in new_ids + tracked:
+                    owners.setdefault(video_id, state.channel_id)
+
+            # Stats for every due channel at once: 50 IDs a call, across channels
+            by_channel: dict[str, list[Video]] = {}
+            for video in self.service._fetch_video_details(list(owners)) if owners else []:
+                by_channel.setdefault(owners[video.video_id], []).append(video)
+
+            # Every due channel scored in one grouped pass, each within itself
+            videos = [video for channel_videos in by_channel.values() for video in channel_videos]
+            if videos:
+                groups = [owners[video.video_id] for video in videos]
+                score_outliers(videos, self.score, groups)
+
+            new_videos = 0
+            for state, new_ids in synced:
+                videos = by_channel.get(state.channel_id, [])
+                new_videos += len(self.service._merge_synced(state, new_ids, videos, now))
+
+        self._spent.append((now, quota.units))
+        return {
+            "time": now,
+            "channels": len(synced),
+            "new_videos": new_videos,
+            "videos_refreshed": len(owners),
+            "quota_used": quota.units,
+            "errors": errors,
+        }
+
+    def run(
+        self,
+        until: float | None = None,
+        on_refresh: Callable[[dict], None] | None = None,
+    ) -> None:
+        """Refresh channels as they fall due, until `until` (default: forever)."""
+        while until is None or self.clock() < until:
+            summary, wake_at = self.run_once()
+            if summary and on_refresh:
+                on_refresh(summary)
+
+            now = self.clock()
+            if until is not None:
+                wake_at = min(wake_at, until)
+            if wake_at > now:
+                self.sleep(wake_at - now)
+
+
+# =============================================================================
+# Daemon (JSON-RPC)
+# =============================================================================
+#
+# Each CLI run pays for interpreter start-up, imports, client construction
+# and a TLS handshake. `serve` keeps one warm YouTubeService (and uploader)
+# alive and answers newline-delimited JSON-RPC 2.0 over a Unix socket or
+# stdin/stdout:
+#
+#   -> {"jsonrpc": "2.0", "id": 1, "method": "search_videos", "params": {"query": "AI agents"}}
+#   <- {"jsonrpc": "2.0", "id": 1, "result": {"query": "AI agents", ...}}
+#
+# Research subcommands are thin clients: they connect to the daemon,
+# spawning it on first use, and fall back to running in-process if it
+# can't be reached. YOUTUBE_DAEMON=0 turns this off.
+
+DAEMON_DIR = Path.home() / ".youtube-agent"
+DAEMON_IDLE_TIMEOUT = 600  # Auto-spawned daemons exit after 10 idle minutes
+
+# Environment a daemon must share with its clients (see daemon_socket_path)
+DAEMON_ENV_VARS = (
+    "YOUTUBE_API_KEY",
+    "YOUTUBE_CLIENT_SECRETS",
+    "YOUTUBE_DAILY_QUOTA",
+    "YOUTUBE_MAX_RPS",
+)
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+SERVER_ERROR = -32000
+
+# Callback parameters a daemon call can stream back as notifications
+STREAM_CALLBACKS = ("on_result", "on_progress")
+
+
+class DaemonError(Exception):
+    """A JSON-RPC error response from the daemon."""
+
+
+def daemon_socket_path() -> Path:
+    """Socket for a daemon running this exact code with this environment.
+
+    The path hashes the script's mtime and the relevant environment, so
+    editing youtube.py or switching API keys starts a fresh daemon instead
+    of talking to a stale one (which then exits when idle).
+    """
+    script = Path(__file__).resolve()
+    fingerprint = [str(script), str(script.stat().st_mtime_ns)]
+    fingerprint += [os.environ.get(name, "") for name in DAEMON_ENV_VARS]
+    digest = hashlib.sha256("\0".join(fingerprint).encode()).hexdigest()[:12]
+    return DAEMON_DIR / f"daemon-{digest}.sock"
+
+
+def to_jsonable(value: Any) -> Any:
+    """Dataclasses (results, ChannelInfo params) as plain dicts."""
+    if isinstance(value, dict):
+        return {key: to_jsonable(item) for key, item in value.items()}
+    return asdict(value) if is_dataclass(value) else value
+
+
+def rehydrate(method: str, result: Any) -> Any:
+    """Turn a JSON result back into the dataclass the service method returns."""
+    if not isinstance(result, dict) or "error" in result:
+        return result
+
+    def videos(items: list[dict]) -> list[Video]:
+        return [Video(**item) for item in items]
+
+    if method == "resolve_channel":
+        return ChannelInfo(**result)
+    if method == "resolve_channels":
+        return {
+            channel_input: item if "error" in item else ChannelInfo(**item)
+            for channel_input, item in result.items()
+        }
+    if method == "get_channel_videos":
+        return ChannelVideosResponse(**{**result, "videos": videos(result["videos"])})
+    if method == "sync_channel":
+        return ChannelSyncResponse(**{**result, "videos": videos(result["videos"])})
+    if method == "search_videos":
+        return SearchResponse(**{**result, "videos": videos(result["videos"])})
+    if method == "get_many_channels":
+        return CompareChannelsResponse(
+            **{**result, "top_outliers": videos(result["top_outliers"])}
+        )
+    return result
+
+
+def rehydrate_streamed(method: str, args: list) -> list:
+    """Arguments for a streamed on_result callback, as dataclasses again."""
+    if method == "get_many_channels":
+        channel_input, result = args
+        return [channel_input, rehydrate("get_channel_videos", result)]
+    if method == "search_videos":
+        return [Video(**args[0])]
+    if method == "upload":
+        return [UploadProgress(**args[0])]
+    return args
+
+
+def method_signature(function: Callable) -> inspect.Signature:
+    """The signature of a method as called on an instance (without self)."""
+    signature = inspect.signature(function)
+    return signature.replace(parameters=list(signature.parameters.values())[1:])
+
+
+class YouTubeDaemon:
+    """Serves YouTubeService/YouTubeUploader methods as JSON-RPC.
+
+    Requests are handled concurrently on a shared thread pool, including
+    several in flight on one connection (responses carry the request id,
+    so they may come back out of order). The service, its response cache
+    and its HTTP connections stay warm between requests.
+    """
+
+    def __init__(self, service: YouTubeService, max_workers: int = 16):
+        self.service = service
+        self.pool = ThreadPoolExecutor(max_workers=max_workers)
+        self._uploader: YouTubeUploader | None = None
+        self._lock = threading.Lock()
+        self.active = 0
+        self.last_active = time.monotonic()
+
+        self.methods: dict[str, Callable[..., Any]] = {
+            "ping": lambda: {"pid": os.getpid()},
+            "resolve_channel": service.resolve_channel,
+            "resolve_channels": service.resolve_channels,
+            "get_channel_videos": self._get_channel_videos,
+            "get_many_channels": service.get_many_channels,
+            "sync_channel": service.sync_channel,
+            "search_videos": service.search_videos,
+            "get_transcript": service.get_transcript,
+            "get_transcripts": service.get_transcripts,
+            "upload": lambda **kw: self.uploader().upload(**kw),
+            "set_thumbnail": lambda **kw: self.uploader().set_thumbnail(**kw),
+        }
+        # What each method accepts, to tell bad params from errors raised
+        # inside a call. The wrappers above take **kw: use what they wrap.
+        self.signatures = {name: inspect.signature(m) for name, m in self.methods.items()}
+        self.signatures.update(
+            get_channel_videos=inspect.signature(service.get_channel_videos),
+            upload=method_signature(YouTubeUploader.upload),
+            set_thumbnail=method_signature(YouTubeUploader.set_thumbnail),
+        )
+
+    def uploader(self) -> YouTubeUploader:
+        """The OAuth uploader, created on the first upload request."""
+        with self._lock:
+            if self._uploader is None:
+                client_secrets = os.environ.get("YOUTUBE_CLIENT_SECRETS")
+                if not client_secrets:
+                    raise RuntimeError("YOUTUBE_CLIENT_SECRETS environment variable not set")
+                self._uploader = YouTubeUploader(
+                    Path(client_secrets), scheduler=self.service.scheduler
+                )
+            return self._uploader
+
+    def _get_channel_videos(self, channel_info: dict | None = None, **params: Any):
+        if channel_info is not None:
+            params["channel_info"] = ChannelInfo(**channel_info)
+        return self.service.get_channel_videos(**params)
+
+    def handle(self, request: dict, notify: Callable[[dict], None]) -> dict | None:
+        """Run one request; returns the response (None for notifications)."""
+        request_id = request.get("id")
+        response = self._respond(request_id, request, notify)
+        return response if request_id is not None else None
+
+    def _respond(self, request_id: Any, request: dict, notify: Callable[[dict], None]) -> dict:
+        method = self.methods.get(request.get("method"))
+        params = dict(request.get("params") or {})
+
+        if method is None:
+            message = f"Unknown method: {request.get('method')}"
+            error = {"code": METHOD_NOT_FOUND, "message": message}
+            return {"jsonrpc": "2.0", "id": request_id, "error": error}
+
+        stream = params.pop("stream", False)
+        if stream:
+            # Streamed results (each channel of get_many_channels, each
+            # video of search_videos, upload progress) go out as
+            # notifications tagged with the request id
+            name = stream if stream in STREAM_CALLBACKS else "on_result"
+
+            def callback(*args: Any) -> None:
+                notify({
+                    "jsonrpc": "2.0",
+                    "method": name,
+                    "params": {"id": request_id, "args": [to_jsonable(a) for a in args]},
+                })
+
+            params[name] = callback
+
+        try:
+            self.signatures[request["method"]].bind(**params)
+        except TypeError as e:
+            error = {"code": INVALID_PARAMS, "message": str(e)}
+            return {"jsonrpc": "2.0", "id": request_id, "error": error}
+
+        try:
+            result = method(**params)
+        except Exception as e:
+            error = {"code": SERVER_ERROR, "message": f"{type(e).__name__}: {e}"}
+            return {"jsonrpc": "2.0", "id": request_id, "error": error}
+
+        return {"jsonrpc": "2.0", "id": request_id, "result": to_jsonable(result)}
+
+    def serve_stream(self, rfile, wfile) -> None:
+        """Answer NDJSON requests from rfile until EOF, writing to wfile (both binary)."""
+        write_lock = threading.Lock()
+
+        def write(message: dict) -> None:
+            line = (json.dumps(message, default=str) + "\n").encode()
+            with write_lock:
+                wfile.write(line)
+                wfile.flush()
+
+        def run(request: dict) -> None:
+            try:
+                response = self.handle(request, write)
+                if response is not None:
+                    write(response)
+            finally:
+                with self._lock:
+                    self.active -= 1
+                    self.last_active = time.monotonic()
+
+        futures = []
+        for line in rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                error = {"code": PARSE_ERROR, "message": str(e)}
+                write({"jsonrpc": "2.0", "id": None, "error": error})
+                continue
+            with self._lock:
+                self.active += 1
+            futures.append(self.pool.submit(run, request))
+
+        for future in futures:
+            future.result()
+
+    def idle_for(self) -> float:
+        """Seconds since the last request finished (0 while any is running)."""
+        with self._lock:
+            return 0.0 if self.active else time.monotonic() - self.last_active
+
+
+def serve_socket(daemon: YouTubeDaemon, socket_path: Path, idle_timeout: float | None) -> None:
+    """Serve on a Unix socket until idle_timeout seconds pass with no requests."""
+    import socketserver
+
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if socket_path.exists():
+        if DaemonClient(socket_path).ping():
+            print(f"Daemon already running on {socket_path}", file=sys.stderr)
+            return
+        socket_path.unlink()  # Left behind by a daemon that died
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            daemon.serve_stream(self.rfile, self.wfile)
+
+    server = socketserver.ThreadingUnixStreamServer(str(socket_path), Handler)
+    server.daemon_threads = True
+    os.chmod(socket_path, 0o600)  # Only this user may spend their quota
+
+    def watch_idle() -> None:
+        while True:
+            time.sleep(min(5.0, idle_timeout))
+            if daemon.idle_for() > idle_timeout:
+                server.shutdown()
+                return
+
+    if idle_timeout:
+        threading.Thread(target=watch_idle, daemon=True).start()
+
+    print(f"Serving on {socket_path} (pid {os.getpid()})", file=sys.stderr)
+    try:
+        server.serve_forever(poll_interval=0.5)
+    finally:
+        server.server_close()
+        socket_path.unlink(missing_ok=True)
+
+
+class DaemonClient:
+    """Calls a running daemon as if it were a YouTubeService.
+
+    Any method name becomes an RPC: client.search_videos(query="x")
+    returns a SearchResponse, just like the in-process service. An
+    on_result (or on_progress) callback is streamed back as the daemon
+    produces results.
+    """
+
+    def __init__(self, socket_path: Path, timeout: float | None = None):
+        self.socket_path = Path(socket_path)
+        self.timeout = timeout
+        self._ids = iter(range(1, sys.maxsize))
+
+    def call(self, method: str, **params: Any) -> Any:
+        import socket
+
+        stream, callback = None, None
+        for name in STREAM_CALLBACKS:
+            if params.get(name) is not None:
+                stream, callback = name, params[name]
+            params.pop(name, None)
+        if callback is not None:
+            params["stream"] = stream
+        request_id = next(self._ids)
+        request = {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": method,
+            "params": {k: to_jsonable(v) for k, v in params.items()},
+        }
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            sock.connect(str(self.socket_path))
+            sock.sendall((json.dumps(request, default=str) + "\n").encode())
+            sock.shutdown(socket.SHUT_WR)  # One request per connection
+
+            for line in sock.makefile("rb"):
+                message = json.loads(line)
+                if callback is not None and message.get("method") == stream:
+                    callback(*rehydrate_streamed(method, message["params"]["args"]))
+                elif message.get("id") == request_id:
+                    if "error" in message:
+                        raise DaemonError(message["error"]["message"])
+                    return rehydrate(method, message["result"])
+
+        raise DaemonError(f"Daemon closed the connection during {method}")
+
+    def ping(self) -> bool:
+        """True if a daemon is answering on the socket."""
+        try:
+            return "pid" in DaemonClient(self.socket_path, timeout=1.0).call("ping")
+        except (OSError, ValueError, DaemonError):
+            return False
 
-        except HttpError as e:
-            return {"error": f"Thumbnail failed: {e.reason}"}
-        except Exception as e:
-            return {"error": f"Thumbnail failed: {str(e)}"}
+    def __getattr__(self, method: str) -> Callable[..., Any]:
+        if method.startswith("_"):
+            raise AttributeError(method)
+        return lambda **params: self.call(method, **params)
+
+
+def connect_daemon(start_timeout: float = 5.0) -> DaemonClient | None:
+    """A client for the daemon, spawning it if needed (None if unavailable)."""
+    import socket
+
+    if os.environ.get("YOUTUBE_DAEMON", "1") == "0" or not hasattr(socket, "AF_UNIX"):
+        return None
+
+    client = DaemonClient(daemon_socket_path())
+    if client.ping():
+        return client
+
+    import subprocess
+
+    DAEMON_DIR.mkdir(parents=True, exist_ok=True)
+    with open(DAEMON_DIR / "daemon.log", "ab") as log:
+        subprocess.Popen(
+            [
+                sys.executable, str(Path(__file__).resolve()), "serve",
+                "--socket", str(client.socket_path),
+                "--idle-timeout", str(DAEMON_IDLE_TIMEOUT),
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            start_new_session=True,  # Outlive this CLI run
+        )
+
+    deadline = time.monotonic() + start_timeout
+    while time.monotonic() < deadline:
+        time.sleep(0.05)
+        if client.ping():
+            return client
+    return None
 
 
 # =============================================================================
@@ -668,14 +4075,31 @@ def print_channel_videos(result: ChannelVideosResponse) -> None:
     print(f"Period: Last {result.period_days} days")
     print(f"Videos: {result.total_videos}")
     print(f"Avg Views: {format_number(result.avg_views)}")
+    print(f"Quota Used: {result.quota_used} units")
     print(f"{'=' * 60}\n")
+    print_outlier_videos(result.videos)
 
-    if not result.videos:
+
+def print_channel_sync(result: ChannelSyncResponse) -> None:
+    """Pretty print sync_channel result."""
+    print(f"\n{'=' * 60}")
+    print(f"Channel: {result.channel_name}")
+    print(f"Period: Last {result.period_days} days")
+    print(f"New Videos: {result.new_videos} | Refreshed: {result.refreshed_videos}")
+    print(f"Avg Views: {format_number(result.avg_views)}")
+    print(f"Quota Used: {result.quota_used} units")
+    print(f"{'=' * 60}\n")
+    print_outlier_videos(result.videos)
+
+
+def print_outlier_videos(videos: list[Video]) -> None:
+    """The top 10 videos of a channel result, by outlier score."""
+    if not videos:
         print("No videos found in this period.")
         return
 
     print("Top Videos by Outlier Score:\n")
-    for i, video in enumerate(result.videos[:10], 1):
+    for i, video in enumerate(videos[:10], 1):
         outlier = f"[OUTLIER {video.outlier_score:.1f}x]" if video.is_outlier else ""
         print(f"{i}. {video.title}")
         print(f"   Views: {format_number(video.view_count)} | "
@@ -690,6 +4114,7 @@ def print_search_results(result: SearchResponse) -> None:
     print(f"Search: {result.query}")
     print(f"Results: {result.total_results:,}")
     print(f"Avg Views: {format_number(result.avg_views)}")
+    print(f"Quota Used: {result.quota_used} units")
     print(f"{'=' * 60}\n")
 
     if result.top_channels:
@@ -709,6 +4134,36 @@ def print_search_results(result: SearchResponse) -> None:
         print(f"   {video.url}\n")
 
 
+def print_compare_channels(result: CompareChannelsResponse) -> None:
+    """Pretty print a multi-channel comparison."""
+    print(f"\n{'=' * 60}")
+    print(f"Channels: {len(result.channels)}")
+    print(f"Period: Last {result.period_days} days")
+    print(f"Quota Used: {result.quota_used} units")
+    print(f"{'=' * 60}\n")
+
+    for ch in result.channels:
+        if "error" in ch:
+            print(f"  - {ch['input']}: Error: {ch['error']}")
+        else:
+            print(f"  - {ch['channel_name']} ({ch['total_videos']} videos, "
+                  f"avg {format_number(ch['avg_views'])} views, "
+                  f"{ch['outliers']} outliers)")
+    print()
+
+    if not result.top_outliers:
+        print("No videos found in this period.")
+        return
+
+    print("Top Outliers Across Channels:\n")
+    for i, video in enumerate(result.top_outliers, 1):
+        print(f"{i}. {video.title}")
+        print(f"   Channel: {video.channel_name} | "
+              f"Views: {format_number(video.view_count)} | "
+              f"Score: {video.outlier_score:.2f}")
+        print(f"   {video.url}\n")
+
+
 def print_transcript(result: dict) -> None:
     """Pretty print transcript."""
     if "error" in result:
@@ -723,14 +4178,149 @@ def print_transcript(result: dict) -> None:
     print(result["transcript"])
 
 
+def print_transcript_hits(query: str, hits: list[TranscriptHit]) -> None:
+    """Pretty print transcript search hits."""
+    print(f"\n{'=' * 60}")
+    print(f"Transcript search: {query}")
+    print(f"Hits: {len(hits)}")
+    print(f"{'=' * 60}\n")
+
+    for hit in hits:
+        print(f"{hit.video_id} @ {hit.timestamp}  {hit.url}")
+        print(f"   {hit.snippet}")
+        print()
+
+
+def print_trending(hours: float, results: list[VideoGrowth]) -> None:
+    """Pretty print the fastest-growing stored videos."""
+    print(f"\n{'=' * 60}")
+    print(f"Trending: last {hours:g} hours (from stored snapshots)")
+    print(f"Videos: {len(results)}")
+    print(f"{'=' * 60}\n")
+
+    for i, growth in enumerate(results, 1):
+        accel = (
+            f" | accel: {growth.acceleration:+,.0f}/h²" if growth.acceleration is not None else ""
+        )
+        print(f"{i}. {growth.title}")
+        print(f"   Channel: {growth.channel_name}")
+        print(
+            f"   Views/hour: {format_number(growth.views_per_hour)}{accel} | "
+            f"+{format_number(growth.views_gained)} over {growth.hours_observed:g}h "
+            f"({growth.snapshots} snapshots)"
+        )
+        print(f"   https://www.youtube.com/watch?v={growth.video_id}")
+        print()
+
+
+def print_watch_plan(plans: list[WatchPlan], budget: int) -> None:
+    """Pretty print the watcher's schedule."""
+    per_day = sum(86400 / p.interval * p.units for p in plans)
+    print(f"\n{'=' * 60}")
+    print(f"Watchlist: {len(plans)} channels")
+    print(f"Budget: {budget:,} units/day | Planned: ~{per_day:,.0f} units/day")
+    print(f"{'=' * 60}\n")
+
+    now = time.time()
+    for plan in plans:
+        due = "now" if plan.next_due <= now else f"in {(plan.next_due - now) / 3600:.1f}h"
+        print(
+            f"{plan.channel:<30} priority {plan.priority:>6.3f} | "
+            f"every {plan.interval / 3600:>5.1f}h | next {due}"
+        )
+
+
+def print_watch_refresh(summary: dict) -> None:
+    """One line per watcher refresh."""
+    at = datetime.fromtimestamp(summary["time"]).strftime("%Y-%m-%d %H:%M")
+    if "error" in summary:
+        print(f"[{at}] Error: {summary['error']}", flush=True)
+        return
+    print(
+        f"[{at}] Synced {summary['channels']} channels: "
+        f"{summary['new_videos']} new videos, {summary['videos_refreshed']} refreshed, "
+        f"{summary['quota_used']} units",
+        flush=True,
+    )
+    for channel, error in summary["errors"].items():
+        print(f"  {channel}: {error}", flush=True)
+
+
+def print_transcripts(result: dict) -> None:
+    """Pretty print a transcript harvest summary."""
+    print(f"\n{'=' * 60}")
+    print(f"Transcripts: {result['total']} videos")
+    print(f"Fetched: {result['fetched']} | Already stored: {result['stored']}")
+    print(f"Unavailable: {result['unavailable']} | Failed: {result['failed']}")
+    print(f"{'=' * 60}\n")
+
+    for item in result["results"]:
+        if item["status"] in ("unavailable", "failed"):
+            print(f"  {item['video_id']}: {item['status']} - {item['error']}")
+
+
+def print_upload_progress(progress: UploadProgress) -> None:
+    """One line per chunk, on stderr (stdout is for the result)."""
+    percent = progress.bytes_sent / progress.total_bytes * 100 if progress.total_bytes else 100
+    notes = [f"{progress.bytes_per_second / 1e6:.1f} MB/s"]
+    if progress.resumed:
+        notes.append("resumed")
+    if progress.retries:
+        notes.append(f"{progress.retries} {'retry' if progress.retries == 1 else 'retries'}")
+    print(
+        f"Upload progress: {percent:.0f}% "
+        f"({progress.bytes_sent / 1e6:.0f}/{progress.total_bytes / 1e6:.0f} MB, "
+        f"{', '.join(notes)})",
+        file=sys.stderr,
+    )
+
+
+def print_upload_queue(jobs: list[UploadJob], skipped: dict) -> None:
+    """Print what upload_batch would do."""
+    if not jobs:
+        print("Nothing to upload.")
+    for job in jobs:
+        note = f" - {job.error}" if job.error else ""
+        print(f"{job.project}: {job.status}{note}")
+        print(f"   {job.title} ({job.privacy})")
+    for project, reason in skipped.items():
+        print(f"{project}: skipped ({reason})")
+
+
+def print_upload_event(event: dict) -> None:
+    """One line per upload_batch step (chunks take ~10 s, so progress lines are sparse)."""
+    project = event["project"]
+    if event["type"] == "started":
+        print(f"{project}: uploading \"{event['title']}\"")
+    elif event["type"] == "progress":
+        percent = event["bytes_sent"] * 100 // max(event["total_bytes"], 1)
+        print(f"{project}: {percent}% ({event['bytes_per_second'] / 1e6:.1f} MB/s)")
+    elif event["type"] == "uploaded":
+        print(f"{project}: uploaded {event['url']}")
+    elif event["type"] == "done":
+        print(f"{project}: done")
+    elif event["type"] == "failed":
+        print(f"{project}: failed - {event['error']}")
+
+
 # =============================================================================
 # CLI Commands
 # =============================================================================
 
 
+def export_videos(path: str, table: VideoTable) -> None:
+    """Write videos for --output, reporting on stderr (stdout is the command's)."""
+    try:
+        count = table.write(Path(path))
+    except (ImportError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"Wrote {count} videos to {path}", file=sys.stderr)
+
+
 def cmd_get_channel_videos(args: argparse.Namespace, service: YouTubeService) -> None:
     """Handle get_channel_videos command."""
-    channel_info = service.resolve_channel(args.handle)
+    channel_info = service.resolve_channel(channel_input=args.handle)
     if isinstance(channel_info, dict) and "error" in channel_info:
         if args.json:
             print(json.dumps(channel_info, indent=2))
@@ -742,6 +4332,8 @@ def cmd_get_channel_videos(args: argparse.Namespace, service: YouTubeService) ->
         channel_id=channel_info.channel_id,
         days_back=args.days,
         max_results=args.max,
+        channel_info=channel_info,
+        score=args.score,
     )
 
     if isinstance(result, dict) and "error" in result:
@@ -751,19 +4343,53 @@ def cmd_get_channel_videos(args: argparse.Namespace, service: YouTubeService) ->
             print(f"Error: {result['error']}")
         sys.exit(1)
 
+    if args.output:
+        export_videos(args.output, VideoTable.from_videos(result.videos))
     if args.json:
         print(json.dumps(asdict(result), indent=2, default=str))
     else:
         print_channel_videos(result)
 
 
+def cmd_sync_channel(args: argparse.Namespace, service: YouTubeService) -> None:
+    """Handle sync_channel command."""
+    result = service.sync_channel(
+        channel_input=args.handle, days_back=args.days, max_results=args.max, score=args.score
+    )
+
+    if isinstance(result, dict) and "error" in result:
+        if args.json:
+            print(json.dumps(result, indent=2))
+        else:
+            print(f"Error: {result['error']}")
+        sys.exit(1)
+
+    if args.output:
+        export_videos(args.output, VideoTable.from_videos(result.videos))
+    if args.json:
+        print(json.dumps(asdict(result), indent=2, default=str))
+    else:
+        print_channel_sync(result)
+
+
 def cmd_search_videos(args: argparse.Namespace, service: YouTubeService) -> None:
     """Handle search_videos command."""
+    table = VideoTable() if args.output else None
+    dumps = json.JSONEncoder(separators=(",", ":"), default=str).encode
+
+    def on_result(video: Video) -> None:
+        if table is not None:
+            table.append(video)
+        if args.ndjson:
+            # Stream each video as soon as its page arrives
+            print(dumps({"type": "video", **video_record(video)}), flush=True)
+
     result = service.search_videos(
         query=args.query,
         max_results=args.max,
         days_back=args.days,
         order_by=args.order,
+        on_result=on_result if args.ndjson or table is not None else None,
     )
 
     if isinstance(result, dict) and "error" in result:
@@ -773,15 +4399,118 @@ def cmd_search_videos(args: argparse.Namespace, service: YouTubeService) -> None
             print(f"Error: {result['error']}")
         sys.exit(1)
 
-    if args.json:
+    if table is not None:
+        export_videos(args.output, table)
+    if args.ndjson:
+        summary = {k: v for k, v in asdict(result).items() if k != "videos"}
+        print(json.dumps({"type": "summary", **summary}, default=str))
+    elif args.json:
         print(json.dumps(asdict(result), indent=2, default=str))
     else:
         print_search_results(result)
 
 
+def channel_inputs_from_args(args: argparse.Namespace) -> list[str]:
+    """The handles given, then those in --file, each once; exits if there are none."""
+    channel_inputs = list(args.handles)
+    if args.file:
+        try:
+            channel_inputs += read_channel_file(args.file)
+        except OSError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    if not channel_inputs:
+        print("Error: provide channel handles or --file", file=sys.stderr)
+        sys.exit(1)
+    return list(dict.fromkeys(channel_inputs))
+
+
+def cmd_compare_channels(args: argparse.Namespace, service: YouTubeService) -> None:
+    """Handle compare_channels command."""
+    channel_inputs = channel_inputs_from_args(args)
+
+    table = VideoTable() if args.output else None
+
+    def on_result(channel_input: str, result: ChannelVideosResponse | dict) -> None:
+        if table is not None and not isinstance(result, dict):
+            for video in result.videos:
+                table.append(video)
+        if args.ndjson:
+            # Stream each channel as soon as it finishes
+            data = result if isinstance(result, dict) else asdict(result)
+            line = {"type": "channel", "input": channel_input, **data}
+            print(json.dumps(line, default=str), flush=True)
+
+    result = service.get_many_channels(
+        channel_inputs=channel_inputs,
+        days_back=args.days,
+        max_results=args.max,
+        max_workers=args.workers,
+        quota_budget=args.quota_budget,
+        top_n=args.top,
+        on_result=on_result if args.ndjson or table is not None else None,
+        score=args.score,
+    )
+
+    if table is not None:
+        export_videos(args.output, table)
+    if args.ndjson:
+        print(json.dumps({"type": "summary", **asdict(result)}, default=str))
+    elif args.json:
+        print(json.dumps(asdict(result), indent=2, default=str))
+    else:
+        print_compare_channels(result)
+
+
+def cmd_watch(args: argparse.Namespace, service: YouTubeService) -> None:
+    """Handle watch command."""
+    channel_inputs = channel_inputs_from_args(args)
+
+    watcher = ChannelWatcher(
+        service,
+        channel_inputs,
+        days_back=args.days,
+        budget=args.budget,
+        max_workers=args.workers,
+        score=args.score,
+    )
+
+    if args.plan:
+        plans = watcher.plan()
+        if args.json:
+            print(json.dumps([asdict(p) for p in plans], indent=2))
+        else:
+            print_watch_plan(plans, args.budget)
+        return
+
+    def on_refresh(summary: dict) -> None:
+        if args.json:
+            print(json.dumps(summary, default=str), flush=True)
+        else:
+            print_watch_refresh(summary)
+
+    if args.once:
+        summary, _ = watcher.run_once()
+        if summary:
+            on_refresh(summary)
+        return
+
+    try:
+        watcher.run(on_refresh=on_refresh)
+    except KeyboardInterrupt:
+        pass
+
+
 def cmd_get_transcript(args: argparse.Namespace, service: YouTubeService) -> None:
     """Handle get_transcript command."""
-    result = service.get_transcript(args.video_id, max_chars=args.max_chars)
+    result = service.get_transcript(
+        video_id=args.video_id,
+        max_chars=args.max_chars,
+        start=args.start,
+        end=args.end,
+        refresh=args.refresh,
+    )
 
     if args.json:
         print(json.dumps(result, indent=2))
@@ -792,6 +4521,120 @@ def cmd_get_transcript(args: argparse.Namespace, service: YouTubeService) -> Non
         sys.exit(1)
 
 
+def cmd_get_transcripts(args: argparse.Namespace, service: YouTubeService) -> None:
+    """Handle get_transcripts command."""
+    video_ids = list(args.video_ids)
+    if args.file:
+        try:
+            with open(args.file) as f:
+                for line in f:
+                    line = line.split("#", 1)[0].strip()
+                    if line:
+                        video_ids.append(line)
+        except OSError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    if not video_ids:
+        print("Error: provide video IDs or --file", file=sys.stderr)
+        sys.exit(1)
+
+    on_result = None
+    if args.ndjson:
+        # Stream each video's outcome as it finishes
+        def on_result(result: dict) -> None:
+            print(json.dumps({"type": "video", **result}), flush=True)
+
+    result = service.get_transcripts(
+        video_ids=video_ids,
+        max_workers=args.workers,
+        delay=args.delay,
+        refresh=args.refresh,
+        on_result=on_result,
+    )
+
+    if args.ndjson:
+        summary = {k: v for k, v in result.items() if k != "results"}
+        print(json.dumps({"type": "summary", **summary}))
+    elif args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print_transcripts(result)
+
+
+def cmd_search_transcripts(args: argparse.Namespace) -> None:
+    """Handle search_transcripts command."""
+    try:
+        hits = TranscriptStore().search(args.query, limit=args.limit, phrase=args.phrase)
+    except ValueError as e:
+        if args.json:
+            print(json.dumps({"error": str(e)}, indent=2))
+        else:
+            print(f"Error: {e}")
+        sys.exit(1)
+
+    if args.json:
+        result = {"query": args.query, "hits": [asdict(hit) for hit in hits]}
+        print(json.dumps(result, indent=2))
+    else:
+        print_transcript_hits(args.query, hits)
+
+
+def cmd_trending(args: argparse.Namespace) -> None:
+    """Handle trending command."""
+    results = SnapshotStore().growth(args.hours)
+    key = "acceleration" if args.by == "acceleration" else "views_per_hour"
+    results = [r for r in results if getattr(r, key) is not None]
+    results.sort(key=lambda r: getattr(r, key), reverse=True)
+    results = results[: args.limit]
+
+    if args.json:
+        result = {"hours": args.hours, "videos": [asdict(r) for r in results]}
+        print(json.dumps(result, indent=2))
+    else:
+        print_trending(args.hours, results)
+
+
+def cmd_quota(args: argparse.Namespace) -> None:
+    """Handle quota command."""
+    scheduler = scheduler_from_env()
+    used = scheduler.used()
+    result = {
+        "date": QuotaScheduler._today(),
+        "used": used,
+        "remaining": max(0, scheduler.units_per_day - used),
+        "units_per_day": scheduler.units_per_day,
+    }
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"Quota for {result['date']} (Pacific Time)")
+        print(f"Used: {used:,} / {scheduler.units_per_day:,} units")
+        print(f"Remaining: {result['remaining']:,} units")
+
+
+def cmd_serve(args: argparse.Namespace) -> None:
+    """Handle serve command."""
+    cache = None if args.no_cache else ResponseCache()
+    service = YouTubeService(
+        os.environ.get("YOUTUBE_API_KEY"),
+        cache=cache,
+        scheduler=scheduler_from_env(),
+        transcripts=TranscriptStore(),
+        snapshots=SnapshotStore(),
+        channels=ChannelStore(),
+        index=ChannelIndex(),
+    )
+    daemon = YouTubeDaemon(service, max_workers=args.workers)
+
+    if args.stdio:
+        daemon.serve_stream(sys.stdin.buffer, sys.stdout.buffer)
+    else:
+        socket_path = Path(args.socket) if args.socket else daemon_socket_path()
+        serve_socket(daemon, socket_path, idle_timeout=args.idle_timeout)
+
+
 def cmd_upload(args: argparse.Namespace) -> None:
     """Handle upload command."""
     client_secrets = os.environ.get("YOUTUBE_CLIENT_SECRETS")
@@ -800,11 +4643,18 @@ def cmd_upload(args: argparse.Namespace) -> None:
         print("Set it to the path of your OAuth client_secrets.json file", file=sys.stderr)
         sys.exit(1)
 
-    try:
-        uploader = YouTubeUploader(Path(client_secrets))
-    except FileNotFoundError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+    # The daemon can only upload once authorized - the first OAuth flow
+    # opens a browser, so it has to run here
+    uploader = None
+    if Path(client_secrets).exists() and DEFAULT_TOKEN_PATH.exists():
+        uploader = connect_daemon()
+
+    if uploader is None:
+        try:
+            uploader = YouTubeUploader(Path(client_secrets), scheduler=scheduler_from_env())
+        except FileNotFoundError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
 
     # Load from metadata file if provided
     if args.metadata:
@@ -820,7 +4670,7 @@ def cmd_upload(args: argparse.Namespace) -> None:
         if metadata_path.suffix.lower() == ".md":
             metadata = parse_markdown_metadata(content)
         else:
-            metadata = yaml.safe_load(content) or {}
+            metadata = lazy_import("yaml").safe_load(content) or {}
 
         title = metadata.get("title", args.title)
         description = metadata.get("description", args.description or "")
@@ -845,13 +4695,14 @@ def cmd_upload(args: argparse.Namespace) -> None:
         sys.exit(1)
 
     result = uploader.upload(
-        video_path=Path(args.video),
+        video_path=Path(args.video).resolve(),  # The daemon has its own cwd
         title=title,
         description=description,
         tags=tags,
         category_id=category_id,
         privacy=privacy,
-        thumbnail_path=thumbnail_path,
+        thumbnail_path=thumbnail_path.resolve() if thumbnail_path else None,
+        on_progress=print_upload_progress,
     )
 
     if args.json:
@@ -865,11 +4716,112 @@ def cmd_upload(args: argparse.Namespace) -> None:
         print(f"Privacy: {result['privacy']}")
 
 
+def cmd_upload_batch(args: argparse.Namespace) -> None:
+    """Handle upload_batch command."""
+    projects_dir = Path(args.projects)
+    if not projects_dir.is_dir():
+        print(f"Error: Projects folder not found: {projects_dir}", file=sys.stderr)
+        sys.exit(1)
+
+    jobs, skipped = scan_projects(projects_dir)
+    queue = UploadQueue()
+    queue.add(jobs)
+
+    if args.dry_run:
+        if args.json:
+            unfinished = [asdict(job) for job in queue.unfinished()]
+            print(json.dumps({"queued": unfinished, "skipped": skipped}, indent=2))
+        else:
+            print_upload_queue(queue.unfinished(), skipped)
+        return
+
+    client_secrets = os.environ.get("YOUTUBE_CLIENT_SECRETS")
+    if not client_secrets:
+        print("Error: YOUTUBE_CLIENT_SECRETS environment variable not set", file=sys.stderr)
+        sys.exit(1)
+    try:
+        uploader = YouTubeUploader(Path(client_secrets), scheduler=scheduler_from_env())
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    def on_event(event: dict) -> None:
+        if args.json:
+            print(json.dumps(event, default=str), flush=True)
+        else:
+            print_upload_event(event)
+
+    result = run_upload_batch(uploader, queue, max_workers=args.workers, on_event=on_event)
+
+    summary = {k: v for k, v in result.items() if k != "jobs"}
+    if args.json:
+        print(json.dumps({"type": "summary", **summary}))
+    else:
+        print(
+            f"\n{result['done']} of {result['total']} done, "
+            f"{result['uploaded']} waiting on a thumbnail, {result['failed']} failed"
+        )
+    if result["failed"]:
+        sys.exit(1)
+
+
 # =============================================================================
 # Main
 # =============================================================================
 
 
+def add_cache_args(parser: argparse.ArgumentParser) -> None:
+    """Add response cache flags to a research subcommand."""
+    parser.add_argument(
+        "--offline", action="store_true", help="Serve only from the local cache"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Bypass the local response cache"
+    )
+
+
+def add_score_arg(parser: argparse.ArgumentParser) -> None:
+    """Add the outlier score choice to a channel analysis subcommand."""
+    parser.add_argument(
+        "--score",
+        choices=OUTLIER_SCORES,
+        default="zscore",
+        help="Outlier score: z-score of views, or robust (median/MAD of log views, age-adjusted)",
+    )
+
+
+def add_output_arg(parser: argparse.ArgumentParser) -> None:
+    """Add the video export flag to a research subcommand."""
+    parser.add_argument(
+        "--output",
+        metavar="PATH",
+        help="Also write the videos to a .parquet, .arrow or .ndjson file",
+    )
+
+
+def print_timing(parsed_at: float) -> None:
+    """Print where the run's time went (for --timing), on stderr."""
+    finished_at = time.perf_counter()
+    print(
+        f"Timing: startup {(parsed_at - STARTED_AT) * 1000:.1f} ms, "
+        f"command {(finished_at - parsed_at) * 1000:.1f} ms, "
+        f"total {(finished_at - STARTED_AT) * 1000:.1f} ms",
+        file=sys.stderr,
+    )
+    for module, seconds in IMPORT_TIMES.items():
+        print(f"  import {module}: {seconds * 1000:.1f} ms", file=sys.stderr)
+
+
+def scheduler_from_env() -> QuotaScheduler:
+    """The shared quota scheduler, with limits from the environment."""
+    return QuotaScheduler(
+        units_per_day=int(os.environ.get("YOUTUBE_DAILY_QUOTA", DEFAULT_DAILY_QUOTA)),
+        requests_per_second=float(
+            os.environ.get("YOUTUBE_MAX_RPS", DEFAULT_REQUESTS_PER_SECOND)
+        ),
+    )
+
+
 def main() -> None:
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -878,12 +4830,20 @@ def main() -> None:
         epilog="""
 Examples:
     uv run youtube.py get_channel_videos @mkbhd --days 30
+    uv run youtube.py sync_channel @mkbhd --days 30
+    uv run youtube.py watch --file watchlist.txt --budget 5000
+    uv run youtube.py compare_channels @mkbhd @LinusTechTips --days 90 --ndjson
     uv run youtube.py search_videos "AI agents" --max 20 --order view_count
     uv run youtube.py get_transcript dQw4w9WgXcQ
+    uv run youtube.py trending --hours 48 --by acceleration
     uv run youtube.py upload video.mp4 --title "My Video" --privacy unlisted
+    uv run youtube.py upload_batch --dry-run
+    uv run youtube.py quota
         """,
     )
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    timing_help = "Report startup, import and command time on stderr"
+    parser.add_argument("--timing", action="store_true", help=timing_help)
 
     subparsers = parser.add_subparsers(dest="command", required=True)
 
@@ -896,11 +4856,66 @@ Examples:
     p_channel.add_argument("--days", type=int, default=30, help="Days to look back")
     p_channel.add_argument("--max", type=int, default=50, help="Max videos to fetch")
     p_channel.add_argument("--json", action="store_true", help="Output as JSON")
+    add_score_arg(p_channel)
+    add_output_arg(p_channel)
+    add_cache_args(p_channel)
+
+    # sync_channel
+    p_sync = subparsers.add_parser(
+        "sync_channel",
+        help="Fetch only new uploads since the last sync and refresh stats",
+    )
+    p_sync.add_argument("handle", help="Channel @handle, URL, or ID")
+    p_sync.add_argument("--days", type=int, default=30, help="Days of videos to track")
+    p_sync.add_argument("--max", type=int, default=500, help="Max new videos to list")
+    p_sync.add_argument("--json", action="store_true", help="Output as JSON")
+    add_score_arg(p_sync)
+    add_output_arg(p_sync)
+    add_cache_args(p_sync)
+
+    # watch
+    p_watch = subparsers.add_parser(
+        "watch",
+        help="Keep a watchlist of channels synced, spreading refreshes over the day",
+    )
+    p_watch.add_argument("handles", nargs="*", help="Channel @handles, URLs, or IDs")
+    p_watch.add_argument("--file", help="Watchlist file with one channel per line")
+    p_watch.add_argument("--days", type=int, default=30, help="Days of videos to track")
+    p_watch.add_argument(
+        "--budget", type=int, default=DEFAULT_WATCH_BUDGET, help="Quota units per day"
+    )
+    p_watch.add_argument("--workers", type=int, default=8, help="Channels in parallel")
+    p_watch.add_argument("--once", action="store_true", help="Refresh what's due, then exit")
+    p_watch.add_argument("--plan", action="store_true", help="Show the schedule, no API calls")
+    p_watch.add_argument("--json", action="store_true", help="Output as JSON (lines)")
+    add_score_arg(p_watch)
+
+    # compare_channels
+    p_compare = subparsers.add_parser(
+        "compare_channels",
+        help="Analyze many channels in parallel and rank outliers across them",
+    )
+    p_compare.add_argument("handles", nargs="*", help="Channel @handles, URLs, or IDs")
+    p_compare.add_argument("--file", help="File with one channel per line")
+    p_compare.add_argument("--days", type=int, default=30, help="Days to look back")
+    p_compare.add_argument("--max", type=int, default=50, help="Max videos per channel")
+    p_compare.add_argument("--workers", type=int, default=8, help="Channels in parallel")
+    p_compare.add_argument(
+        "--quota-budget", type=int, default=None, help="Stop after N quota units"
+    )
+    p_compare.add_argument("--top", type=int, default=20, help="Outliers to rank")
+    p_compare.add_argument("--ndjson", action="store_true", help="Stream NDJSON")
+    p_compare.add_argument("--json", action="store_true", help="Output as JSON")
+    add_score_arg(p_compare)
+    add_output_arg(p_compare)
+    add_cache_args(p_compare)
 
     # search_videos
     p_search = subparsers.add_parser("search_videos", help="Search YouTube videos")
     p_search.add_argument("query", help="Search query")
-    p_search.add_argument("--max", type=int, default=25, help="Max results")
+    p_search.add_argument(
+        "--max", type=int, default=25, help="Max results (100 quota units per 50)"
+    )
     p_search.add_argument("--days", type=int, default=None, help="Filter by days")
     p_search.add_argument(
         "--order",
@@ -908,7 +4923,10 @@ Examples:
         default="relevance",
         help="Sort order",
     )
+    p_search.add_argument("--ndjson", action="store_true", help="Stream NDJSON")
     p_search.add_argument("--json", action="store_true", help="Output as JSON")
+    add_output_arg(p_search)
+    add_cache_args(p_search)
 
     # get_transcript
     p_transcript = subparsers.add_parser(
@@ -918,8 +4936,54 @@ Examples:
     p_transcript.add_argument(
         "--max-chars", type=int, default=5000, help="Max transcript chars"
     )
+    p_transcript.add_argument("--start", type=float, default=None, help="From N seconds")
+    p_transcript.add_argument("--end", type=float, default=None, help="Until N seconds")
+    p_transcript.add_argument(
+        "--refresh", action="store_true", help="Download again even if stored"
+    )
     p_transcript.add_argument("--json", action="store_true", help="Output as JSON")
 
+    # get_transcripts
+    p_transcripts = subparsers.add_parser(
+        "get_transcripts", help="Download many transcripts into workspace/transcripts"
+    )
+    p_transcripts.add_argument("video_ids", nargs="*", help="YouTube video IDs")
+    p_transcripts.add_argument("--file", help="File with one video ID per line")
+    p_transcripts.add_argument("--workers", type=int, default=4, help="Parallel downloads")
+    p_transcripts.add_argument(
+        "--delay", type=float, default=0.5, help="Min seconds between download starts"
+    )
+    p_transcripts.add_argument(
+        "--refresh", action="store_true", help="Download again even if stored"
+    )
+    p_transcripts.add_argument("--ndjson", action="store_true", help="Stream NDJSON")
+    p_transcripts.add_argument("--json", action="store_true", help="Output as JSON")
+
+    # search_transcripts
+    p_search_tr = subparsers.add_parser(
+        "search_transcripts", help="Full-text search over stored transcripts"
+    )
+    p_search_tr.add_argument(
+        "query", help='Words, "exact phrases", OR, NOT, prefix* (FTS5 syntax)'
+    )
+    p_search_tr.add_argument("--phrase", action="store_true", help="Match the query as one phrase")
+    p_search_tr.add_argument("--limit", type=int, default=20, help="Max hits")
+    p_search_tr.add_argument("--json", action="store_true", help="Output as JSON")
+
+    # trending
+    p_trending = subparsers.add_parser(
+        "trending", help="Fastest-growing videos, from stored snapshots (no API calls)"
+    )
+    p_trending.add_argument("--hours", type=float, default=48, help="Window to measure")
+    p_trending.add_argument(
+        "--by",
+        choices=["velocity", "acceleration"],
+        default="velocity",
+        help="Rank by views/hour or by its change",
+    )
+    p_trending.add_argument("--limit", type=int, default=20, help="Max videos")
+    p_trending.add_argument("--json", action="store_true", help="Output as JSON")
+
     # upload
     p_upload = subparsers.add_parser("upload", help="Upload a video to YouTube")
     p_upload.add_argument("video", help="Path to video file")
@@ -937,26 +5001,117 @@ Examples:
     p_upload.add_argument("--thumbnail", help="Path to thumbnail image")
     p_upload.add_argument("--json", action="store_true", help="Output as JSON")
 
+    # upload_batch
+    p_batch = subparsers.add_parser(
+        "upload_batch",
+        help="Upload every project in workspace/projects (video + metadata.md), resumably",
+    )
+    p_batch.add_argument(
+        "--projects", default=str(DEFAULT_PROJECTS_DIR), help="Folder of project folders"
+    )
+    p_batch.add_argument("--workers", type=int, default=2, help="Uploads in parallel")
+    p_batch.add_argument(
+        "--dry-run", action="store_true", help="Show the queue without uploading"
+    )
+    p_batch.add_argument("--json", action="store_true", help="Output as JSON (lines)")
+
+    # quota
+    p_quota = subparsers.add_parser("quota", help="Show today's API quota usage")
+    p_quota.add_argument("--json", action="store_true", help="Output as JSON")
+
+    # serve
+    p_serve = subparsers.add_parser(
+        "serve", help="Run a warm JSON-RPC server (Unix socket or stdio)"
+    )
+    p_serve.add_argument("--stdio", action="store_true", help="Serve on stdin/stdout")
+    p_serve.add_argument("--socket", help="Unix socket path (default: per-version path)")
+    p_serve.add_argument(
+        "--idle-timeout", type=float, default=None, help="Exit after N idle seconds"
+    )
+    p_serve.add_argument("--workers", type=int, default=16, help="Concurrent requests")
+    p_serve.add_argument(
+        "--no-cache", action="store_true", help="Bypass the local response cache"
+    )
+
+    for subparser in subparsers.choices.values():
+        # SUPPRESS so a subcommand's default doesn't clobber a top-level --timing
+        subparser.add_argument(
+            "--timing", action="store_true", default=argparse.SUPPRESS, help=timing_help
+        )
+
     args = parser.parse_args()
+    parsed_at = time.perf_counter()
+
+    try:
+        run_command(args, parser)
+    finally:
+        if getattr(args, "timing", False):
+            print_timing(parsed_at)
 
+
+def run_command(args: argparse.Namespace, parser: argparse.ArgumentParser) -> None:
+    """Set up what the subcommand needs and run it."""
     # Upload command uses OAuth, not API key
     if args.command == "upload":
         cmd_upload(args)
         return
 
-    # Research commands use API key
+    if args.command == "upload_batch":
+        cmd_upload_batch(args)
+        return
+
+    if args.command == "quota":
+        cmd_quota(args)
+        return
+
+    # Local only - no API key, no daemon
+    if args.command == "search_transcripts":
+        cmd_search_transcripts(args)
+        return
+
+    if args.command == "trending":
+        cmd_trending(args)
+        return
+
+    if args.command == "serve":
+        cmd_serve(args)
+        return
+
+    # Research commands use API key (offline mode only reads the cache)
+    offline = getattr(args, "offline", False)
+    no_cache = getattr(args, "no_cache", False)
     api_key = os.environ.get("YOUTUBE_API_KEY")
-    if not api_key:
+    if not api_key and not offline and not getattr(args, "plan", False):
         print("Error: YOUTUBE_API_KEY environment variable not set", file=sys.stderr)
         sys.exit(1)
 
-    service = YouTubeService(api_key)
+    # The warm daemon when possible; cache flags need this process's own service,
+    # and the watcher drives the service's sync steps directly
+    service = None
+    if not offline and not no_cache and args.command != "watch":
+        service = connect_daemon()
+
+    if service is None:
+        cache = None if no_cache else ResponseCache(offline=offline)
+        service = YouTubeService(
+            api_key,
+            cache=cache,
+            scheduler=scheduler_from_env(),
+            transcripts=TranscriptStore(),
+            snapshots=SnapshotStore(),
+            channels=ChannelStore(),
+            index=ChannelIndex(),
+        )
 
     # Dispatch to command handler
     commands = {
         "get_channel_videos": cmd_get_channel_videos,
+        "sync_channel": cmd_sync_channel,
+        "watch": cmd_watch,
+        "compare_channels": cmd_compare_channels,
         "search_videos": cmd_search_videos,
         "get_transcript": cmd_get_transcript,
+        "get_transcripts": cmd_get_transcripts,
     }
 
     handler = commands.get(args.command)